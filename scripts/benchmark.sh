@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+set -e
+set -x
+
+# Runs the orchestration overhead benchmarks and stores the results, so that
+# later runs can be compared against them. Fails if the mean time of any
+# benchmark regressed by more than 15% compared to the baseline.
+#
+# Usage:
+#   scripts/benchmark.sh [scale] [test deployment] [extra pytest args]
+#
+# Scales are `small` (default), `medium` and `large`. The first run only
+# records the baseline, as there are no saved results to compare against yet.
+# The benchmarks run against the local SQLite database by default. To
+# benchmark MySQL or a ZenML server, pass the `client-mysql` or `local-server`
+# deployment.
+SCALE=${1:-"small"}
+TEST_DEPLOYMENT=${2:-"default"}
+BENCHMARK_STORAGE=${BENCHMARK_STORAGE:-".benchmarks"}
+
+export ZENML_ANALYTICS_OPT_IN=false
+
+COMPARE_ARGS=()
+if ls "$BENCHMARK_STORAGE"/*/*.json > /dev/null 2>&1; then
+    COMPARE_ARGS=(--benchmark-compare --benchmark-compare-fail=mean:15%)
+fi
+
+pytest tests/benchmarks \
+    -p no:randomly \
+    --benchmark-scale $SCALE \
+    --deployment $TEST_DEPLOYMENT \
+    --benchmark-storage "$BENCHMARK_STORAGE" \
+    --benchmark-autosave \
+    "${COMPARE_ARGS[@]}" \
+    "${@:3}"
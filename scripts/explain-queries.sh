@@ -0,0 +1,23 @@
+#!/usr/bin/env bash
+set -e
+set -x
+
+# Runs the ZenML store tests while capturing the query plan of every SQL
+# query and reports the queries that perform full table scans. Use this when
+# adding new filters or queries to the SQL store to check whether they need
+# an index.
+#
+# Usage:
+#   scripts/explain-queries.sh [test deployment] [extra pytest args]
+#
+# The default test deployment uses a local SQLite database. To check the
+# query plans on MySQL, pass the `client-mysql` deployment.
+TEST_DEPLOYMENT=${1:-"default"}
+
+export ZENML_DEBUG=1
+export ZENML_ANALYTICS_OPT_IN=false
+
+pytest tests/integration/functional/zen_stores \
+    --deployment $TEST_DEPLOYMENT \
+    --explain-queries \
+    "${@:2}"
@@ -13,13 +13,18 @@
 #  permissions and limitations under the License.
 """The analytics client of ZenML."""
 
+import atexit
 import json
 import logging
+import os
+import threading
+import time
+from queue import Full, Queue
 from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
+from zenml.analytics.consumer import Consumer, QueueItem
 from zenml.analytics.enums import AnalyticsEvent
-from zenml.analytics.request import post
 from zenml.analytics.utils import AnalyticsEncoder
 from zenml.constants import IS_DEBUG_ENV
 
@@ -27,17 +32,49 @@ logger = logging.getLogger(__name__)
 
 
 class Client(object):
-    """The client class for ZenML analytics."""
+    """The client class for ZenML analytics.
 
-    def __init__(self, send: bool = True, timeout: int = 15) -> None:
+    Messages are put in a bounded in-memory queue and uploaded in batches by
+    a background consumer thread, so tracking an event never blocks on the
+    analytics server. If the queue is full, new messages are dropped.
+    """
+
+    def __init__(
+        self,
+        send: bool = True,
+        timeout: int = 15,
+        max_queue_size: int = 10000,
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+        shutdown_timeout: float = 1.5,
+    ) -> None:
         """Initialization of the client.
 
         Args:
             send: Flag to determine whether to send the message.
             timeout: Timeout in seconds.
+            max_queue_size: The maximum number of messages to keep in the
+                queue before new messages are dropped.
+            upload_size: The maximum number of messages to send in one batch.
+            upload_interval: The maximum time in seconds to wait for a batch
+                to fill up before it is sent.
+            shutdown_timeout: The maximum time in seconds to wait for the
+                queued messages to be sent when shutting down. This keeps
+                the exit of the process from blocking on an unreachable
+                analytics server.
         """
         self.send = send
         self.timeout = timeout
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.queue: "Queue[QueueItem]" = Queue(max_queue_size)
+        self.consumer: Optional[Consumer] = None
+        self._consumer_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        if send:
+            atexit.register(self.shutdown)
 
     def identify(
         self, user_id: UUID, traits: Optional[Dict[Any, Any]]
@@ -133,12 +170,72 @@ class Client(object):
         Returns:
             Tuple (success flag, the original message).
         """
+        from zenml.analytics import source_context
+
         # if send is False, return msg as if it was successfully queued
         if not self.send:
             return True, msg
 
-        post(timeout=self.timeout, batch=[msg])
+        self._ensure_consumer()
+        try:
+            self.queue.put((msg, source_context.get()), block=False)
+        except Full:
+            logger.debug("Analytics queue is full, dropping message.")
+            return False, msg
+
         return True, msg
 
+    def _ensure_consumer(self) -> None:
+        """Start the consumer thread if it is not running in this process."""
+        pid = os.getpid()
+        if self.consumer is not None and self._consumer_pid == pid:
+            return
+
+        with self._lock:
+            if self.consumer is not None and self._consumer_pid == pid:
+                return
+
+            if self._consumer_pid is not None:
+                # The process was forked: threads are not copied to the child
+                # process and the queue might be in an inconsistent state.
+                self.queue = Queue(self.queue.maxsize)
+
+            self.consumer = Consumer(
+                queue=self.queue,
+                upload_size=self.upload_size,
+                upload_interval=self.upload_interval,
+                timeout=self.timeout,
+            )
+            self.consumer.start()
+            self._consumer_pid = pid
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until all queued messages have been processed.
+
+        Args:
+            timeout: The maximum time in seconds to wait. If not set, wait
+                until the queue is empty.
+        """
+        if self.consumer is None or self._consumer_pid != os.getpid():
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.debug("Timed out while flushing analytics messages.")
+                return
+            time.sleep(0.05)
+
+    def shutdown(self) -> None:
+        """Flush the queued messages and stop the consumer thread."""
+        if self.consumer is None or self._consumer_pid != os.getpid():
+            return
+
+        self.flush(timeout=self.shutdown_timeout)
+        self.consumer.pause()
+        self.consumer.join(timeout=self.upload_interval)
+        self.consumer = None
+        self._consumer_pid = None
+
 
 default_client = Client()
@@ -0,0 +1,125 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""The background consumer of the ZenML analytics queue.
+
+This module is based on the 'analytics-python' package created by Segment.
+The base functionalities are adapted to work with the ZenML analytics server.
+"""
+
+import logging
+import time
+from queue import Empty, Queue
+from threading import Thread
+from typing import Dict, List, Tuple
+
+from zenml.enums import SourceContextTypes
+
+logger = logging.getLogger(__name__)
+
+QueueItem = Tuple[str, SourceContextTypes]
+
+
+class Consumer(Thread):
+    """Daemon thread that uploads queued analytics messages in batches."""
+
+    def __init__(
+        self,
+        queue: "Queue[QueueItem]",
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+        timeout: int = 15,
+    ) -> None:
+        """Initialization of the consumer.
+
+        Args:
+            queue: The queue to consume messages from.
+            upload_size: The maximum number of messages to send in one batch.
+            upload_interval: The maximum time in seconds to wait for a batch
+                to fill up before it is sent.
+            timeout: Timeout in seconds for the upload requests.
+        """
+        super().__init__(daemon=True, name="zenml-analytics-consumer")
+        self.queue = queue
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+        self.timeout = timeout
+        self.running = True
+
+    def run(self) -> None:
+        """Upload messages until the consumer is paused."""
+        logger.debug("Analytics consumer is running.")
+        while self.running:
+            self.upload()
+        logger.debug("Analytics consumer exited.")
+
+    def pause(self) -> None:
+        """Stop the consumer after the current batch."""
+        self.running = False
+
+    def upload(self) -> bool:
+        """Upload the next batch of messages.
+
+        Returns:
+            True if a batch was uploaded successfully, False otherwise.
+        """
+        batch = self.next()
+        if not batch:
+            return False
+
+        # The source context is sent as a header, so messages from different
+        # sources need to be uploaded separately.
+        batches: Dict[SourceContextTypes, List[str]] = {}
+        for msg, source in batch:
+            batches.setdefault(source, []).append(msg)
+
+        success = True
+        try:
+            from zenml.analytics.request import post
+
+            for source, messages in batches.items():
+                post(batch=messages, timeout=self.timeout, source=source)
+        except Exception as e:
+            logger.debug(f"Failed to upload analytics batch: {e}")
+            success = False
+        finally:
+            # Mark the messages as processed even if the upload failed.
+            # Analytics are sent on a best-effort basis and never retried.
+            for _ in batch:
+                self.queue.task_done()
+
+        return success
+
+    def next(self) -> List[QueueItem]:
+        """Collect the next batch of messages from the queue.
+
+        Returns:
+            Up to `upload_size` messages that were put in the queue within
+            the upload interval.
+        """
+        items: List[QueueItem] = []
+        start_time = time.monotonic()
+
+        while len(items) < self.upload_size:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= self.upload_interval:
+                break
+            try:
+                item = self.queue.get(
+                    block=True, timeout=self.upload_interval - elapsed
+                )
+            except Empty:
+                break
+            items.append(item)
+
+        return items
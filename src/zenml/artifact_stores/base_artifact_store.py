@@ -41,7 +41,7 @@ from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.stack import Flavor, StackComponent, StackComponentConfig
-from zenml.utils import io_utils
+from zenml.utils import io_utils, profiling_utils
 from zenml.utils.pydantic_utils import before_validator_handler
 
 logger = get_logger(__name__)
@@ -73,6 +73,7 @@ class _sanitize_paths:
         """
         self.func = func
         self.fixed_root_path = fixed_root_path
+        self.is_open = getattr(func, "__name__", None) == "open"
 
         self.path_args: List[int] = []
         self.path_kwargs: List[str] = []
@@ -165,7 +166,13 @@ class _sanitize_paths:
             for key, value in kwargs.items()
         }
 
-        return self.func(*args, **kwargs)
+        result = self.func(*args, **kwargs)
+        if self.is_open and (
+            profiler := profiling_utils.get_active_profiler()
+        ):
+            # Count the bytes read and written while a step is profiled
+            result = profiler.wrap_file(result)
+        return result
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
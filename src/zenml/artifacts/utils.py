@@ -52,7 +52,7 @@ from zenml.models import (
 )
 from zenml.new.steps.step_context import get_step_context
 from zenml.stack import StackComponent
-from zenml.utils import source_utils
+from zenml.utils import profiling_utils, source_utils
 from zenml.utils.yaml_utils import read_yaml, write_yaml
 
 if TYPE_CHECKING:
@@ -180,13 +180,15 @@ def save_artifact(
     # Save the artifact to the artifact store
     data_type = type(data)
     materializer_object.validate_type_compatibility(data_type)
-    materializer_object.save(data)
+    with profiling_utils.profile_phase("artifact_saving"):
+        materializer_object.save(data)
 
     # Save visualizations of the artifact
     visualizations: List[ArtifactVisualizationRequest] = []
     if include_visualizations:
         try:
-            vis_data = materializer_object.save_visualizations(data)
+            with profiling_utils.profile_phase("visualization_extraction"):
+                vis_data = materializer_object.save_visualizations(data)
             for vis_uri, vis_type in vis_data.items():
                 vis_model = ArtifactVisualizationRequest(
                     type=vis_type,
@@ -203,7 +205,10 @@ def save_artifact(
     artifact_metadata: Dict[str, "MetadataType"] = {}
     if extract_metadata:
         try:
-            artifact_metadata = materializer_object.extract_full_metadata(data)
+            with profiling_utils.profile_phase("metadata_extraction"):
+                artifact_metadata = materializer_object.extract_full_metadata(
+                    data
+                )
             artifact_metadata.update(user_metadata or {})
         except Exception as e:
             logger.warning(
@@ -372,11 +377,18 @@ def log_artifact_metadata(
             )
         client = Client()
         response = client.get_artifact_version(artifact_name, artifact_version)
-        client.create_run_metadata(
-            metadata=metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
-        )
+        if step_context:
+            step_context.add_run_metadata(
+                metadata=metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+            )
+        else:
+            client.create_run_metadata(
+                metadata=metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+            )
 
     else:
         try:
@@ -15,7 +15,8 @@
 
 import json
 import os
-from typing import Any, Dict, Optional, Union
+import time
+from typing import Any, Dict, Optional, Set, Union
 
 import click
 
@@ -26,6 +27,8 @@ from zenml.client import Client
 from zenml.console import console
 from zenml.enums import CliCategories
 from zenml.logger import get_logger
+from zenml.logging import STEP_LOGS_TAIL_POLL_INTERVAL_SECONDS
+from zenml.logging.step_logging import tail_step_logs
 from zenml.models import (
     PipelineBuildBase,
     PipelineBuildFilter,
@@ -35,6 +38,7 @@ from zenml.models import (
 )
 from zenml.new.pipelines.pipeline import Pipeline
 from zenml.utils import source_utils, uuid_utils
+from zenml.utils.profiling_utils import PROFILING_METADATA_KEY
 from zenml.utils.yaml_utils import write_yaml
 
 logger = get_logger(__name__)
@@ -521,6 +525,159 @@ def refresh_pipeline_run(run_name_or_id: str) -> None:
         )
 
 
+@runs.command("resume")
+@click.argument("run_name_or_id", type=str, required=True)
+@click.option(
+    "--from-step",
+    "-s",
+    type=str,
+    required=False,
+    help="Name of a step to run again, even if it finished successfully.",
+)
+def resume_pipeline_run(
+    run_name_or_id: str, from_step: Optional[str] = None
+) -> None:
+    """Resume a pipeline run from its failed steps or a chosen step.
+
+    The failed steps, the step to resume from and all steps downstream of
+    them run again in a new pipeline run. The outputs of all other steps are
+    reused from the original run.
+
+    Args:
+        run_name_or_id: The name or ID of the pipeline run to resume.
+        from_step: Name of a step to run again, even if it finished
+            successfully.
+    """
+    try:
+        run = Client().resume_pipeline_run(
+            name_id_or_prefix=run_name_or_id, from_step=from_step
+        )
+    except (KeyError, ValueError) as e:
+        cli_utils.error(str(e))
+    else:
+        cli_utils.declare(
+            f"Resumed pipeline run '{run_name_or_id}' as '{run.name}' with "
+            f"status '{run.status.value}'."
+        )
+
+
+@runs.command("logs")
+@click.argument("run_name_or_id", type=str, required=True)
+@click.option(
+    "--step",
+    "-s",
+    "step_name",
+    type=str,
+    required=False,
+    help="Name of the step for which to show the logs. If not given, the "
+    "logs of all steps are shown.",
+)
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    default=False,
+    help="Keep showing new logs until the steps are finished.",
+)
+def pipeline_run_logs(
+    run_name_or_id: str, step_name: Optional[str] = None, follow: bool = False
+) -> None:
+    """Show the logs of the steps of a pipeline run.
+
+    The logs are read incrementally from the artifact store, which means
+    this requires access to the artifact store of the run.
+
+    Args:
+        run_name_or_id: The name or ID of the pipeline run.
+        step_name: Name of the step for which to show the logs.
+        follow: If True, new logs are shown until the steps are finished.
+    """
+    client = Client()
+    try:
+        run = client.get_pipeline_run(name_id_or_prefix=run_name_or_id)
+    except KeyError as e:
+        cli_utils.error(str(e))
+
+    shown_steps: Set[str] = set()
+    while True:
+        # Check this before showing the logs, so that steps which started
+        # before the run finished are always shown
+        run_finished = run.status.is_finished
+
+        for name, step_run in run.steps.items():
+            if name in shown_steps or (step_name and name != step_name):
+                continue
+
+            shown_steps.add(name)
+            if not step_run.logs:
+                cli_utils.declare(f"No logs available for step '{name}'.")
+                continue
+
+            cli_utils.declare(f"Logs of step '{name}':")
+            for logs in tail_step_logs(step_run, follow=follow):
+                click.echo(logs, nl=False)
+
+        if not follow or run_finished or step_name in shown_steps:
+            break
+
+        time.sleep(STEP_LOGS_TAIL_POLL_INTERVAL_SECONDS)
+        run = client.get_pipeline_run(name_id_or_prefix=run.id)
+
+    if step_name and step_name not in shown_steps:
+        cli_utils.error(
+            f"No step with name '{step_name}' found in pipeline run "
+            f"'{run.name}'."
+        )
+
+
+@runs.command("profile")
+@click.argument("run_name_or_id", type=str, required=True)
+def profile_pipeline_run(run_name_or_id: str) -> None:
+    """Show the profiling results of the steps of a pipeline run.
+
+    Steps are only profiled if the `profiling` settings of the step or
+    pipeline enable it.
+
+    Args:
+        run_name_or_id: The name or ID of the pipeline run.
+    """
+    try:
+        run = Client().get_pipeline_run(name_id_or_prefix=run_name_or_id)
+    except KeyError as e:
+        cli_utils.error(str(e))
+
+    rows = []
+    for step_name, step_run in run.steps.items():
+        if PROFILING_METADATA_KEY not in step_run.run_metadata:
+            continue
+
+        profile = step_run.run_metadata[PROFILING_METADATA_KEY].value
+        if not isinstance(profile, dict):
+            continue
+
+        row: Dict[str, Any] = {
+            "step": step_name,
+            "status": step_run.status.value,
+            "total": f"{profile.get('total_seconds', 0):.3f}s",
+        }
+        row.update(
+            (phase, f"{duration:.3f}s")
+            for phase, duration in profile.get("phases", {}).items()
+        )
+        row.update(profile.get("counters", {}))
+        rows.append(row)
+
+    if not rows:
+        cli_utils.declare(
+            f"No profiled steps found for pipeline run '{run.name}'. Enable "
+            "profiling for a step or pipeline using "
+            '`settings={"profiling": {"enabled": True}}`.'
+        )
+        return
+
+    cli_utils.print_table(rows, title=f"Profile of pipeline run {run.name}")
+
+
 @pipeline.group()
 def builds() -> None:
     """Commands for pipeline builds."""
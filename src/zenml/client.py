@@ -25,9 +25,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -52,8 +54,11 @@ from zenml.constants import (
     ENV_ZENML_REPOSITORY_PATH,
     ENV_ZENML_SERVER,
     PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAXIMUM,
     PAGINATION_STARTING_PAGE,
     REPOSITORY_DIRECTORY_NAME,
+    SECRET_CACHE_SIZE,
+    SECRET_CACHE_TTL,
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
 )
@@ -190,10 +195,14 @@ from zenml.models import (
     WorkspaceResponse,
     WorkspaceUpdate,
 )
+from zenml.service_connectors.connector_client_cache import (
+    ConnectorClientCache,
+)
 from zenml.services.service import ServiceConfig
 from zenml.services.service_status import ServiceState
 from zenml.services.service_type import ServiceType
 from zenml.utils import io_utils, source_utils
+from zenml.utils.cache_utils import LRUCache
 from zenml.utils.dict_utils import dict_to_bytes
 from zenml.utils.filesync_model import FileSyncModel
 from zenml.utils.pagination_utils import depaginate
@@ -210,6 +219,41 @@ logger = get_logger(__name__)
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 F = TypeVar("F", bound=Callable[..., Any])
 
+_CONNECTOR_CLIENT_CACHE: ConnectorClientCache["ServiceConnector"] = (
+    ConnectorClientCache()
+)
+
+# Secrets resolved by name, keyed by the URL of the zen store, the active
+# workspace and user, the secret name, the requested scope and whether the
+# secret was hydrated
+SecretCacheKey = Tuple[str, UUID, UUID, str, Optional[SecretScope], bool]
+_SECRET_CACHE: LRUCache[SecretCacheKey, SecretResponse] = LRUCache(
+    maxsize=SECRET_CACHE_SIZE, ttl=SECRET_CACHE_TTL
+)
+# Up to this number of uncached secrets, secrets are resolved with one list
+# request per name instead of listing all secrets
+_SECRET_NAME_LOOKUP_LIMIT = 10
+
+
+def invalidate_secret_cache(
+    name: Optional[str] = None, secret_id: Optional[UUID] = None
+) -> None:
+    """Removes secrets from the secret cache.
+
+    If neither a name nor an ID is given, the whole cache is cleared.
+
+    Args:
+        name: Name of the secret to remove.
+        secret_id: ID of the secret to remove.
+    """
+    if name is None and secret_id is None:
+        _SECRET_CACHE.clear()
+        return
+
+    _SECRET_CACHE.invalidate_if(
+        lambda key, secret: key[3] == name or secret.id == secret_id
+    )
+
 
 class ClientConfiguration(FileSyncModel):
     """Pydantic object used for serializing client configuration options."""
@@ -403,6 +447,9 @@ class Client(metaclass=ClientMetaClass):
                 value.
         """
         cls._global_client = client
+        # Cached secrets are keyed by the store URL, which might point to a
+        # different database once the client is reset
+        invalidate_secret_cache()
 
     def _set_active_root(self, root: Optional[Path] = None) -> None:
         """Set the supplied path as the repository root.
@@ -1310,6 +1357,8 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             EntityExistsError: If the stack name is already taken.
         """
+        from zenml.stack.stack import invalidate_stack_cache
+
         # First, get the stack
         stack = self.get_stack(
             name_id_or_prefix=name_id_or_prefix, allow_name_prefix_match=False
@@ -1366,6 +1415,8 @@ class Client(metaclass=ClientMetaClass):
             stack_id=stack.id,
             stack_update=update_model,
         )
+        invalidate_stack_cache(stack_id=stack.id)
+
         if updated_stack.id == self.active_stack_model.id:
             if self._config:
                 self._config.set_active_stack(updated_stack)
@@ -1388,6 +1439,8 @@ class Client(metaclass=ClientMetaClass):
             ValueError: If the stack is the currently active stack for this
                 client.
         """
+        from zenml.stack.stack import invalidate_stack_cache
+
         stack = self.get_stack(
             name_id_or_prefix=name_id_or_prefix, allow_name_prefix_match=False
         )
@@ -1439,6 +1492,7 @@ class Client(metaclass=ClientMetaClass):
             return
 
         self.zen_store.delete_stack(stack_id=stack.id)
+        invalidate_stack_cache(stack_id=stack.id)
         logger.info("Deregistered stack with name '%s'.", stack.name)
 
     @property
@@ -2042,6 +2096,8 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             EntityExistsError: If the new name is already taken.
         """
+        from zenml.stack.stack_component import invalidate_component_cache
+
         # Get the existing component model
         component = self.get_stack_component(
             name_id_or_prefix=name_id_or_prefix,
@@ -2122,10 +2178,12 @@ class Client(metaclass=ClientMetaClass):
                 )
 
         # Send the updated component to the ZenStore
-        return self.zen_store.update_stack_component(
+        updated_component = self.zen_store.update_stack_component(
             component_id=component.id,
             component_update=update_model,
         )
+        invalidate_component_cache(component_id=component.id)
+        return updated_component
 
     def delete_stack_component(
         self,
@@ -2138,6 +2196,8 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix: The model of the component to delete.
             component_type: The type of the component to delete.
         """
+        from zenml.stack.stack_component import invalidate_component_cache
+
         component = self.get_stack_component(
             name_id_or_prefix=name_id_or_prefix,
             component_type=component_type,
@@ -2145,6 +2205,7 @@ class Client(metaclass=ClientMetaClass):
         )
 
         self.zen_store.delete_stack_component(component_id=component.id)
+        invalidate_component_cache(component_id=component.id)
         logger.info(
             "Deregistered stack component (type: %s) with name '%s'.",
             component.type,
@@ -3891,6 +3952,33 @@ class Client(metaclass=ClientMetaClass):
         )
         self.zen_store.delete_run(run_id=run.id)
 
+    def resume_pipeline_run(
+        self,
+        name_id_or_prefix: Union[str, UUID],
+        from_step: Optional[str] = None,
+    ) -> PipelineRunResponse:
+        """Resumes a pipeline run from its failed steps or a chosen step.
+
+        The steps that did not finish successfully, the step to resume from
+        and all steps downstream of them run again in a new pipeline run on
+        the stack of the original run. The outputs of all other steps are
+        reused from the original run.
+
+        Args:
+            name_id_or_prefix: Name, ID, or prefix of the pipeline run.
+            from_step: Optional name of a step to run again, even if it
+                finished successfully.
+
+        Returns:
+            The new pipeline run.
+        """
+        from zenml.new.pipelines.run_utils import resume_pipeline_run
+
+        run = self.get_pipeline_run(
+            name_id_or_prefix=name_id_or_prefix, allow_name_prefix_match=False
+        )
+        return resume_pipeline_run(run=run, from_step=from_step)
+
     # -------------------------------- Step run --------------------------------
 
     def get_run_step(
@@ -4423,6 +4511,91 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The created metadata, as string to model dictionary.
         """
+        run_metadata = self._get_run_metadata_request(
+            metadata=metadata,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            stack_component_id=stack_component_id,
+            workspace_id=self.active_workspace.id,
+            user_id=self.active_user.id,
+        )
+        return self.zen_store.create_run_metadata(run_metadata)
+
+    def create_run_metadata_batch(
+        self,
+        run_metadata: Sequence[
+            Tuple[
+                Dict[str, "MetadataType"],
+                UUID,
+                MetadataResourceTypes,
+                Optional[UUID],
+            ]
+        ],
+    ) -> List[RunMetadataResponse]:
+        """Create run metadata for multiple resources with a single request.
+
+        Args:
+            run_metadata: Tuples of the metadata to create, the ID and type of
+                the resource for which the metadata was produced and the
+                optional ID of the stack component that produced the
+                metadata.
+
+        Returns:
+            The created metadata.
+        """
+        if not run_metadata:
+            return []
+
+        workspace_id = self.active_workspace.id
+        user_id = self.active_user.id
+        requests = [
+            self._get_run_metadata_request(
+                metadata=metadata,
+                resource_id=resource_id,
+                resource_type=resource_type,
+                stack_component_id=stack_component_id,
+                workspace_id=workspace_id,
+                user_id=user_id,
+            )
+            for (
+                metadata,
+                resource_id,
+                resource_type,
+                stack_component_id,
+            ) in run_metadata
+        ]
+        return self.zen_store.create_run_metadata_batch(
+            [request for request in requests if request.values]
+        )
+
+    @staticmethod
+    def _get_run_metadata_request(
+        metadata: Dict[str, "MetadataType"],
+        resource_id: UUID,
+        resource_type: MetadataResourceTypes,
+        stack_component_id: Optional[UUID],
+        workspace_id: UUID,
+        user_id: UUID,
+    ) -> RunMetadataRequest:
+        """Create a run metadata request.
+
+        Metadata values that are too large or of an unsupported type are
+        skipped.
+
+        Args:
+            metadata: The metadata to create as a dictionary of key-value pairs.
+            resource_id: The ID of the resource for which the
+                metadata was produced.
+            resource_type: The type of the resource for which the
+                metadata was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+            workspace_id: The ID of the workspace of the metadata.
+            user_id: The ID of the user that creates the metadata.
+
+        Returns:
+            The run metadata request.
+        """
         from zenml.metadata.metadata_types import get_metadata_type
 
         values: Dict[str, "MetadataType"] = {}
@@ -4447,16 +4620,15 @@ class Client(metaclass=ClientMetaClass):
             values[key] = value
             types[key] = metadata_type
 
-        run_metadata = RunMetadataRequest(
-            workspace=self.active_workspace.id,
-            user=self.active_user.id,
+        return RunMetadataRequest(
+            workspace=workspace_id,
+            user=user_id,
             resource_id=resource_id,
             resource_type=resource_type,
             stack_component_id=stack_component_id,
             values=values,
             types=types,
         )
-        return self.zen_store.create_run_metadata(run_metadata)
 
     def list_run_metadata(
         self,
@@ -4555,13 +4727,18 @@ class Client(metaclass=ClientMetaClass):
             workspace=self.active_workspace.id,
         )
         try:
-            return self.zen_store.create_secret(secret=create_secret_request)
+            secret = self.zen_store.create_secret(secret=create_secret_request)
         except NotImplementedError:
             raise NotImplementedError(
                 "centralized secrets management is not supported or explicitly "
                 "disabled in the target ZenML deployment."
             )
 
+        # The new secret might take precedence over a cached secret with the
+        # same name in a different scope
+        invalidate_secret_cache(name=name)
+        return secret
+
     def get_secret(
         self,
         name_id_or_prefix: Union[str, UUID],
@@ -4826,9 +5003,13 @@ class Client(metaclass=ClientMetaClass):
         if values:
             secret_update.values = values
 
-        return Client().zen_store.update_secret(
+        updated_secret = Client().zen_store.update_secret(
             secret_id=secret.id, secret_update=secret_update
         )
+        invalidate_secret_cache(name=secret.name, secret_id=secret.id)
+        if updated_secret.name != secret.name:
+            invalidate_secret_cache(name=updated_secret.name)
+        return updated_secret
 
     def delete_secret(
         self, name_id_or_prefix: str, scope: Optional[SecretScope] = None
@@ -4848,6 +5029,7 @@ class Client(metaclass=ClientMetaClass):
         )
 
         self.zen_store.delete_secret(secret_id=secret.id)
+        invalidate_secret_cache(name=secret.name, secret_id=secret.id)
 
     def get_secret_by_name_and_scope(
         self,
@@ -4875,6 +5057,12 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             KeyError: If no secret exists for the given name in the given scope.
         """
+        cache_key = self._get_secret_cache_key(
+            name=name, scope=scope, hydrate=hydrate
+        )
+        if cached_secret := _SECRET_CACHE.get(cache_key):
+            return cached_secret.model_copy(deep=True)
+
         logger.debug(
             f"Fetching the secret with name '{name}' and scope '{scope}'."
         )
@@ -4896,9 +5084,11 @@ class Client(metaclass=ClientMetaClass):
 
             if len(secrets.items) >= 1:
                 # Need to fetch the secret again to get the secret values
-                return self.zen_store.get_secret(
+                secret = self.zen_store.get_secret(
                     secret_id=secrets.items[0].id, hydrate=hydrate
                 )
+                _SECRET_CACHE.set(cache_key, secret.model_copy(deep=True))
+                return secret
 
         msg = f"No secret with name '{name}' was found"
         if scope is not None:
@@ -4906,6 +5096,135 @@ class Client(metaclass=ClientMetaClass):
 
         raise KeyError(msg)
 
+    def get_secrets_by_name(
+        self,
+        names: Sequence[str],
+        scope: Optional[SecretScope] = None,
+        hydrate: bool = True,
+    ) -> Dict[str, SecretResponse]:
+        """Fetches multiple registered secrets including their values by name.
+
+        This is a bulk version of `get_secret_by_name_and_scope`: secrets
+        which are not cached are resolved with one list request per name, or
+        by listing all secrets if many names are missing, and their values
+        are fetched with a single request.
+
+        Args:
+            names: The names of the secrets to get.
+            scope: The scope of the secrets to get. If not set, secrets in the
+                user scope take precedence over secrets in the workspace
+                scope.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets by name. Names for which no secret exists are not
+            included.
+
+        Raises:
+            NotImplementedError: If centralized secrets management is not
+                enabled.
+        """
+        secrets: Dict[str, SecretResponse] = {}
+        missing_names = set()
+        for name in names:
+            cache_key = self._get_secret_cache_key(
+                name=name, scope=scope, hydrate=hydrate
+            )
+            if cached_secret := _SECRET_CACHE.get(cache_key):
+                secrets[name] = cached_secret.model_copy(deep=True)
+            else:
+                missing_names.add(name)
+
+        if not missing_names:
+            return secrets
+
+        logger.debug(f"Fetching the secrets with names {missing_names}.")
+
+        # Scopes to search in order of priority
+        search_scopes = (
+            [SecretScope.USER, SecretScope.WORKSPACE]
+            if scope is None
+            else [scope]
+        )
+
+        if len(missing_names) <= _SECRET_NAME_LOOKUP_LIMIT:
+            candidates: Iterable[SecretResponse] = (
+                secret
+                for name in missing_names
+                for secret in depaginate(
+                    self.list_secrets,
+                    name=f"equals:{name}",
+                    scope=scope,
+                    size=PAGE_SIZE_MAXIMUM,
+                )
+            )
+        else:
+            candidates = depaginate(
+                self.list_secrets, scope=scope, size=PAGE_SIZE_MAXIMUM
+            )
+
+        # Secrets are sorted by creation time, so the oldest secret with a
+        # name wins like in `get_secret_by_name_and_scope`
+        matches: Dict[Tuple[str, SecretScope], UUID] = {}
+        for secret in candidates:
+            if secret.name in missing_names:
+                matches.setdefault((secret.name, secret.scope), secret.id)
+
+        secret_names: Dict[UUID, str] = {}
+        for name in missing_names:
+            for search_scope in search_scopes:
+                if secret_id := matches.get((name, search_scope)):
+                    secret_names[secret_id] = name
+                    break
+
+        if not secret_names:
+            return secrets
+
+        try:
+            fetched_secrets = self.zen_store.get_secrets_batch(
+                secret_ids=list(secret_names), hydrate=hydrate
+            )
+        except NotImplementedError:
+            raise NotImplementedError(
+                "centralized secrets management is not supported or explicitly "
+                "disabled in the target ZenML deployment."
+            )
+
+        for secret in fetched_secrets:
+            name = secret_names[secret.id]
+            _SECRET_CACHE.set(
+                self._get_secret_cache_key(
+                    name=name, scope=scope, hydrate=hydrate
+                ),
+                secret.model_copy(deep=True),
+            )
+            secrets[name] = secret
+
+        return secrets
+
+    def _get_secret_cache_key(
+        self, name: str, scope: Optional[SecretScope], hydrate: bool
+    ) -> SecretCacheKey:
+        """Gets the key of a secret in the secret cache.
+
+        Args:
+            name: The name of the secret.
+            scope: The requested scope of the secret.
+            hydrate: Whether the secret is hydrated.
+
+        Returns:
+            The cache key.
+        """
+        return (
+            self.zen_store.url,
+            self.active_workspace.id,
+            self.active_user.id,
+            name,
+            scope,
+            hydrate,
+        )
+
     def list_secrets_in_scope(
         self,
         scope: SecretScope,
@@ -5913,36 +6232,48 @@ class Client(metaclass=ClientMetaClass):
         # implementation if available there, because some auth methods rely on
         # the server-side authentication environment
         if connector_type.remote:
-            connector_client_model = (
-                self.zen_store.get_service_connector_client(
-                    service_connector_id=service_connector.id,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
+
+            def _create_connector_client() -> "ServiceConnector":
+                connector_client_model = (
+                    self.zen_store.get_service_connector_client(
+                        service_connector_id=service_connector.id,
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                    )
                 )
-            )
 
-            connector_client = (
-                service_connector_registry.instantiate_connector(
+                return service_connector_registry.instantiate_connector(
                     model=connector_client_model
                 )
-            )
-
-            if verify:
-                # Verify the connector client on the local machine, because the
-                # server-side implementation may not be able to do so
-                connector_client.verify()
         else:
-            connector_instance = (
-                service_connector_registry.instantiate_connector(
-                    model=service_connector
+
+            def _create_connector_client() -> "ServiceConnector":
+                connector_instance = (
+                    service_connector_registry.instantiate_connector(
+                        model=service_connector
+                    )
                 )
-            )
 
-            # Fetch the connector client
-            connector_client = connector_instance.get_connector_client(
-                resource_type=resource_type,
-                resource_id=resource_id,
-            )
+                # Fetch the connector client
+                return connector_instance.get_connector_client(
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                )
+
+        # Connector clients are shared by all stack components in this
+        # process and reused until their credentials are about to expire
+        connector_client = _CONNECTOR_CLIENT_CACHE.get_or_create(
+            connector_id=service_connector.id,
+            connector_updated=service_connector.updated,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            create=_create_connector_client,
+        )
+
+        if connector_type.remote and verify:
+            # Verify the connector client on the local machine, because the
+            # server-side implementation may not be able to do so
+            connector_client.verify()
 
         return connector_client
 
@@ -24,11 +24,13 @@ deserialization of the configuration options that are stored in the file in
 order to persist the configuration across sessions.
 """
 from zenml.config.docker_settings import DockerSettings
+from zenml.config.profiling_settings import ProfilingSettings
 from zenml.config.resource_settings import ResourceSettings
 from zenml.config.retry_config import StepRetryConfig
 
 __all__ = [
     "DockerSettings",
+    "ProfilingSettings",
     "ResourceSettings",
     "StepRetryConfig",
 ]
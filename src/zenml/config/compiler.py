@@ -14,6 +14,8 @@
 """Class for compiling ZenML pipelines into a serializable format."""
 
 import copy
+import hashlib
+import json
 import string
 from typing import (
     TYPE_CHECKING,
@@ -36,11 +38,17 @@ from zenml.config.step_configurations import (
     StepConfigurationUpdate,
     StepSpec,
 )
+from zenml.constants import (
+    COMPILATION_CACHE_SIZE,
+    ENV_ZENML_DISABLE_COMPILATION_CACHE,
+    handle_bool_env_var,
+)
 from zenml.environment import get_run_environment_dict
 from zenml.exceptions import StackValidationError
 from zenml.models import PipelineDeploymentBase
 from zenml.new.pipelines.run_utils import get_default_run_name
 from zenml.utils import pydantic_utils, settings_utils
+from zenml.utils.cache_utils import LRUCache
 
 if TYPE_CHECKING:
     from zenml.config.source import Source
@@ -52,6 +60,13 @@ from zenml.logger import get_logger
 
 logger = get_logger(__file__)
 
+# Deployments of the most recent compilations, keyed by a hash of the
+# pipeline, stack and run configuration they were compiled from. This allows
+# repeatedly running an unchanged pipeline without compiling it again.
+_COMPILATION_CACHE: LRUCache[str, PipelineDeploymentBase] = LRUCache(
+    maxsize=COMPILATION_CACHE_SIZE
+)
+
 
 def get_zenml_versions() -> Tuple[str, str]:
     """Returns the version of ZenML on the client and server side.
@@ -86,6 +101,20 @@ class Compiler:
         Returns:
             The compiled pipeline deployment.
         """
+        cache_key = None
+        if not handle_bool_env_var(ENV_ZENML_DISABLE_COMPILATION_CACHE, False):
+            cache_key = self._compute_cache_key(
+                pipeline=pipeline,
+                stack=stack,
+                run_configuration=run_configuration,
+            )
+
+        if cache_key and (
+            cached_deployment := _COMPILATION_CACHE.get(cache_key)
+        ):
+            logger.debug("Using cached compilation of `%s`.", pipeline.name)
+            return cached_deployment.model_copy(deep=True)
+
         logger.debug("Compiling pipeline `%s`.", pipeline.name)
         # Copy the pipeline before we apply any run-level configurations, so
         # we don't mess with the pipeline object/step objects in any way
@@ -158,8 +187,86 @@ class Compiler:
 
         logger.debug("Compiled pipeline deployment: %s", deployment)
 
+        if cache_key:
+            _COMPILATION_CACHE.set(cache_key, deployment.model_copy(deep=True))
+
         return deployment
 
+    def _compute_cache_key(
+        self,
+        pipeline: "Pipeline",
+        stack: "Stack",
+        run_configuration: PipelineRunConfiguration,
+    ) -> Optional[str]:
+        """Computes the key of a compilation in the compilation cache.
+
+        Args:
+            pipeline: The pipeline to compile.
+            stack: The stack on which the pipeline will run.
+            run_configuration: The run configuration for this pipeline.
+
+        Returns:
+            The cache key or `None` if the compilation can't be cached.
+        """
+        hash_ = hashlib.md5()  # nosec
+
+        def _update(value: Any) -> None:
+            hash_.update(
+                json.dumps(value, sort_keys=True, default=str).encode()
+            )
+            hash_.update(b"\0")
+
+        try:
+            _update(pipeline.name)
+            _update(pipeline.source_code)
+            _update(pipeline.configuration.model_dump(mode="json"))
+            _update(run_configuration.model_dump(mode="json"))
+            _update(str(stack.id))
+            for component in stack.components.values():
+                _update(
+                    [
+                        str(component.id),
+                        component.config.model_dump(mode="json"),
+                    ]
+                )
+
+            for invocation_id, invocation in pipeline.invocations.items():
+                if (
+                    invocation.external_artifacts
+                    or invocation.model_artifacts_or_metadata
+                    or invocation.client_lazy_loaders
+                ):
+                    # These might resolve to different artifacts whenever the
+                    # pipeline is compiled
+                    return None
+
+                step = invocation.step
+                _update(
+                    [
+                        invocation_id,
+                        step.resolve().model_dump(mode="json"),
+                        step.caching_parameters,
+                        step.configuration.model_dump(mode="json"),
+                        invocation.parameters,
+                        invocation.default_parameters,
+                        {
+                            name: [
+                                artifact.invocation_id,
+                                artifact.output_name,
+                            ]
+                            for name, artifact in invocation.input_artifacts.items()
+                        },
+                        sorted(invocation.invocation_upstream_steps),
+                    ]
+                )
+        except Exception as e:
+            # Configurations that can't be serialized are validated and
+            # reported by the compilation itself
+            logger.debug("Unable to compute compilation cache key: %s", e)
+            return None
+
+        return hash_.hexdigest()
+
     def compile_spec(self, pipeline: "Pipeline") -> PipelineSpec:
         """Compiles a ZenML pipeline to a pipeline spec.
 
@@ -15,3 +15,4 @@
 
 DOCKER_SETTINGS_KEY = "docker"
 RESOURCE_SETTINGS_KEY = "resources"
+PROFILING_SETTINGS_KEY = "profiling"
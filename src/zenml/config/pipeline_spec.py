@@ -69,6 +69,9 @@ class PipelineSpec(StrictBaseModel):
             step_dict["source"] = Source.model_validate(
                 step_dict["source"]
             ).import_path
+            # Reused upstream steps depend on the run that gets resumed and
+            # are not part of the pipeline itself
+            step_dict.pop("reused_upstream_steps", None)
 
         if version.parse(self.version) < version.parse("0.4"):
             # Keep backwards compatibility with old pipeline versions
@@ -0,0 +1,43 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Profiling settings class used to profile step runs."""
+
+from pydantic_settings import SettingsConfigDict
+
+from zenml.config.base_settings import BaseSettings
+
+
+class ProfilingSettings(BaseSettings):
+    """Step profiling settings.
+
+    If profiling is enabled, the time spent in each phase of a step run
+    (e.g. loading inputs, running the step function, storing outputs) as
+    well as the number of store requests and artifact store bytes read and
+    written are stored as run metadata of the step run.
+
+    Attributes:
+        enabled: Whether to profile the step run.
+        capture_cprofile: Whether to additionally run `cProfile` during the
+            step run and store its stats in the artifact store.
+    """
+
+    enabled: bool = False
+    capture_cprofile: bool = False
+
+    model_config = SettingsConfigDict(
+        # public attributes are immutable
+        frozen=True,
+        # prevent extra attributes during model initialization
+        extra="forbid",
+    )
@@ -26,6 +26,9 @@ from zenml.constants import (
     DEFAULT_ZENML_JWT_TOKEN_LEEWAY,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_QUEUE_SIZE,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_CACHE_TTL,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_WORKERS,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE,
     DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS,
@@ -147,6 +150,10 @@ class ServerConfiguration(BaseModel):
             server.
         login_rate_limit_minute: The number of login attempts allowed per minute.
         login_rate_limit_day: The number of login attempts allowed per day.
+        rate_limit_store_implementation_source: Source pointing to a class
+            implementing the rate limit store interface defined by
+            `zenml.zen_server.rate_limit.RateLimitStore`. If not specified,
+            request counts are kept in the memory of each server process.
         secure_headers_server: Custom value to be set in the `Server` HTTP
             header to identify the server. If not specified, or if set to one of
             the reserved values `enabled`, `yes`, `true`, `on`, the `Server`
@@ -231,6 +238,20 @@ class ServerConfiguration(BaseModel):
         auto_activate: Whether to automatically activate the server and create a
             default admin user account with an empty password during the initial
             deployment.
+        thread_pool_size: The maximum number of worker threads used to serve
+            the synchronous API endpoints and to run blocking calls of the
+            asynchronous middleware. Should be kept in line with the size of
+            the SQL database connection pool.
+        event_hub_trigger_cache_ttl: The time in seconds for which the event
+            hub caches the active triggers of an event source. Triggers that
+            are created, updated or deleted through this server are reflected
+            immediately, the TTL only bounds how long changes made through
+            other server replicas can go unnoticed.
+        event_hub_workers: The number of worker threads used by the event hub
+            to execute the actions of matching triggers.
+        event_hub_queue_size: The maximum number of actions that can be queued
+            for execution by the event hub workers. If the queue is full, the
+            actions are executed synchronously by the caller instead.
     """
 
     deployment_type: ServerDeploymentType = ServerDeploymentType.OTHER
@@ -273,6 +294,7 @@ class ServerConfiguration(BaseModel):
     rate_limit_enabled: bool = False
     login_rate_limit_minute: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE
     login_rate_limit_day: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY
+    rate_limit_store_implementation_source: Optional[str] = None
 
     secure_headers_server: Union[bool, str] = Field(
         default=True,
@@ -319,6 +341,12 @@ class ServerConfiguration(BaseModel):
 
     thread_pool_size: int = DEFAULT_ZENML_SERVER_THREAD_POOL_SIZE
 
+    event_hub_trigger_cache_ttl: int = (
+        DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_CACHE_TTL
+    )
+    event_hub_workers: int = DEFAULT_ZENML_SERVER_EVENT_HUB_WORKERS
+    event_hub_queue_size: int = DEFAULT_ZENML_SERVER_EVENT_HUB_QUEUE_SIZE
+
     _deployment_id: Optional[UUID] = None
 
     @model_validator(mode="before")
@@ -36,7 +36,11 @@ from zenml.artifacts.external_artifact_config import (
 )
 from zenml.client_lazy_loader import ClientLazyLoader
 from zenml.config.base_settings import BaseSettings, SettingsOrDict
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    DOCKER_SETTINGS_KEY,
+    PROFILING_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.config.retry_config import StepRetryConfig
 from zenml.config.source import Source, SourceWithValidator
 from zenml.config.strict_base_model import StrictBaseModel
@@ -47,7 +51,11 @@ from zenml.utils import deprecation_utils
 from zenml.utils.pydantic_utils import before_validator_handler
 
 if TYPE_CHECKING:
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        DockerSettings,
+        ProfilingSettings,
+        ResourceSettings,
+    )
 
 logger = get_logger(__name__)
 
@@ -235,6 +243,22 @@ class StepConfiguration(PartialStepConfiguration):
             model_or_dict = model_or_dict.model_dump()
         return DockerSettings.model_validate(model_or_dict)
 
+    @property
+    def profiling_settings(self) -> "ProfilingSettings":
+        """Profiling settings of this step configuration.
+
+        Returns:
+            The profiling settings of this step configuration.
+        """
+        from zenml.config import ProfilingSettings
+
+        model_or_dict: SettingsOrDict = self.settings.get(
+            PROFILING_SETTINGS_KEY, {}
+        )
+        if isinstance(model_or_dict, BaseSettings):
+            model_or_dict = model_or_dict.model_dump()
+        return ProfilingSettings.model_validate(model_or_dict)
+
 
 class InputSpec(StrictBaseModel):
     """Step input specification."""
@@ -248,6 +272,10 @@ class StepSpec(StrictBaseModel):
 
     source: SourceWithValidator
     upstream_steps: List[str]
+    # Upstream steps of a resumed run whose step runs are reused instead of
+    # being run again. These are not scheduled by the orchestrator but are
+    # still parents of the step.
+    reused_upstream_steps: List[str] = []
     inputs: Dict[str, InputSpec] = {}
     # The default value is to ensure compatibility with specs of version <0.2
     pipeline_parameter_name: str = ""
@@ -134,6 +134,7 @@ APP_NAME = "zenml"
 # Environment variables
 ENV_ZENML_LOGGING_COLORS_DISABLED = "ZENML_LOGGING_COLORS_DISABLED"
 ENV_ZENML_ANALYTICS_OPT_IN = "ZENML_ANALYTICS_OPT_IN"
+ENV_ZENML_ANALYTICS_SERVER_URL = "ZENML_ANALYTICS_SERVER_URL"
 ENV_ZENML_CONFIG_PATH = "ZENML_CONFIG_PATH"
 ENV_ZENML_DEBUG = "ZENML_DEBUG"
 ENV_ZENML_LOGGING_VERBOSITY = "ZENML_LOGGING_VERBOSITY"
@@ -167,12 +168,38 @@ ENV_ZENML_LOCAL_SERVER = "ZENML_LOCAL_SERVER"
 ENV_ZENML_ENFORCE_TYPE_ANNOTATIONS = "ZENML_ENFORCE_TYPE_ANNOTATIONS"
 ENV_ZENML_ENABLE_IMPLICIT_AUTH_METHODS = "ZENML_ENABLE_IMPLICIT_AUTH_METHODS"
 ENV_ZENML_DISABLE_STEP_LOGS_STORAGE = "ZENML_DISABLE_STEP_LOGS_STORAGE"
+ENV_ZENML_DISABLE_COMPILATION_CACHE = "ZENML_DISABLE_COMPILATION_CACHE"
 ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES = (
     "ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES"
 )
 ENV_ZENML_IGNORE_FAILURE_HOOK = "ZENML_IGNORE_FAILURE_HOOK"
 ENV_ZENML_CUSTOM_SOURCE_ROOT = "ZENML_CUSTOM_SOURCE_ROOT"
 ENV_ZENML_WHEEL_PACKAGE_NAME = "ZENML_WHEEL_PACKAGE_NAME"
+ENV_ZENML_STACK_CACHE_SIZE = "ZENML_STACK_CACHE_SIZE"
+ENV_ZENML_STACK_CACHE_TTL = "ZENML_STACK_CACHE_TTL"
+ENV_ZENML_STACK_COMPONENT_CACHE_SIZE = "ZENML_STACK_COMPONENT_CACHE_SIZE"
+ENV_ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_SIZE = (
+    "ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_SIZE"
+)
+ENV_ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_TTL = (
+    "ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_TTL"
+)
+ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_WORKERS = (
+    "ZENML_SERVICE_CONNECTOR_RESOURCES_WORKERS"
+)
+ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_TIMEOUT = (
+    "ZENML_SERVICE_CONNECTOR_RESOURCES_TIMEOUT"
+)
+ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_CACHE_TTL = (
+    "ZENML_SERVICE_CONNECTOR_RESOURCES_CACHE_TTL"
+)
+ENV_ZENML_DOCKER_BUILD_CONCURRENCY = "ZENML_DOCKER_BUILD_CONCURRENCY"
+ENV_ZENML_IMAGE_REUSE_BUILD_LOOKBACK = "ZENML_IMAGE_REUSE_BUILD_LOOKBACK"
+ENV_ZENML_SECRET_CACHE_SIZE = "ZENML_SECRET_CACHE_SIZE"
+ENV_ZENML_SECRET_CACHE_TTL = "ZENML_SECRET_CACHE_TTL"
+ENV_ZENML_SECRETS_BATCH_WORKERS = "ZENML_SECRETS_BATCH_WORKERS"
+ENV_ZENML_SOURCE_CACHE_SIZE = "ZENML_SOURCE_CACHE_SIZE"
+ENV_ZENML_COMPILATION_CACHE_SIZE = "ZENML_COMPILATION_CACHE_SIZE"
 
 # ZenML Server environment variables
 ENV_ZENML_SERVER_PREFIX = "ZENML_SERVER_"
@@ -210,7 +237,9 @@ VALID_OPERATING_SYSTEMS = ["Windows", "Darwin", "Linux"]
 REMOTE_FS_PREFIX = ["gs://", "hdfs://", "s3://", "az://", "abfs://"]
 
 # ZenML Analytics Server - URL
-ANALYTICS_SERVER_URL = "https://analytics.zenml.io/"
+ANALYTICS_SERVER_URL = os.getenv(
+    ENV_ZENML_ANALYTICS_SERVER_URL, "https://analytics.zenml.io/"
+)
 
 # Container utils
 SHOULD_PREVENT_PIPELINE_EXECUTION = handle_bool_env_var(
@@ -271,6 +300,9 @@ ZENML_API_KEY_PREFIX = "ZENKEY_"
 DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW = 60 * 48  # 48 hours
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE = 5
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY = 1000
+DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_CACHE_TTL = 60  # seconds
+DEFAULT_ZENML_SERVER_EVENT_HUB_WORKERS = 4
+DEFAULT_ZENML_SERVER_EVENT_HUB_QUEUE_SIZE = 100
 
 DEFAULT_ZENML_SERVER_SECURE_HEADERS_HSTS = (
     "max-age=63072000; includeSubdomains"
@@ -338,6 +370,8 @@ API_TOKEN = "/api_token"
 ARTIFACTS = "/artifacts"
 ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
+BATCH = "/batch"
+BEGIN = "/begin"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
@@ -410,6 +444,14 @@ MODEL_METADATA_YAML_FILE_NAME = "model_metadata.yaml"
 
 # orchestrator constants
 ORCHESTRATOR_DOCKER_IMAGE_KEY = "orchestrator"
+# Maximum number of Docker images to build in parallel for a pipeline build
+DOCKER_BUILD_CONCURRENCY = handle_int_env_var(
+    ENV_ZENML_DOCKER_BUILD_CONCURRENCY, default=4
+)
+# Number of previous builds in which to look for images to reuse
+IMAGE_REUSE_BUILD_LOOKBACK = handle_int_env_var(
+    ENV_ZENML_IMAGE_REUSE_BUILD_LOOKBACK, default=20
+)
 PIPELINE_API_TOKEN_EXPIRES_MINUTES = handle_int_env_var(
     ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES,
     default=60 * 24,  # 24 hours
@@ -417,6 +459,38 @@ PIPELINE_API_TOKEN_EXPIRES_MINUTES = handle_int_env_var(
 
 # Secret constants
 SECRET_VALUES = "values"
+# Per-process cache of resolved secrets. Set the TTL to 0 to disable it.
+SECRET_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SECRET_CACHE_SIZE, default=128
+)
+SECRET_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SECRET_CACHE_TTL, default=60
+)
+# Secret values fetched concurrently when getting multiple secrets at once
+SECRETS_BATCH_WORKERS: int = handle_int_env_var(
+    ENV_ZENML_SECRETS_BATCH_WORKERS, default=8
+)
+
+# Stack and stack component instance cache
+STACK_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_STACK_CACHE_SIZE, default=32
+)
+STACK_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_STACK_CACHE_TTL, default=60 * 60
+)
+STACK_COMPONENT_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_STACK_COMPONENT_CACHE_SIZE, default=128
+)
+
+# Cache of resolved and loaded sources
+SOURCE_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SOURCE_CACHE_SIZE, default=1024
+)
+
+# Cache of compiled pipeline deployments. Set the size to 0 to disable it.
+COMPILATION_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_COMPILATION_CACHE_SIZE, default=16
+)
 
 # Pagination and filtering defaults
 PAGINATION_STARTING_PAGE: int = 1
@@ -484,6 +558,23 @@ LATEST_MODEL_VERSION_PLACEHOLDER = "__latest__"
 
 # Service connector constants
 SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS = 60 * 5  # 5 minutes
+SERVICE_CONNECTOR_CLIENT_CACHE_SIZE = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_SIZE, default=256
+)
+# Upper bound for caching clients with credentials that don't expire
+SERVICE_CONNECTOR_CLIENT_CACHE_TTL = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_CLIENT_CACHE_TTL, default=60 * 60
+)
+# Resource discovery across multiple service connectors
+SERVICE_CONNECTOR_RESOURCES_WORKERS = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_WORKERS, default=8
+)
+SERVICE_CONNECTOR_RESOURCES_TIMEOUT = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_TIMEOUT, default=60
+)
+SERVICE_CONNECTOR_RESOURCES_CACHE_TTL = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_RESOURCES_CACHE_TTL, default=60
+)
 
 # Versioned entities
 MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION = (
@@ -145,11 +145,6 @@ class BaseEventHub(ABC):
         )
 
         try:
-            # TODO: We need to make this async, as this might take quite some
-            # time per trigger. We can either use threads starting here, or
-            # use fastapi background tasks that get passed here instead of
-            # running the event hub as a background tasks in the webhook
-            # endpoints
             action_callback(
                 action_config,
                 trigger_execution,
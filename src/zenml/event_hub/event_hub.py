@@ -13,18 +13,23 @@
 #  permissions and limitations under the License.
 """Base class for all the Event Hub."""
 
-from typing import List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 
 from pydantic import ValidationError
 
 from zenml import EventSourceResponse
 from zenml.enums import PluginType
-from zenml.event_hub.base_event_hub import BaseEventHub
+from zenml.event_hub.base_event_hub import ActionHandlerCallback, BaseEventHub
 from zenml.event_sources.base_event import (
     BaseEvent,
 )
 from zenml.event_sources.base_event_source import (
     BaseEventSourceFlavor,
+    EventFilterConfig,
 )
 from zenml.logger import get_logger
 from zenml.models import (
@@ -32,19 +37,67 @@ from zenml.models import (
     TriggerResponse,
 )
 from zenml.utils.pagination_utils import depaginate
-from zenml.zen_server.utils import plugin_flavor_registry
+from zenml.zen_server.utils import plugin_flavor_registry, server_config
 
 logger = get_logger(__name__)
 
 
+class TriggerIndexEntry:
+    """Compiled event filters of all active triggers of an event source."""
+
+    def __init__(
+        self,
+        filters: List[Tuple[UUID, EventFilterConfig]],
+    ) -> None:
+        """Initialize the entry.
+
+        Args:
+            filters: Tuples of trigger ID and the validated event filter of
+                the trigger.
+        """
+        self.filters = filters
+        self.created = time.monotonic()
+
+    def is_expired(self, ttl: float) -> bool:
+        """Check if the entry is older than the given TTL.
+
+        Args:
+            ttl: The time to live of the entry in seconds.
+
+        Returns:
+            Whether the entry is expired.
+        """
+        return time.monotonic() - self.created > ttl
+
+
 class InternalEventHub(BaseEventHub):
     """Internal in-server event hub implementation.
 
     The internal in-server event hub uses the database as a source of truth for
     configured triggers and triggers actions by calling the action handlers
     directly.
+
+    To avoid fetching and validating all active triggers of an event source
+    for every incoming event, the event filters of the triggers are compiled
+    once and kept in an in-memory index per event source. The index is
+    invalidated when triggers are activated or deactivated through the event
+    hub and expires after a configurable TTL to pick up changes made by other
+    server replicas. Matching actions are executed by a bounded pool of
+    worker threads.
     """
 
+    def __init__(self) -> None:
+        """Initialize the event hub."""
+        self._trigger_index: Dict[UUID, TriggerIndexEntry] = {}
+        # Incremented whenever the index entry of an event source is
+        # invalidated, so entries compiled before an invalidation are not
+        # stored afterwards.
+        self._trigger_index_generations: Dict[UUID, int] = {}
+        self._trigger_index_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue_slots: Optional[threading.BoundedSemaphore] = None
+        self._executor_lock = threading.Lock()
+
     def activate_trigger(self, trigger: TriggerResponse) -> None:
         """Add a trigger to the event hub.
 
@@ -53,9 +106,10 @@ class InternalEventHub(BaseEventHub):
         Args:
             trigger: the trigger to activate.
         """
-        # We don't need to do anything here to change the event hub
-        # configuration. The in-server event hub already uses the database
-        # as the source of truth regarding configured active triggers.
+        # The database is the source of truth regarding configured active
+        # triggers, we only need to make sure that the trigger index is
+        # rebuilt the next time an event is received.
+        self._invalidate_trigger_index(trigger)
 
     def deactivate_trigger(self, trigger: TriggerResponse) -> None:
         """Remove a trigger from the event hub.
@@ -66,9 +120,30 @@ class InternalEventHub(BaseEventHub):
         Args:
             trigger: the trigger to deactivate.
         """
-        # We don't need to do anything here to change the event hub
-        # configuration. The in-server event hub already uses the database
-        # as the source of truth regarding configured active triggers.
+        self._invalidate_trigger_index(trigger)
+
+    def _invalidate_trigger_index(self, trigger: TriggerResponse) -> None:
+        """Invalidate the cached triggers of the event source of a trigger.
+
+        Args:
+            trigger: The trigger that changed.
+        """
+        if trigger.event_source is None:
+            # Triggers without an event source are not indexed
+            return
+        self._remove_trigger_index_entry(trigger.event_source.id)
+
+    def _remove_trigger_index_entry(self, event_source_id: UUID) -> None:
+        """Remove the trigger index entry of an event source.
+
+        Args:
+            event_source_id: The ID of the event source.
+        """
+        with self._trigger_index_lock:
+            self._trigger_index.pop(event_source_id, None)
+            self._trigger_index_generations[event_source_id] = (
+                self._trigger_index_generations.get(event_source_id, 0) + 1
+            )
 
     def publish_event(
         self,
@@ -101,7 +176,7 @@ class InternalEventHub(BaseEventHub):
                 )
                 continue
 
-            self.trigger_action(
+            self._dispatch_action(
                 event=event,
                 event_source=event_source,
                 trigger=trigger,
@@ -122,39 +197,110 @@ class InternalEventHub(BaseEventHub):
         Returns:
             The list of matching triggers.
         """
-        # get all event sources configured for this flavor
-        triggers: List[TriggerResponse] = depaginate(
-            self.zen_store.list_triggers,
-            trigger_filter_model=TriggerFilter(
-                event_source_id=event_source.id, is_active=True
-            ),
-            hydrate=True,
-        )
+        entry = self._get_trigger_index_entry(event_source=event_source)
 
         trigger_list: List[TriggerResponse] = []
+        for trigger_id, event_filter in entry.filters:
+            if not event_filter.event_matches_filter(event=event):
+                continue
 
-        for trigger in triggers:
-            # For now, the matching of trigger filters vs event is implemented
-            # in each filter class. This is not ideal and should be refactored
-            # to a more generic solution that doesn't require the plugin
-            # implementation to be imported here.
+            # Only the matching triggers are fetched from the database. This
+            # makes sure the trigger action configuration is up-to-date and
+            # the trigger is still active.
             try:
-                plugin_flavor = plugin_flavor_registry().get_flavor_class(
-                    name=event_source.flavor,
-                    _type=PluginType.EVENT_SOURCE,
-                    subtype=event_source.plugin_subtype,
+                trigger = self.zen_store.get_trigger(
+                    trigger_id=trigger_id, hydrate=True
                 )
             except KeyError:
-                logger.exception(
-                    f"Could not find plugin flavor for event source "
-                    f"{event_source.id} and flavor {event_source.flavor}. "
-                    f"Skipping trigger {trigger.id}."
-                )
+                # The trigger was deleted through another server replica
+                self._remove_trigger_index_entry(event_source.id)
                 continue
 
-            assert issubclass(plugin_flavor, BaseEventSourceFlavor)
+            if trigger.is_active:
+                trigger_list.append(trigger)
+
+        logger.debug(
+            f"For event {event} and event source {event_source}, "
+            f"the following triggers matched: {trigger_list}"
+        )
+
+        return trigger_list
+
+    def _get_trigger_index_entry(
+        self, event_source: EventSourceResponse
+    ) -> TriggerIndexEntry:
+        """Get the compiled event filters for the triggers of an event source.
+
+        Args:
+            event_source: The event source.
+
+        Returns:
+            The trigger index entry of the event source.
+        """
+        ttl = server_config().event_hub_trigger_cache_ttl
+        with self._trigger_index_lock:
+            entry = self._trigger_index.get(event_source.id)
+            if entry is not None and not entry.is_expired(ttl):
+                return entry
+            generation = self._trigger_index_generations.get(
+                event_source.id, 0
+            )
+
+        entry = TriggerIndexEntry(
+            filters=self._compile_trigger_filters(event_source=event_source)
+        )
+        with self._trigger_index_lock:
+            # If the entry was invalidated while compiling, it might be stale
+            # and gets compiled again for the next event instead
+            if generation == self._trigger_index_generations.get(
+                event_source.id, 0
+            ):
+                self._trigger_index[event_source.id] = entry
+        return entry
+
+    def _compile_trigger_filters(
+        self, event_source: EventSourceResponse
+    ) -> List[Tuple[UUID, EventFilterConfig]]:
+        """Validate the event filters of all active triggers of an event source.
+
+        Args:
+            event_source: The event source.
+
+        Returns:
+            Tuples of trigger ID and the validated event filter of the trigger.
+        """
+        # For now, the matching of trigger filters vs event is implemented
+        # in each filter class. This is not ideal and should be refactored
+        # to a more generic solution that doesn't require the plugin
+        # implementation to be imported here.
+        try:
+            plugin_flavor = plugin_flavor_registry().get_flavor_class(
+                name=event_source.flavor,
+                _type=PluginType.EVENT_SOURCE,
+                subtype=event_source.plugin_subtype,
+            )
+        except KeyError:
+            logger.exception(
+                f"Could not find plugin flavor for event source "
+                f"{event_source.id} and flavor {event_source.flavor}. "
+                f"Skipping all triggers of this event source."
+            )
+            return []
 
-            event_filter_config_class = plugin_flavor.EVENT_FILTER_CONFIG_CLASS
+        assert issubclass(plugin_flavor, BaseEventSourceFlavor)
+        event_filter_config_class = plugin_flavor.EVENT_FILTER_CONFIG_CLASS
+
+        # get all active triggers configured for this event source
+        triggers: List[TriggerResponse] = depaginate(
+            self.zen_store.list_triggers,
+            trigger_filter_model=TriggerFilter(
+                event_source_id=event_source.id, is_active=True
+            ),
+            hydrate=True,
+        )
+
+        filters: List[Tuple[UUID, EventFilterConfig]] = []
+        for trigger in triggers:
             try:
                 event_filter = event_filter_config_class(
                     **trigger.event_filter if trigger.event_filter else {}
@@ -167,15 +313,84 @@ class InternalEventHub(BaseEventHub):
                 )
                 continue
 
-            if event_filter.event_matches_filter(event=event):
-                trigger_list.append(trigger)
+            filters.append((trigger.id, event_filter))
 
-        logger.debug(
-            f"For event {event} and event source {event_source}, "
-            f"the following triggers matched: {trigger_list}"
+        return filters
+
+    def _dispatch_action(
+        self,
+        event: BaseEvent,
+        event_source: EventSourceResponse,
+        trigger: TriggerResponse,
+        action_callback: ActionHandlerCallback,
+    ) -> None:
+        """Execute the action of a trigger in one of the worker threads.
+
+        If all workers are busy and the queue is full, the action is executed
+        synchronously in the calling thread instead, which throttles the
+        event producer.
+
+        Args:
+            event: The event.
+            event_source: The event source that produced the event.
+            trigger: The trigger that was activated.
+            action_callback: The action to trigger.
+        """
+        executor, queue_slots = self._get_executor()
+
+        if not queue_slots.acquire(blocking=False):
+            logger.warning(
+                "The event hub action queue is full. Executing the action of "
+                f"trigger {trigger.id} synchronously."
+            )
+            self.trigger_action(
+                event=event,
+                event_source=event_source,
+                trigger=trigger,
+                action_callback=action_callback,
+            )
+            return
+
+        def _release_slot(future: "Future[None]") -> None:
+            queue_slots.release()
+            if exception := future.exception():
+                # Errors raised before the action itself is executed would
+                # otherwise only be stored in the future
+                logger.error(
+                    f"Failed to execute the action of trigger {trigger.id}: "
+                    f"{exception}",
+                    exc_info=exception,
+                )
+
+        future = executor.submit(
+            self.trigger_action,
+            event=event,
+            event_source=event_source,
+            trigger=trigger,
+            action_callback=action_callback,
         )
+        future.add_done_callback(_release_slot)
 
-        return trigger_list
+    def _get_executor(
+        self,
+    ) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        """Get the worker pool used to execute actions.
+
+        Returns:
+            The worker pool and the semaphore bounding the number of queued
+            and running actions.
+        """
+        with self._executor_lock:
+            if self._executor is None or self._queue_slots is None:
+                config = server_config()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=config.event_hub_workers,
+                    thread_name_prefix="zenml-event-hub",
+                )
+                self._queue_slots = threading.BoundedSemaphore(
+                    config.event_hub_workers + config.event_hub_queue_size
+                )
+            return self._executor, self._queue_slots
 
 
 event_hub = InternalEventHub()
@@ -13,7 +13,6 @@
 #  permissions and limitations under the License.
 """Base class for all ZenML image builders."""
 
-import hashlib
 import os
 import tempfile
 from abc import ABC, abstractmethod
@@ -103,6 +102,10 @@ class BaseImageBuilder(StackComponent, ABC):
     ) -> str:
         """Uploads a Docker image build context to a remote location.
 
+        The uploaded archive is named after the checksum of the content of the
+        build context. If an archive for the same content was uploaded by a
+        previous build, the archive is neither created nor uploaded again.
+
         Args:
             build_context: The build context to upload.
             parent_path_directory_name: The name of the directory to upload
@@ -117,25 +120,21 @@ class BaseImageBuilder(StackComponent, ABC):
         parent_path = f"{artifact_store.path}/{parent_path_directory_name}"
         fileio.makedirs(parent_path)
 
-        hash_ = hashlib.sha1()  # nosec
+        filename = f"{build_context.compute_checksum()}.tar.gz"
+        filepath = f"{parent_path}/{filename}"
+        if fileio.exists(filepath):
+            logger.info("Build context already exists, not uploading.")
+            return filepath
+
         with tempfile.NamedTemporaryFile(mode="w+b", delete=False) as f:
             build_context.write_archive(f, use_gzip=True)
 
-            while True:
-                data = f.read(64 * 1024)
-                if not data:
-                    break
-                hash_.update(data)
-
-            filename = f"{hash_.hexdigest()}.tar.gz"
-            filepath = f"{parent_path}/{filename}"
-            if not fileio.exists(filepath):
-                logger.info("Uploading build context to `%s`.", filepath)
-                fileio.copy(f.name, filepath)
-            else:
-                logger.info("Build context already exists, not uploading.")
-
-        os.unlink(f.name)
+        try:
+            logger.info("Uploading build context to `%s`.", filepath)
+            fileio.copy(f.name, filepath)
+        finally:
+            os.unlink(f.name)
+
         return filepath
 
 
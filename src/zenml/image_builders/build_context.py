@@ -13,17 +13,55 @@
 #  permissions and limitations under the License.
 """Image build context."""
 
+import hashlib
 import os
-from typing import IO, Dict, List, Optional, Set, cast
+import stat
+from typing import IO, Dict, List, Optional, Set, Tuple, cast
 
 from zenml.constants import REPOSITORY_DIRECTORY_NAME
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.utils import io_utils, string_utils
 from zenml.utils.archivable import Archivable
+from zenml.utils.cache_utils import LRUCache
 
 logger = get_logger(__name__)
 
+# Digests of files in build contexts, keyed by the file path, size and
+# modification time. Files that haven't changed between builds only need to
+# be hashed once.
+_FILE_DIGEST_CACHE: LRUCache[Tuple[str, int, int], str] = LRUCache(
+    maxsize=100000
+)
+
+
+def _get_file_digest(path: str, stat_result: os.stat_result) -> str:
+    """Gets the digest of a file.
+
+    Args:
+        path: Path of the file.
+        stat_result: The result of `os.stat` for the file.
+
+    Returns:
+        The SHA256 digest of the file content.
+    """
+    key = (
+        os.path.abspath(path),
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+    )
+    if digest := _FILE_DIGEST_CACHE.get(key):
+        return digest
+
+    hash_ = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hash_.update(chunk)
+
+    digest = hash_.hexdigest()
+    _FILE_DIGEST_CACHE.set(key, digest)
+    return digest
+
 
 class BuildContext(Archivable):
     """Image build context.
@@ -107,6 +145,45 @@ class BuildContext(Archivable):
                 os.path.join(self._root, ".dockerignore"),
             )
 
+    def compute_checksum(self) -> str:
+        """Computes a checksum of the content of the build context.
+
+        The checksum only depends on the paths, permissions and content of
+        the files in the build context. Unlike a hash of the archive, it does
+        not change when files are touched without being modified, and the
+        digests of unchanged files are reused across builds.
+
+        Returns:
+            The checksum of the build context.
+        """
+        hash_ = hashlib.sha256()
+        extra_files = self.get_extra_files()
+
+        for archive_path, file_path in sorted(self.get_files().items()):
+            if archive_path in extra_files:
+                continue
+
+            stat_result = os.lstat(file_path)
+            if stat.S_ISREG(stat_result.st_mode):
+                content_digest = _get_file_digest(file_path, stat_result)
+            elif stat.S_ISLNK(stat_result.st_mode):
+                content_digest = f"link:{os.readlink(file_path)}"
+            else:
+                content_digest = (
+                    "dir" if stat.S_ISDIR(stat_result.st_mode) else ""
+                )
+
+            hash_.update(
+                f"{archive_path}\0{stat.S_IMODE(stat_result.st_mode):o}\0"
+                f"{content_digest}\0".encode()
+            )
+
+        for archive_path, contents in sorted(extra_files.items()):
+            hash_.update(f"{archive_path}\0extra\0".encode())
+            hash_.update(hashlib.sha256(contents.encode("utf-8")).digest())
+
+        return hash_.hexdigest()
+
     def get_files(self) -> Dict[str, str]:
         """Gets all regular files that should be included in the archive.
 
@@ -21,6 +21,7 @@ from zenml.io import local_filesystem  # noqa
 from zenml.io.filesystem import BaseFilesystem, PathType
 from zenml.io.filesystem_registry import default_filesystem_registry
 from zenml.logger import get_logger
+from zenml.utils import profiling_utils
 
 logger = get_logger(__name__)
 
@@ -62,7 +63,11 @@ def open(path: "PathType", mode: str = "r") -> Any:  # noqa
     Returns:
         The opened file.
     """
-    return _get_filesystem(path).open(path, mode=mode)
+    file = _get_filesystem(path).open(path, mode=mode)
+    if profiler := profiling_utils.get_active_profiler():
+        # Count the bytes read and written while a step is profiled
+        file = profiler.wrap_file(file)
+    return file
 
 
 def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
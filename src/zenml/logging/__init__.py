@@ -22,3 +22,13 @@ STEP_LOGS_STORAGE_MAX_MESSAGES: int = 100
 
 # How often to merge logs into a single file
 STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS: int = 10 * 60
+
+# How often to check whether buffered logs need to be uploaded if the step
+# doesn't write anything
+STEP_LOGS_STORAGE_FLUSH_CHECK_INTERVAL_SECONDS: float = 1.0
+
+# How many bytes of logs to read at once when tailing logs
+STEP_LOGS_TAIL_CHUNK_SIZE: int = 1024 * 1024
+
+# How many seconds to wait before polling for new logs when following logs
+STEP_LOGS_TAIL_POLL_INTERVAL_SECONDS: float = 2.0
@@ -13,14 +13,27 @@
 #  permissions and limitations under the License.
 """ZenML logging handler."""
 
+import codecs
 import datetime
 import os
 import re
 import sys
+import threading
 import time
 from contextvars import ContextVar
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from zenml.artifact_stores import BaseArtifactStore
@@ -32,18 +45,26 @@ from zenml.client import Client
 from zenml.exceptions import DoesNotExistException
 from zenml.logger import get_logger
 from zenml.logging import (
+    STEP_LOGS_STORAGE_FLUSH_CHECK_INTERVAL_SECONDS,
     STEP_LOGS_STORAGE_INTERVAL_SECONDS,
     STEP_LOGS_STORAGE_MAX_MESSAGES,
     STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
+    STEP_LOGS_TAIL_CHUNK_SIZE,
+    STEP_LOGS_TAIL_POLL_INTERVAL_SECONDS,
 )
+from zenml.utils import profiling_utils
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
+if TYPE_CHECKING:
+    from zenml.models import StepRunResponse
+
 # Get the logger
 logger = get_logger(__name__)
 
 redirected: ContextVar[bool] = ContextVar("redirected", default=False)
 
 LOGS_EXTENSION = ".log"
+MERGED_LOGS_SUFFIX = "_merged"
 
 
 def remove_ansi_escape_codes(text: str) -> str:
@@ -59,15 +80,18 @@ def remove_ansi_escape_codes(text: str) -> str:
     return ansi_escape.sub("", text)
 
 
-def prepare_logs_uri(
+def get_logs_uri(
     artifact_store: "BaseArtifactStore",
     step_name: str,
     log_key: Optional[str] = None,
 ) -> str:
-    """Generates and prepares a URI for the log file or folder for a step.
+    """Generates a URI for the log file or folder for a step.
+
+    This does not access the artifact store, use `prepare_logs_storage(...)`
+    before writing logs to the URI.
 
     Args:
-        artifact_store: The artifact store on which the artifact will be stored.
+        artifact_store: The artifact store on which the logs will be stored.
         step_name: Name of the step.
         log_key: The unique identification key of the log file.
 
@@ -82,6 +106,22 @@ def prepare_logs_uri(
         step_name,
         "logs",
     )
+    if artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+        return os.path.join(logs_base_uri, log_key)
+    else:
+        return os.path.join(logs_base_uri, f"{log_key}{LOGS_EXTENSION}")
+
+
+def prepare_logs_storage(
+    artifact_store: "BaseArtifactStore", logs_uri: str
+) -> None:
+    """Prepares the artifact store for writing logs to a URI.
+
+    Args:
+        artifact_store: The artifact store on which the logs will be stored.
+        logs_uri: The URI of the log storage (file or folder).
+    """
+    logs_base_uri = os.path.dirname(logs_uri)
 
     # Create the dir
     if not artifact_store.exists(logs_base_uri):
@@ -89,23 +129,108 @@ def prepare_logs_uri(
 
     # Delete the file if it already exists
     if artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-        logs_uri_folder = os.path.join(logs_base_uri, log_key)
-        if artifact_store.exists(logs_uri_folder):
+        if artifact_store.exists(logs_uri):
             logger.warning(
-                f"Logs directory {logs_uri_folder} already exists! Removing old log directory..."
+                f"Logs directory {logs_uri} already exists! Removing old log directory..."
             )
-            artifact_store.rmtree(logs_uri_folder)
+            artifact_store.rmtree(logs_uri)
 
-        artifact_store.makedirs(logs_uri_folder)
-        return logs_uri_folder
+        artifact_store.makedirs(logs_uri)
     else:
-        logs_uri = os.path.join(logs_base_uri, f"{log_key}{LOGS_EXTENSION}")
         if artifact_store.exists(logs_uri):
             logger.warning(
                 f"Logs file {logs_uri} already exists! Removing old log file..."
             )
             artifact_store.remove(logs_uri)
-        return logs_uri
+
+
+def prepare_logs_uri(
+    artifact_store: "BaseArtifactStore",
+    step_name: str,
+    log_key: Optional[str] = None,
+) -> str:
+    """Generates and prepares a URI for the log file or folder for a step.
+
+    Args:
+        artifact_store: The artifact store on which the artifact will be stored.
+        step_name: Name of the step.
+        log_key: The unique identification key of the log file.
+
+    Returns:
+        The URI of the log storage (file or folder).
+    """
+    logs_uri = get_logs_uri(
+        artifact_store=artifact_store, step_name=step_name, log_key=log_key
+    )
+    prepare_logs_storage(artifact_store=artifact_store, logs_uri=logs_uri)
+    return logs_uri
+
+
+def _get_log_file_timestamps(file_name: str) -> Optional[Tuple[str, str]]:
+    """Gets the timestamps of the first and last write of a log file.
+
+    On immutable filesystems, log files are named after the time at which they
+    were written and merged files after the first and last file they contain.
+
+    Args:
+        file_name: The name of the log file.
+
+    Returns:
+        The timestamps of the first and last write, or `None` if the file is
+        not named after them.
+    """
+    stem = file_name
+    for suffix in (LOGS_EXTENSION, MERGED_LOGS_SUFFIX):
+        if stem.endswith(suffix):
+            stem = stem[: -len(suffix)]
+
+    start, _, end = stem.partition("-")
+    end = end or start
+    try:
+        float(start)
+        float(end)
+    except ValueError:
+        return None
+    return start, end
+
+
+def _list_log_files(
+    artifact_store: "BaseArtifactStore", logs_uri: str
+) -> List[str]:
+    """Lists the files of a logs folder in the order in which they were written.
+
+    While log files get merged, the merged file already exists next to the
+    files it contains. These are skipped, so no logs are read twice.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the logs folder.
+
+    Returns:
+        The names of the log files.
+    """
+    files = sorted(str(file) for file in artifact_store.listdir(logs_uri))
+    ranges: Dict[str, Tuple[float, float]] = {}
+    for file in files:
+        if timestamps := _get_log_file_timestamps(file):
+            ranges[file] = (float(timestamps[0]), float(timestamps[1]))
+
+    merged_ranges = [
+        file_range
+        for file, file_range in ranges.items()
+        if file.endswith(MERGED_LOGS_SUFFIX + LOGS_EXTENSION)
+    ]
+
+    def _is_merged(file: str) -> bool:
+        file_range = ranges.get(file)
+        return file_range is not None and any(
+            start <= file_range[0]
+            and file_range[1] <= end
+            and (start, end) != file_range
+            for start, end in merged_ranges
+        )
+
+    return [file for file in files if not _is_merged(file)]
 
 
 def fetch_logs(
@@ -150,7 +275,7 @@ def fetch_logs(
         if not artifact_store.isdir(logs_uri):
             return _read_file(logs_uri, offset, length)
         else:
-            files = artifact_store.listdir(logs_uri)
+            files = _list_log_files(artifact_store, logs_uri)
             if len(files) == 1:
                 return _read_file(
                     os.path.join(logs_uri, str(files[0])), offset, length
@@ -206,8 +331,176 @@ def fetch_logs(
         artifact_store.cleanup()
 
 
+def read_logs_chunk(
+    artifact_store: "BaseArtifactStore",
+    logs_uri: str,
+    offset: int,
+    length: int,
+) -> bytes:
+    """Reads a chunk of raw log data from the artifact store.
+
+    The offset refers to the bytes of all log files of the URI in the order in
+    which they were written, which stays the same when the log files of
+    immutable filesystems get merged.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the log file or folder.
+        offset: The byte offset from which to start reading.
+        length: The maximum amount of bytes to read.
+
+    Returns:
+        The log data. This is empty if no logs were written after the offset
+        yet.
+    """
+    if not artifact_store.exists(logs_uri):
+        return b""
+
+    if not artifact_store.isdir(logs_uri):
+        try:
+            return bytes(
+                _load_file_from_artifact_store(
+                    logs_uri,
+                    artifact_store=artifact_store,
+                    mode="rb",
+                    offset=offset,
+                    length=length,
+                )
+            )
+        except DoesNotExistException:
+            return b""
+
+    chunks: List[bytes] = []
+    for file in _list_log_files(artifact_store, logs_uri):
+        file_uri = os.path.join(logs_uri, file)
+        file_size = artifact_store.size(file_uri) or 0
+        if offset >= file_size:
+            offset -= file_size
+            continue
+
+        try:
+            chunk = bytes(
+                _load_file_from_artifact_store(
+                    file_uri,
+                    artifact_store=artifact_store,
+                    mode="rb",
+                    offset=offset,
+                    length=length,
+                )
+            )
+        except DoesNotExistException:
+            # The file was merged while reading, the following files will be
+            # read from the merged file when tailing the logs again
+            break
+
+        chunks.append(chunk)
+        offset = 0
+        length -= len(chunk)
+        if length <= 0:
+            break
+
+    return b"".join(chunks)
+
+
+def tail_logs(
+    artifact_store: "BaseArtifactStore",
+    logs_uri: str,
+    offset: int = 0,
+    follow: Optional[Callable[[], bool]] = None,
+    chunk_size: int = STEP_LOGS_TAIL_CHUNK_SIZE,
+    poll_interval: float = STEP_LOGS_TAIL_POLL_INTERVAL_SECONDS,
+) -> Iterator[str]:
+    """Incrementally reads logs from the artifact store.
+
+    The logs are read in chunks of bounded size, so the memory usage does not
+    depend on the size of the logs.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the log file or folder.
+        offset: The byte offset from which to start reading.
+        follow: Optional function which returns whether more logs might still
+            get written. If given, new logs are polled until it returns
+            `False`.
+        chunk_size: The maximum amount of bytes to read at once.
+        poll_interval: The amount of seconds to wait before polling for new
+            logs.
+
+    Yields:
+        The logs, split into chunks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        # Check this before reading, so that logs which were written before
+        # the writer finished are always read
+        keep_following = follow() if follow else False
+
+        while True:
+            chunk = read_logs_chunk(
+                artifact_store=artifact_store,
+                logs_uri=logs_uri,
+                offset=offset,
+                length=chunk_size,
+            )
+            offset += len(chunk)
+            if text := decoder.decode(chunk):
+                yield text
+            if len(chunk) < chunk_size:
+                break
+
+        if not keep_following:
+            break
+        time.sleep(poll_interval)
+
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+def tail_step_logs(
+    step_run: "StepRunResponse", offset: int = 0, follow: bool = False
+) -> Iterator[str]:
+    """Incrementally reads the logs of a step run.
+
+    Args:
+        step_run: The step run for which to read the logs.
+        offset: The byte offset from which to start reading.
+        follow: If True, new logs are polled until the step run is finished.
+
+    Yields:
+        The logs, split into chunks.
+
+    Raises:
+        KeyError: If no logs are available for the step run.
+    """
+    logs = step_run.logs
+    if logs is None:
+        raise KeyError(f"No logs available for step '{step_run.name}'.")
+
+    zen_store = Client().zen_store
+
+    def _is_running() -> bool:
+        status = zen_store.get_run_step(step_run.id, hydrate=False).status
+        return not status.is_finished
+
+    artifact_store = _load_artifact_store(logs.artifact_store_id, zen_store)
+    try:
+        yield from tail_logs(
+            artifact_store=artifact_store,
+            logs_uri=logs.uri,
+            offset=offset,
+            follow=_is_running if follow else None,
+        )
+    finally:
+        artifact_store.cleanup()
+
+
 class StepLogsStorage:
-    """Helper class which buffers and stores logs to a given URI."""
+    """Helper class which buffers and stores logs to a given URI.
+
+    Besides the writes of the step, a background thread stores the buffer
+    once the time interval passed, so logs become visible even if the step
+    does not write anything else for a long time.
+    """
 
     def __init__(
         self,
@@ -234,11 +527,17 @@ class StepLogsStorage:
 
         # State
         self.buffer: List[str] = []
-        self.disabled_buffer: List[str] = []
         self.last_save_time = time.time()
-        self.disabled = False
         self._artifact_store: Optional["BaseArtifactStore"] = None
 
+        # The buffer is shared between all threads writing to stdout/stderr
+        # and the flush thread, while only one of them saves it at a time.
+        self._buffer_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._saving = threading.local()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stop_flushing = threading.Event()
+
         # Immutable filesystems state
         self.last_merge_time = time.time()
 
@@ -262,9 +561,14 @@ class StepLogsStorage:
         if text == "\n":
             return
 
-        if not self.disabled:
+        if getattr(self._saving, "active", False):
+            # Messages emitted while saving the logs would trigger another
+            # save and cause an infinite loop
+            return
+
+        with self._buffer_lock:
             self.buffer.append(text)
-            self.save_to_file()
+        self.save_to_file()
 
     @property
     def _is_write_needed(self) -> bool:
@@ -278,6 +582,18 @@ class StepLogsStorage:
             or time.time() - self.last_save_time >= self.time_interval
         )
 
+    @property
+    def _is_merge_needed(self) -> bool:
+        """Checks whether the log files need to be merged.
+
+        Returns:
+            whether the log files need to be merged.
+        """
+        return (
+            self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
+            and time.time() - self.last_merge_time > self.merge_files_interval
+        )
+
     def _get_timestamped_filename(self, suffix: str = "") -> str:
         """Returns a timestamped filename.
 
@@ -295,65 +611,112 @@ class StepLogsStorage:
         Args:
             force: whether to force a save even if the write conditions not met.
         """
-        if not self.disabled and (self._is_write_needed or force):
-            # IMPORTANT: keep this as the first code line in this method! The
-            # code that follows might still emit logging messages, which will
-            # end up triggering this method again, causing an infinite loop.
-            self.disabled = True
-
-            try:
-                if self.buffer:
-                    if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-                        _logs_uri = self._get_timestamped_filename()
-                        with self.artifact_store.open(
-                            os.path.join(
-                                self.logs_uri,
-                                _logs_uri,
-                            ),
-                            "w",
-                        ) as file:
-                            for message in self.buffer:
-                                timestamp = datetime.datetime.now(
-                                    datetime.timezone.utc
-                                ).strftime("%Y-%m-%d %H:%M:%S")
-                                file.write(
-                                    f"[{timestamp} UTC] {remove_ansi_escape_codes(message)}\n"
-                                )
-                    else:
-                        with self.artifact_store.open(
-                            self.logs_uri, "a"
-                        ) as file:
-                            for message in self.buffer:
-                                timestamp = datetime.datetime.now(
-                                    datetime.timezone.utc
-                                ).strftime("%Y-%m-%d %H:%M:%S")
-                                file.write(
-                                    f"[{timestamp} UTC] {remove_ansi_escape_codes(message)}\n"
-                                )
+        if getattr(self._saving, "active", False):
+            return
 
-            except (OSError, IOError) as e:
-                # This exception can be raised if there are issues with the
-                # underlying system calls, such as reaching the maximum number
-                # of open files, permission issues, file corruption, or other
-                # I/O errors.
-                logger.error(f"Error while trying to write logs: {e}")
-            finally:
-                self.buffer = []
-                self.last_save_time = time.time()
-
-                self.disabled = False
-        # merge created files on a given interval (defaults to 10 minutes)
-        # only runs on Immutable Filesystems
-        if (
-            self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
-            and time.time() - self.last_merge_time > self.merge_files_interval
-        ):
-            try:
-                self.merge_log_files()
-            except (OSError, IOError) as e:
-                logger.error(f"Error while trying to roll up logs: {e}")
-            finally:
-                self.last_merge_time = time.time()
+        write_needed = self._is_write_needed or force
+        if not (write_needed or self._is_merge_needed):
+            return
+
+        # Only forced saves wait for other threads to finish saving, otherwise
+        # the messages will be saved by the thread which is saving already or
+        # the next save.
+        if not self._save_lock.acquire(blocking=force):
+            return
+
+        # IMPORTANT: keep this as the first code after acquiring the lock! The
+        # code that follows might still emit logging messages, which will end
+        # up triggering this method again, causing an infinite loop.
+        self._saving.active = True
+        try:
+            if write_needed:
+                with self._buffer_lock:
+                    messages, self.buffer = self.buffer, []
+
+                try:
+                    with profiling_utils.profile_phase("log_storage"):
+                        if messages:
+                            self._write_messages(messages)
+                except (OSError, IOError) as e:
+                    # This exception can be raised if there are issues with
+                    # the underlying system calls, such as reaching the
+                    # maximum number of open files, permission issues, file
+                    # corruption, or other I/O errors.
+                    logger.error(f"Error while trying to write logs: {e}")
+                finally:
+                    self.last_save_time = time.time()
+
+            # merge created files on a given interval (defaults to 10
+            # minutes), only runs on Immutable Filesystems
+            if self._is_merge_needed:
+                try:
+                    self.merge_log_files()
+                except (OSError, IOError) as e:
+                    logger.error(f"Error while trying to roll up logs: {e}")
+                finally:
+                    self.last_merge_time = time.time()
+        finally:
+            self._saving.active = False
+            self._save_lock.release()
+
+    def _write_messages(self, messages: List[str]) -> None:
+        """Writes messages to the artifact store.
+
+        Args:
+            messages: The messages to write.
+        """
+        if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+            logs_uri = os.path.join(
+                self.logs_uri, self._get_timestamped_filename()
+            )
+            mode = "w"
+        else:
+            logs_uri = self.logs_uri
+            mode = "a"
+
+        with self.artifact_store.open(logs_uri, mode) as file:
+            for message in messages:
+                timestamp = datetime.datetime.now(
+                    datetime.timezone.utc
+                ).strftime("%Y-%m-%d %H:%M:%S")
+                file.write(
+                    f"[{timestamp} UTC] {remove_ansi_escape_codes(message)}\n"
+                )
+
+    def start_flush_thread(self) -> None:
+        """Starts a thread which periodically saves the buffer."""
+        if self._flush_thread:
+            return
+
+        # Load the artifact store in the current thread, which has the active
+        # stack of the step
+        _ = self.artifact_store
+
+        self._stop_flushing.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            name="zenml-step-logs-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def stop_flush_thread(self) -> None:
+        """Stops the thread which periodically saves the buffer."""
+        if not self._flush_thread:
+            return
+
+        self._stop_flushing.set()
+        self._flush_thread.join()
+        self._flush_thread = None
+
+    def _flush_periodically(self) -> None:
+        """Saves the buffer whenever the time interval passed."""
+        check_interval = min(
+            self.time_interval, STEP_LOGS_STORAGE_FLUSH_CHECK_INTERVAL_SECONDS
+        )
+        while not self._stop_flushing.wait(check_interval):
+            if self.buffer:
+                self.save_to_file()
 
     def merge_log_files(self, merge_all_files: bool = False) -> None:
         """Merges all log files into one in the given URI.
@@ -364,18 +727,28 @@ class StepLogsStorage:
             merge_all_files: whether to merge all files or only raw files
         """
         if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-            merged_file_suffix = "_merged"
             files_ = self.artifact_store.listdir(self.logs_uri)
             if not merge_all_files:
                 # already merged files will not be merged again
-                files_ = [f for f in files_ if merged_file_suffix not in f]
-            file_name_ = self._get_timestamped_filename(
-                suffix=merged_file_suffix
-            )
+                files_ = [f for f in files_ if MERGED_LOGS_SUFFIX not in f]
             if len(files_) > 1:
                 files_.sort()
                 logger.debug("Log files count: %s", len(files_))
 
+                # The merged file is named after the files it contains, so
+                # readers can skip these until they are removed
+                first = _get_log_file_timestamps(str(files_[0]))
+                last = _get_log_file_timestamps(str(files_[-1]))
+                if first and last:
+                    file_name_ = (
+                        f"{first[0]}-{last[1]}{MERGED_LOGS_SUFFIX}"
+                        f"{LOGS_EXTENSION}"
+                    )
+                else:
+                    file_name_ = self._get_timestamped_filename(
+                        suffix=MERGED_LOGS_SUFFIX
+                    )
+
                 missing_files = set()
                 # dump all logs to a local file first
                 with self.artifact_store.open(
@@ -423,6 +796,8 @@ class StepLogsStorageContext:
         Returns:
             self
         """
+        self.storage.start_flush_thread()
+
         self.stdout_write = getattr(sys.stdout, "write")
         self.stdout_flush = getattr(sys.stdout, "flush")
 
@@ -453,6 +828,7 @@ class StepLogsStorageContext:
 
         Restores the `write` method of both stderr and stdout.
         """
+        self.storage.stop_flush_thread()
         self.storage.save_to_file(force=True)
 
         setattr(sys.stdout, "write", self.stdout_write)
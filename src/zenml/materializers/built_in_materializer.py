@@ -13,13 +13,16 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import json
 import os
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -27,10 +30,16 @@ from typing import (
     Union,
 )
 
+import cloudpickle
+
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 from zenml.enums import ArtifactType
+from zenml.environment import Environment
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.cloudpickle_materializer import (
+    CloudpickleMaterializer,
+)
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.utils import source_utils, yaml_utils
 
@@ -41,6 +50,8 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+DEFAULT_PACKED_FILENAME = "data.bin"
+PACKED_FORMAT_VERSION = 1
 BASIC_TYPES = (
     bool,
     float,
@@ -249,6 +260,68 @@ def find_materializer_registry_type(type_: Type[Any]) -> Type[Any]:
     )
 
 
+def _encode_json(data: Any) -> bytes:
+    """Encodes a JSON-serializable object.
+
+    Args:
+        data: The object to encode.
+
+    Returns:
+        The encoded object.
+    """
+    return json.dumps(data).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    """Decodes a JSON-serialized object.
+
+    Args:
+        data: The encoded object.
+
+    Returns:
+        The decoded object.
+    """
+    return json.loads(data.decode("utf-8"))
+
+
+def _encode_bytes(data: Any) -> bytes:
+    """Encodes a bytes object.
+
+    Args:
+        data: The object to encode.
+
+    Returns:
+        The object itself.
+    """
+    return bytes(data)
+
+
+def _decode_bytes(data: bytes) -> Any:
+    """Decodes a bytes object.
+
+    Args:
+        data: The encoded object.
+
+    Returns:
+        The object itself.
+    """
+    return data
+
+
+# Elements of containers that are handled by one of these materializers are
+# packed into a single data file instead of being materialized into a
+# separate directory each. The encoding of each element matches what the
+# materializer itself would write.
+PACKABLE_MATERIALIZERS: Dict[
+    Type[BaseMaterializer],
+    Tuple[Callable[[Any], bytes], Callable[[bytes], Any]],
+] = {
+    BuiltInMaterializer: (_encode_json, _decode_json),
+    BytesMaterializer: (_encode_bytes, _decode_bytes),
+    CloudpickleMaterializer: (cloudpickle.dumps, cloudpickle.loads),
+}
+
+
 class BuiltInContainerMaterializer(BaseMaterializer):
     """Handle built-in container types (dict, list, set, tuple)."""
 
@@ -278,10 +351,9 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         If the data was serialized to JSON, deserialize it.
 
         Otherwise, reconstruct all elements according to the metadata file:
-            1. Resolve the data type using `find_type_by_str()`,
-            2. Get the materializer via the `default_materializer_registry`,
-            3. Initialize the materializer with the desired path,
-            4. Use `load()` of that materializer to load the element.
+            1. Resolve the data type and materializer of each element,
+            2. Read packed elements from their offset in the packed data file,
+            3. Use `load()` of the materializer for all other elements.
 
         Args:
             data_type: The type of the data to read.
@@ -292,26 +364,29 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         Raises:
             RuntimeError: If the data was not found.
         """
-        # If the data was not serialized, there must be metadata present.
-        if not self.artifact_store.exists(
-            self.data_path
-        ) and not self.artifact_store.exists(self.metadata_path):
-            raise RuntimeError(
-                f"Materialization of type {data_type} failed. Expected either"
-                f"{self.data_path} or {self.metadata_path} to exist."
-            )
-
         # If the data was serialized as JSON, deserialize it.
         if self.artifact_store.exists(self.data_path):
             outputs = yaml_utils.read_json(self.data_path)
 
         # Otherwise, use the metadata to reconstruct the data as a list.
         else:
-            metadata = yaml_utils.read_json(self.metadata_path)
+            # If the data was not serialized, there must be metadata present.
+            try:
+                metadata = yaml_utils.read_json(self.metadata_path)
+            except FileNotFoundError:
+                raise RuntimeError(
+                    f"Materialization of type {data_type} failed. Expected "
+                    f"either {self.data_path} or {self.metadata_path} to "
+                    "exist."
+                )
             outputs = []
 
+            # Packed format
+            if isinstance(metadata, dict) and "version" in metadata:
+                outputs = list(self._iter_packed_elements(metadata))
+
             # Backwards compatibility for zenml <= 0.37.0
-            if isinstance(metadata, dict):
+            elif isinstance(metadata, dict):
                 for path_, type_str in zip(
                     metadata["paths"], metadata["types"]
                 ):
@@ -321,7 +396,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
                     element = materializer.load(type_)
                     outputs.append(element)
 
-            # New format for zenml > 0.37.0
+            # Directory format for zenml > 0.37.0
             elif isinstance(metadata, list):
                 for entry in metadata:
                     path_ = entry["path"]
@@ -346,14 +421,84 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             return data_type(outputs)
         return outputs
 
+    def _iter_packed_elements(self, metadata: Dict[str, Any]) -> Iterator[Any]:
+        """Loads the elements of a container saved in the packed format.
+
+        Types and materializers are only loaded once for all elements. All
+        packed elements are read from a single open file at the offsets
+        stored in the metadata, so no other element needs to be read.
+
+        Args:
+            metadata: The metadata of the container.
+
+        Yields:
+            The loaded elements.
+
+        Raises:
+            RuntimeError: If the packed format version is not supported.
+        """
+        if metadata["version"] > PACKED_FORMAT_VERSION:
+            raise RuntimeError(
+                f"Unable to load container artifact with packed format "
+                f"version {metadata['version']}. Please upgrade ZenML to load "
+                "this artifact."
+            )
+
+        types = [source_utils.load(type_) for type_ in metadata["types"]]
+        materializer_classes: List[Type[BaseMaterializer]] = [
+            source_utils.load(materializer)
+            for materializer in metadata["materializers"]
+        ]
+
+        source_python_version = metadata.get("python_version")
+        current_python_version = Environment().python_version()
+        if (
+            CloudpickleMaterializer in materializer_classes
+            and source_python_version != current_python_version
+        ):
+            logger.warning(
+                f"Your artifact was materialized under Python version "
+                f"'{source_python_version}' but you are currently using "
+                f"'{current_python_version}'. This might cause unexpected "
+                "behavior since pickle is not reproducible across Python "
+                "versions. Attempting to load anyway..."
+            )
+
+        packed_path = os.path.join(self.uri, DEFAULT_PACKED_FILENAME)
+        packed_file = None
+        try:
+            for entry in metadata["elements"]:
+                type_ = types[entry[0]]
+                materializer_class = materializer_classes[entry[1]]
+                if len(entry) == 4:
+                    _, decode = PACKABLE_MATERIALIZERS[materializer_class]
+                    if packed_file is None:
+                        packed_file = self.artifact_store.open(
+                            packed_path, "rb"
+                        )
+                    offset, size = entry[2], entry[3]
+                    packed_file.seek(offset)
+                    yield decode(packed_file.read(size))
+                else:
+                    materializer = materializer_class(
+                        uri=os.path.join(self.uri, entry[2])
+                    )
+                    yield materializer.load(type_)
+        finally:
+            if packed_file is not None:
+                packed_file.close()
+
     def save(self, data: Any) -> None:
         """Materialize a built-in container object.
 
         If the object can be serialized to JSON, serialize it.
 
         Otherwise, use the `default_materializer_registry` to find the correct
-        materializer for each element and materialize each element into a
-        subdirectory.
+        materializer for each element. Elements whose materializer supports
+        it are packed into a single data file, all other elements are
+        materialized into a subdirectory each. The metadata file stores the
+        type and materializer of all elements as well as the offsets of the
+        packed elements.
 
         Tuples and sets are cast to list before materialization.
 
@@ -378,41 +523,91 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
-        materializers: List[BaseMaterializer] = []
+        # non-serializable list: Pack elements into a single file where
+        # possible and materialize all other elements into a subfolder.
+        # Types and materializers are only resolved once for all elements.
+        type_indices: Dict[Type[Any], int] = {}
+        materializer_indices: Dict[Type[BaseMaterializer], int] = {}
+        elements: List[List[Any]] = []
+        element_paths: List[str] = []
+        packed_path = os.path.join(self.uri, DEFAULT_PACKED_FILENAME)
+        packed_file = None
+        offset = 0
         try:
             for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                self.artifact_store.mkdir(element_path)
                 type_ = type(element)
                 materializer_class = materializer_registry[type_]
-                materializer = materializer_class(uri=element_path)
-                materializers.append(materializer)
-                metadata.append(
-                    {
-                        "path": element_path,
-                        "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
-                    }
+                is_new_type = type_ not in type_indices
+                type_index = type_indices.setdefault(type_, len(type_indices))
+                materializer_index = materializer_indices.setdefault(
+                    materializer_class, len(materializer_indices)
                 )
+
+                if materializer_class in PACKABLE_MATERIALIZERS:
+                    encode, _ = PACKABLE_MATERIALIZERS[materializer_class]
+                    if (
+                        materializer_class is CloudpickleMaterializer
+                        and is_new_type
+                    ):
+                        logger.warning(
+                            f"No materializer is registered for type "
+                            f"`{type_}`, so the default Pickle materializer "
+                            "was used for the container elements of this "
+                            "type. Pickle is not production ready and should "
+                            "only be used for prototyping as the artifacts "
+                            "cannot be loaded when running with a different "
+                            "Python version."
+                        )
+                    if packed_file is None:
+                        packed_file = self.artifact_store.open(
+                            packed_path, "wb"
+                        )
+                    encoded = encode(element)
+                    packed_file.write(encoded)
+                    elements.append(
+                        [type_index, materializer_index, offset, len(encoded)]
+                    )
+                    offset += len(encoded)
+                else:
+                    element_path = os.path.join(self.uri, str(i))
+                    self.artifact_store.mkdir(element_path)
+                    element_paths.append(element_path)
+                    materializer = materializer_class(uri=element_path)
+                    materializer.validate_type_compatibility(type_)
+                    materializer.save(element)
+                    elements.append([type_index, materializer_index, str(i)])
+
+            if packed_file is not None:
+                packed_file.close()
+                packed_file = None
+
+            metadata: Dict[str, Any] = {
+                "version": PACKED_FORMAT_VERSION,
+                "types": [
+                    source_utils.resolve(type_).import_path
+                    for type_ in type_indices
+                ],
+                "materializers": [
+                    source_utils.resolve(materializer_class).import_path
+                    for materializer_class in materializer_indices
+                ],
+                "elements": elements,
+            }
+            if CloudpickleMaterializer in materializer_indices:
+                metadata["python_version"] = Environment().python_version()
             # Write metadata as JSON.
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.validate_type_compatibility(type(element))
-                materializer.save(element)
         # If an error occurs, delete all created files.
         except Exception as e:
-            # Delete metadata
-            if self.artifact_store.exists(self.metadata_path):
-                self.artifact_store.remove(self.metadata_path)
+            if packed_file is not None:
+                packed_file.close()
+            # Delete metadata and packed elements
+            for path in (self.metadata_path, packed_path):
+                if self.artifact_store.exists(path):
+                    self.artifact_store.remove(path)
             # Delete all elements that were already saved.
-            for entry in metadata:
-                self.artifact_store.rmtree(entry["path"])
+            for element_path in element_paths:
+                self.artifact_store.rmtree(element_path)
             raise e
 
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
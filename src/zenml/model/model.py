@@ -335,13 +335,23 @@ class Model(BaseModel):
             metadata: The metadata to log.
         """
         from zenml.client import Client
+        from zenml.new.steps.step_context import get_step_context
 
         response = self._get_or_create_model_version()
-        Client().create_run_metadata(
-            metadata=metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.MODEL_VERSION,
-        )
+        try:
+            step_context = get_step_context()
+        except RuntimeError:
+            Client().create_run_metadata(
+                metadata=metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.MODEL_VERSION,
+            )
+        else:
+            step_context.add_run_metadata(
+                metadata=metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.MODEL_VERSION,
+            )
 
     @property
     def run_metadata(self) -> Dict[str, "RunMetadataResponse"]:
@@ -357,6 +367,7 @@ class Model(BaseModel):
         from zenml.new.pipelines.pipeline_context import (
             get_pipeline_context,
         )
+        from zenml.new.steps.step_context import get_step_context
 
         try:
             get_pipeline_context()
@@ -369,6 +380,12 @@ class Model(BaseModel):
         except RuntimeError:
             pass
 
+        # Publish the metadata that was logged in the running step so far
+        try:
+            get_step_context()._flush_run_metadata()
+        except RuntimeError:
+            pass
+
         response = self._get_or_create_model_version(hydrate=True)
         if response.run_metadata is None:
             raise RuntimeError(
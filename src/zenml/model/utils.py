@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Utility functions for linking step outputs to model versions."""
 
-from typing import Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.artifacts.artifact_config import ArtifactConfig
@@ -56,6 +56,7 @@ def link_step_artifacts_to_model(
         model = None
         logger.debug("No model context found, unable to auto-link artifacts.")
 
+    artifact_configs = []
     for artifact_name, artifact_version_id in artifact_version_ids.items():
         artifact_config = step_context._get_output(
             artifact_name
@@ -65,11 +66,11 @@ def link_step_artifacts_to_model(
             artifact_config = ArtifactConfig(name=artifact_name)
 
         if artifact_config:
-            link_artifact_config_to_model(
-                artifact_config=artifact_config,
-                artifact_version_id=artifact_version_id,
-                model=model,
-            )
+            artifact_configs.append((artifact_config, artifact_version_id))
+
+    link_artifact_configs_to_model(
+        artifact_configs=artifact_configs, model=model
+    )
 
 
 def link_artifact_config_to_model(
@@ -84,33 +85,73 @@ def link_artifact_config_to_model(
         artifact_version_id: The ID of the artifact to link.
         model: The model version from the step or pipeline context.
     """
-    client = Client()
+    link_artifact_configs_to_model(
+        artifact_configs=[(artifact_config, artifact_version_id)],
+        model=model,
+    )
 
-    # If the artifact config specifies a model itself then always use that
-    if artifact_config.model_name is not None:
-        from zenml.model.model import Model
 
-        model = Model(
-            name=artifact_config.model_name,
-            version=artifact_config.model_version,
-        )
+def link_artifact_configs_to_model(
+    artifact_configs: List[Tuple[ArtifactConfig, UUID]],
+    model: Optional["Model"] = None,
+) -> None:
+    """Link multiple artifact configs to their model versions.
+
+    All links are created with a single request, and models that are
+    referenced by multiple artifact configs are only resolved once.
+
+    Args:
+        artifact_configs: Tuples of the artifact config to link and the ID of
+            the artifact version to link.
+        model: The model version from the step or pipeline context.
+    """
+    client = Client()
+    models: Dict[Tuple[str, Any], "Model"] = {}
+    requests: List[ModelVersionArtifactRequest] = []
+    user_id: Optional[UUID] = None
+    workspace_id: Optional[UUID] = None
+
+    for artifact_config, artifact_version_id in artifact_configs:
+        artifact_model = model
+
+        # If the artifact config specifies a model itself then always use that
+        if artifact_config.model_name is not None:
+            key = (artifact_config.model_name, artifact_config.model_version)
+            if key not in models:
+                models[key] = Model(
+                    name=artifact_config.model_name,
+                    version=artifact_config.model_version,
+                )
+            artifact_model = models[key]
+
+        if not artifact_model:
+            continue
 
-    if model:
         logger.debug(
             f"Linking artifact `{artifact_config.name}` to model "
-            f"`{model.name}` version `{model.version}` using config "
-            f"`{artifact_config}`."
+            f"`{artifact_model.name}` version `{artifact_model.version}` "
+            f"using config `{artifact_config}`."
         )
-        request = ModelVersionArtifactRequest(
-            user=client.active_user.id,
-            workspace=client.active_workspace.id,
-            artifact_version=artifact_version_id,
-            model=model.model_id,
-            model_version=model.id,
-            is_model_artifact=artifact_config.is_model_artifact,
-            is_deployment_artifact=artifact_config.is_deployment_artifact,
+        if user_id is None or workspace_id is None:
+            user_id = client.active_user.id
+            workspace_id = client.active_workspace.id
+
+        requests.append(
+            ModelVersionArtifactRequest(
+                user=user_id,
+                workspace=workspace_id,
+                artifact_version=artifact_version_id,
+                model=artifact_model.model_id,
+                model_version=artifact_model.id,
+                is_model_artifact=artifact_config.is_model_artifact,
+                is_deployment_artifact=artifact_config.is_deployment_artifact,
+            )
         )
-        client.zen_store.create_model_version_artifact_link(request)
+
+    if len(requests) == 1:
+        client.zen_store.create_model_version_artifact_link(requests[0])
+    elif requests:
+        client.zen_store.create_model_version_artifact_links(requests)
 
 
 def log_model_version_metadata(
@@ -360,6 +360,10 @@ from zenml.models.v2.core.event_source import (
 )
 from zenml.models.v2.misc.user_auth import UserAuthModel
 from zenml.models.v2.misc.build_item import BuildItem
+from zenml.models.v2.misc.step_run_begin import (
+    StepRunBeginRequest,
+    StepRunBeginResponse,
+)
 from zenml.models.v2.misc.loaded_visualization import LoadedVisualization
 from zenml.models.v2.misc.external_user import ExternalUserModel
 from zenml.models.v2.misc.auth_models import (
@@ -459,6 +463,8 @@ StackResponse.model_rebuild()
 StepRunRequest.model_rebuild()
 StepRunResponseBody.model_rebuild()
 StepRunResponseMetadata.model_rebuild()
+StepRunBeginRequest.model_rebuild()
+StepRunBeginResponse.model_rebuild()
 TriggerExecutionResponseResources.model_rebuild()
 TriggerResponseBody.model_rebuild()
 TriggerResponseMetadata.model_rebuild()
@@ -736,6 +742,8 @@ __all__ = [
     "UserAuthModel",
     "ExternalUserModel",
     "BuildItem",
+    "StepRunBeginRequest",
+    "StepRunBeginResponse",
     "LoadedVisualization",
     "ServerModel",
     "ServerDatabaseType",
@@ -0,0 +1,80 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Models for beginning a step run in a single request."""
+
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from zenml.models.v2.core.pipeline_run import (
+    PipelineRunRequest,
+    PipelineRunResponse,
+)
+from zenml.models.v2.core.step_run import StepRunRequest, StepRunResponse
+
+
+class StepRunBeginRequest(BaseModel):
+    """Request to get or create a pipeline run and begin one of its steps.
+
+    The step inputs that are produced by upstream steps of the same run, the
+    parent steps, the cache key and the cached outputs are resolved on the
+    server. Inputs that can only be resolved on the client (e.g. external
+    artifacts) have to be included in the inputs of the step run request.
+
+    Attributes:
+        pipeline_run: The pipeline run to get or create.
+        step_run: The step run to create. The pipeline run ID of this request
+            gets replaced by the ID of the created or existing pipeline run.
+        artifact_store_id: The ID of the artifact store of the active stack.
+        artifact_store_path: The path of the artifact store.
+        artifact_store_cache_key: Hex encoded custom cache key of the artifact
+            store.
+        cache_enabled: Whether a cached step run should be reused.
+    """
+
+    pipeline_run: PipelineRunRequest = Field(
+        title="The pipeline run to get or create."
+    )
+    step_run: StepRunRequest = Field(title="The step run to create.")
+    artifact_store_id: UUID = Field(
+        title="The ID of the artifact store of the active stack."
+    )
+    artifact_store_path: str = Field(title="The path of the artifact store.")
+    artifact_store_cache_key: Optional[str] = Field(
+        default=None,
+        title="Hex encoded custom cache key of the artifact store.",
+    )
+    cache_enabled: bool = Field(
+        default=True, title="Whether a cached step run should be reused."
+    )
+
+
+class StepRunBeginResponse(BaseModel):
+    """Response of beginning a step run.
+
+    Attributes:
+        pipeline_run: The created or existing pipeline run.
+        pipeline_run_created: Whether the pipeline run was created.
+        step_run: The created step run. If a cached step run was reused, the
+            status of this step run is `cached`.
+    """
+
+    pipeline_run: PipelineRunResponse = Field(
+        title="The created or existing pipeline run."
+    )
+    pipeline_run_created: bool = Field(
+        title="Whether the pipeline run was created."
+    )
+    step_run: StepRunResponse = Field(title="The created step run.")
@@ -15,6 +15,13 @@
 
 import hashlib
 import platform
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from typing import (
     TYPE_CHECKING,
     Dict,
@@ -27,6 +34,10 @@ from uuid import UUID
 import zenml
 from zenml.client import Client
 from zenml.code_repositories import BaseCodeRepository
+from zenml.constants import (
+    DOCKER_BUILD_CONCURRENCY,
+    IMAGE_REUSE_BUILD_LOOKBACK,
+)
 from zenml.logger import get_logger
 from zenml.models import (
     BuildItem,
@@ -40,6 +51,7 @@ from zenml.models import (
 from zenml.stack import Stack
 from zenml.utils import source_utils
 from zenml.utils.pipeline_docker_image_builder import (
+    DEFAULT_DOCKER_PARENT_IMAGE,
     PipelineDockerImageBuilder,
 )
 
@@ -209,6 +221,7 @@ def reuse_or_create_pipeline_build(
             deployment=deployment,
             pipeline_id=pipeline_id,
             code_repository=code_repository,
+            allow_image_reuse=allow_build_reuse,
         )
 
     if isinstance(build, UUID):
@@ -283,10 +296,50 @@ def find_existing_build(
     return matches[0]
 
 
+def find_existing_images(stack: "Stack") -> Dict[str, BuildItem]:
+    """Find images of previous builds that can be reused.
+
+    Only images of the most recent `IMAGE_REUSE_BUILD_LOOKBACK` builds for
+    the same stack, ZenML version and Python version are considered. Images
+    that include code are never reused, as the code might be different from
+    the local code the user is expecting to run.
+
+    Args:
+        stack: The stack for which to find images.
+
+    Returns:
+        The reusable images, keyed by their settings checksum. If multiple
+        images have the same settings checksum, the most recent one is used.
+    """
+    if stack.container_registry is None:
+        # Images of local builds might not exist on the current machine
+        return {}
+
+    python_version_prefix = ".".join(platform.python_version_tuple()[:2])
+    builds = Client().list_builds(
+        sort_by="desc:created",
+        size=IMAGE_REUSE_BUILD_LOOKBACK,
+        stack_id=stack.id,
+        is_local=False,
+        zenml_version=zenml.__version__,
+        python_version=f"startswith:{python_version_prefix}",
+    )
+
+    images: Dict[str, BuildItem] = {}
+    for build in builds.items:
+        for item in build.images.values():
+            if item.contains_code or not item.settings_checksum:
+                continue
+            images.setdefault(item.settings_checksum, item)
+
+    return images
+
+
 def create_pipeline_build(
     deployment: "PipelineDeploymentBase",
     pipeline_id: Optional[UUID] = None,
     code_repository: Optional["BaseCodeRepository"] = None,
+    allow_image_reuse: bool = False,
 ) -> Optional["PipelineBuildResponse"]:
     """Builds images and registers the output in the server.
 
@@ -295,6 +348,8 @@ def create_pipeline_build(
         pipeline_id: The ID of the pipeline.
         code_repository: If provided, this code repository will be used to
             download inside the build images.
+        allow_image_reuse: If True, images of previous builds with the same
+            settings checksum will be reused instead of building them again.
 
     Returns:
         The build output.
@@ -317,9 +372,11 @@ def create_pipeline_build(
         deployment.pipeline_configuration.name,
     )
 
-    docker_image_builder = PipelineDockerImageBuilder()
-    images: Dict[str, BuildItem] = {}
+    # Maps the combined image key to the settings checksum of the image
     checksums: Dict[str, str] = {}
+    # Maps each distinct settings checksum to the build configuration that
+    # will be used to build the image for it
+    unique_builds: Dict[str, "BuildConfiguration"] = {}
 
     for build_config in required_builds:
         combined_key = PipelineBuildBase.get_image_key(
@@ -329,8 +386,8 @@ def create_pipeline_build(
             stack=stack, code_repository=code_repository
         )
 
-        if combined_key in images:
-            previous_checksum = images[combined_key].settings_checksum
+        if combined_key in checksums:
+            previous_checksum = checksums[combined_key]
 
             if previous_checksum != checksum:
                 raise RuntimeError(
@@ -346,55 +403,43 @@ def create_pipeline_build(
             else:
                 continue
 
-        if checksum in checksums:
-            item_key = checksums[checksum]
-            image_name_or_digest = images[item_key].image
-            contains_code = images[item_key].contains_code
-            dockerfile = images[item_key].dockerfile
-            requirements = images[item_key].requirements
-        else:
-            tag = deployment.pipeline_configuration.name
-            if build_config.step_name:
-                tag += f"-{build_config.step_name}"
-            tag += f"-{build_config.key}"
-
-            include_files = build_config.should_include_files(
-                code_repository=code_repository,
-            )
-            download_files = build_config.should_download_files(
-                code_repository=code_repository,
-            )
-            pass_code_repo = (
-                build_config.should_download_files_from_code_repository(
+        checksums[combined_key] = checksum
+        unique_builds.setdefault(checksum, build_config)
+
+    built_images: Dict[str, BuildItem] = {}
+    if allow_image_reuse:
+        existing_images = find_existing_images(stack=stack)
+        for checksum, build_config in list(unique_builds.items()):
+            existing_image = existing_images.get(checksum)
+            if (
+                existing_image is None
+                or build_config.settings.prevent_build_reuse
+                or build_config.should_include_files(
                     code_repository=code_repository
                 )
-            )
+                or existing_image.requires_code_download
+                != build_config.should_download_files(
+                    code_repository=code_repository
+                )
+            ):
+                continue
 
-            (
-                image_name_or_digest,
-                dockerfile,
-                requirements,
-            ) = docker_image_builder.build_docker_image(
-                docker_settings=build_config.settings,
-                tag=tag,
-                stack=stack,
-                include_files=include_files,
-                download_files=download_files,
-                entrypoint=build_config.entrypoint,
-                extra_files=build_config.extra_files,
-                code_repository=code_repository if pass_code_repo else None,
-            )
-            contains_code = include_files
+            logger.info("Reusing existing image `%s`.", existing_image.image)
+            built_images[checksum] = existing_image
+            del unique_builds[checksum]
 
-        images[combined_key] = BuildItem(
-            image=image_name_or_digest,
-            dockerfile=dockerfile,
-            requirements=requirements,
-            settings_checksum=checksum,
-            contains_code=contains_code,
-            requires_code_download=download_files,
+    built_images.update(
+        build_images(
+            builds=unique_builds,
+            deployment=deployment,
+            stack=stack,
+            code_repository=code_repository,
         )
-        checksums[checksum] = combined_key
+    )
+    images = {
+        combined_key: built_images[checksum].model_copy()
+        for combined_key, checksum in checksums.items()
+    }
 
     logger.info("Finished building Docker image(s).")
 
@@ -420,6 +465,121 @@ def create_pipeline_build(
     return client.zen_store.create_build(build_request)
 
 
+def build_images(
+    builds: Dict[str, "BuildConfiguration"],
+    deployment: "PipelineDeploymentBase",
+    stack: "Stack",
+    code_repository: Optional["BaseCodeRepository"] = None,
+) -> Dict[str, BuildItem]:
+    """Builds Docker images in parallel.
+
+    Up to `DOCKER_BUILD_CONCURRENCY` images are built and pushed at the
+    same time. Images that use the same parent image are scheduled after
+    the first image with that parent finished building, so the layers of
+    the parent image are only pulled once and are then available in the
+    cache of the image builder for the remaining builds.
+
+    Args:
+        builds: The build configurations of the images to build, keyed by
+            their settings checksum.
+        deployment: The pipeline deployment.
+        stack: The stack on which the pipeline will be deployed.
+        code_repository: If provided, this code repository will be used to
+            download inside the build images.
+
+    Returns:
+        The built images, keyed by their settings checksum.
+    """
+    docker_image_builder = PipelineDockerImageBuilder()
+
+    def _build(checksum: str) -> BuildItem:
+        build_config = builds[checksum]
+
+        tag = deployment.pipeline_configuration.name
+        if build_config.step_name:
+            tag += f"-{build_config.step_name}"
+        tag += f"-{build_config.key}"
+
+        include_files = build_config.should_include_files(
+            code_repository=code_repository,
+        )
+        download_files = build_config.should_download_files(
+            code_repository=code_repository,
+        )
+        pass_code_repo = (
+            build_config.should_download_files_from_code_repository(
+                code_repository=code_repository
+            )
+        )
+
+        start_time = time.perf_counter()
+        (
+            image_name_or_digest,
+            dockerfile,
+            requirements,
+        ) = docker_image_builder.build_docker_image(
+            docker_settings=build_config.settings,
+            tag=tag,
+            stack=stack,
+            include_files=include_files,
+            download_files=download_files,
+            entrypoint=build_config.entrypoint,
+            extra_files=build_config.extra_files,
+            code_repository=code_repository if pass_code_repo else None,
+        )
+        logger.info(
+            "Finished building Docker image `%s` in %.1fs.",
+            image_name_or_digest,
+            time.perf_counter() - start_time,
+        )
+
+        return BuildItem(
+            image=image_name_or_digest,
+            dockerfile=dockerfile,
+            requirements=requirements,
+            settings_checksum=checksum,
+            contains_code=include_files,
+            requires_code_download=download_files,
+        )
+
+    max_workers = min(DOCKER_BUILD_CONCURRENCY, len(builds))
+    if max_workers <= 1:
+        return {checksum: _build(checksum) for checksum in builds}
+
+    # Group the builds by their parent image. The first build of each group
+    # is started right away, the other ones once the first one finished.
+    groups: Dict[str, List[str]] = {}
+    for checksum, build_config in builds.items():
+        parent_image = (
+            build_config.settings.dockerfile
+            or build_config.settings.parent_image
+            or DEFAULT_DOCKER_PARENT_IMAGE
+        )
+        groups.setdefault(parent_image, []).append(checksum)
+
+    images: Dict[str, BuildItem] = {}
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="zenml-docker-build"
+    )
+    try:
+        pending: Dict["Future[BuildItem]", List[str]] = {
+            executor.submit(_build, group[0]): group
+            for group in groups.values()
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                group = pending.pop(future)
+                images[group[0]] = future.result()
+                for checksum in group[1:]:
+                    pending[executor.submit(_build, checksum)] = [checksum]
+    finally:
+        # Don't start any new builds if one of the builds failed
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return images
+
+
 def compute_build_checksum(
     items: List["BuildConfiguration"],
     stack: "Stack",
@@ -71,6 +71,7 @@ from zenml.new.pipelines import build_utils
 from zenml.new.pipelines.run_utils import (
     create_placeholder_run,
     deploy_pipeline,
+    get_deployment_of_placeholder_run,
     upload_notebook_cell_code_if_necessary,
 )
 from zenml.stack import Stack
@@ -751,6 +752,10 @@ To avoid this consider setting pipeline parameters only in one place (config or
 
             self.log_pipeline_deployment_metadata(deployment_model)
             run = create_placeholder_run(deployment=deployment_model)
+            if run:
+                deployment_model = get_deployment_of_placeholder_run(
+                    placeholder_run=run, deployment=deployment_model
+                )
 
             analytics_handler.metadata = self._get_pipeline_analytics_metadata(
                 deployment=deployment_model,
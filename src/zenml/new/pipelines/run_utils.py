@@ -11,16 +11,19 @@ from zenml import constants
 from zenml.client import Client
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
 from zenml.config.source import Source, SourceType
-from zenml.config.step_configurations import StepConfigurationUpdate
+from zenml.config.step_configurations import Step, StepConfigurationUpdate
 from zenml.enums import ExecutionStatus
 from zenml.logger import get_logger
 from zenml.models import (
+    CodeReferenceRequest,
     FlavorFilter,
     PipelineDeploymentBase,
+    PipelineDeploymentRequest,
     PipelineDeploymentResponse,
     PipelineRunRequest,
     PipelineRunResponse,
     StackResponse,
+    StepRunRequest,
 )
 from zenml.orchestrators.utils import get_run_name
 from zenml.stack import Flavor, Stack
@@ -53,7 +56,9 @@ def create_placeholder_run(
     """Create a placeholder run for the deployment.
 
     If the deployment contains a schedule, no placeholder run will be
-    created.
+    created. If the deployment already has a placeholder run, the placeholder
+    run is created for a copy of the deployment, which needs to be run
+    instead.
 
     Args:
         deployment: The deployment for which to create the placeholder run.
@@ -85,6 +90,29 @@ def create_placeholder_run(
     return Client().zen_store.create_run(run_request)
 
 
+def get_deployment_of_placeholder_run(
+    placeholder_run: "PipelineRunResponse",
+    deployment: "PipelineDeploymentResponse",
+) -> "PipelineDeploymentResponse":
+    """Gets the deployment which needs to be run for a placeholder run.
+
+    Args:
+        placeholder_run: The placeholder run.
+        deployment: The deployment for which the placeholder run was created.
+
+    Returns:
+        The deployment or the copy of it for which the placeholder run was
+        created.
+    """
+    if (
+        placeholder_run.deployment_id
+        and placeholder_run.deployment_id != deployment.id
+    ):
+        return Client().get_deployment(placeholder_run.deployment_id)
+
+    return deployment
+
+
 def get_placeholder_run(
     deployment_id: UUID,
 ) -> Optional["PipelineRunResponse"]:
@@ -158,6 +186,251 @@ def deploy_pipeline(
         constants.SHOULD_PREVENT_PIPELINE_EXECUTION = previous_value
 
 
+def get_steps_to_resume(
+    run: "PipelineRunResponse",
+    deployment: "PipelineDeploymentResponse",
+    from_step: Optional[str] = None,
+) -> Set[str]:
+    """Gets the steps that need to run again to resume a pipeline run.
+
+    These are the steps of the run that did not finish successfully, the
+    step to resume from and all steps downstream of them.
+
+    Args:
+        run: The pipeline run to resume.
+        deployment: The deployment of the pipeline run.
+        from_step: Optional name of a step to run again, even if it finished
+            successfully.
+
+    Raises:
+        ValueError: If the step to resume from is not part of the run.
+
+    Returns:
+        The names of the steps that need to run again.
+    """
+    if from_step and from_step not in deployment.step_configurations:
+        raise ValueError(
+            f"Unable to resume pipeline run `{run.name}`: No step "
+            f"`{from_step}` found in the pipeline."
+        )
+
+    step_runs = run.steps
+    steps_to_resume = {
+        step_name
+        for step_name in deployment.step_configurations
+        if step_name not in step_runs
+        or step_runs[step_name].status
+        not in {ExecutionStatus.COMPLETED, ExecutionStatus.CACHED}
+    }
+    if from_step:
+        steps_to_resume.add(from_step)
+
+    # The step configurations are sorted topologically, so all upstream
+    # steps of a step were already visited
+    for step_name, step in deployment.step_configurations.items():
+        if steps_to_resume.intersection(step.spec.upstream_steps):
+            steps_to_resume.add(step_name)
+
+    return steps_to_resume
+
+
+def resume_pipeline_run(
+    run: "PipelineRunResponse", from_step: Optional[str] = None
+) -> "PipelineRunResponse":
+    """Resumes a pipeline run from its failed steps or a chosen step.
+
+    This creates a new run of the same deployment which reuses the step runs
+    of the original run that don't need to run again. Only the remaining
+    steps are scheduled on the orchestrator.
+
+    Args:
+        run: The pipeline run to resume.
+        from_step: Optional name of a step to run again, even if it finished
+            successfully. All steps downstream of it will run again as well.
+
+    Raises:
+        ValueError: If the run can't be resumed.
+
+    Returns:
+        The new pipeline run.
+    """
+    if not run.deployment_id:
+        raise ValueError(
+            f"Unable to resume pipeline run `{run.name}`: The run has no "
+            "deployment."
+        )
+
+    client = Client()
+    deployment = client.get_deployment(run.deployment_id)
+    steps_to_resume = get_steps_to_resume(
+        run=run, deployment=deployment, from_step=from_step
+    )
+    if not steps_to_resume:
+        raise ValueError(
+            f"Unable to resume pipeline run `{run.name}`: All steps of the "
+            "run finished successfully. Specify a step to resume from to run "
+            "it and its downstream steps again."
+        )
+
+    if not deployment.stack:
+        raise ValueError(
+            f"Unable to resume pipeline run `{run.name}`: The stack of the "
+            "run was deleted."
+        )
+
+    # The deployment of the new run only contains the steps that need to run
+    # again, which means the orchestrator only schedules those. Dependencies
+    # on reused steps are moved to a separate list, as their step runs
+    # already exist when the new run starts but are still parents of the
+    # steps that run again.
+    step_configurations = {}
+    for step_name, step in deployment.step_configurations.items():
+        if step_name not in steps_to_resume:
+            continue
+
+        spec = step.spec.model_copy(
+            update={
+                "upstream_steps": [
+                    upstream_step
+                    for upstream_step in step.spec.upstream_steps
+                    if upstream_step in steps_to_resume
+                ],
+                "reused_upstream_steps": [
+                    upstream_step
+                    for upstream_step in step.spec.upstream_steps
+                    if upstream_step not in steps_to_resume
+                ],
+            }
+        )
+        config = step.config
+        if step_name == from_step:
+            # Make sure the chosen step actually runs again
+            config = config.model_copy(update={"enable_cache": False})
+        step_configurations[step_name] = Step(spec=spec, config=config)
+
+    code_reference = None
+    if deployment.code_reference:
+        code_reference = CodeReferenceRequest(
+            commit=deployment.code_reference.commit,
+            subdirectory=deployment.code_reference.subdirectory,
+            code_repository=deployment.code_reference.code_repository.id,
+        )
+
+    resumed_deployment = client.zen_store.create_deployment(
+        PipelineDeploymentRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            run_name_template=deployment.run_name_template,
+            pipeline_configuration=deployment.pipeline_configuration,
+            step_configurations=step_configurations,
+            client_environment=deployment.client_environment,
+            client_version=deployment.client_version,
+            server_version=deployment.server_version,
+            pipeline_version_hash=deployment.pipeline_version_hash,
+            pipeline_spec=deployment.pipeline_spec,
+            stack=deployment.stack.id,
+            pipeline=deployment.pipeline.id if deployment.pipeline else None,
+            build=deployment.build.id if deployment.build else None,
+            code_reference=code_reference,
+            code_path=deployment.code_path,
+            template=deployment.template_id,
+        )
+    )
+    placeholder_run = create_placeholder_run(deployment=resumed_deployment)
+    assert placeholder_run
+    resumed_deployment = get_deployment_of_placeholder_run(
+        placeholder_run=placeholder_run, deployment=resumed_deployment
+    )
+
+    try:
+        _reuse_step_runs(
+            run=run,
+            deployment=deployment,
+            pipeline_run_id=placeholder_run.id,
+            steps_to_resume=steps_to_resume,
+        )
+    except Exception:
+        client.delete_pipeline_run(placeholder_run.id)
+        raise
+
+    logger.info(
+        "Resuming pipeline run `%s` as `%s`, running the steps %s.",
+        run.name,
+        placeholder_run.name,
+        ", ".join(f"`{step_name}`" for step_name in step_configurations),
+    )
+    deploy_pipeline(
+        deployment=resumed_deployment,
+        stack=Stack.from_model(deployment.stack),
+        placeholder_run=placeholder_run,
+    )
+
+    return client.get_pipeline_run(placeholder_run.id)
+
+
+def _reuse_step_runs(
+    run: "PipelineRunResponse",
+    deployment: "PipelineDeploymentResponse",
+    pipeline_run_id: UUID,
+    steps_to_resume: Set[str],
+) -> None:
+    """Copies the step runs that don't need to run again into a new run.
+
+    Args:
+        run: The pipeline run from which to reuse the step runs.
+        deployment: The deployment of the pipeline run.
+        pipeline_run_id: The ID of the run in which to create the step runs.
+        steps_to_resume: The names of the steps that need to run again.
+    """
+    client = Client()
+    step_runs = run.steps
+    step_names = {step_run.id: name for name, step_run in step_runs.items()}
+    reused_step_run_ids: Dict[str, UUID] = {}
+
+    # The step configurations are sorted topologically, so parent step runs
+    # are always copied first
+    for step_name in deployment.step_configurations:
+        if step_name in steps_to_resume:
+            continue
+
+        step_run = step_runs[step_name]
+        now = datetime.utcnow()
+        reused_step_run = client.zen_store.create_run_step(
+            StepRunRequest(
+                name=step_name,
+                start_time=now,
+                end_time=now,
+                status=ExecutionStatus.CACHED,
+                cache_key=step_run.cache_key,
+                code_hash=step_run.code_hash,
+                pipeline_run_id=pipeline_run_id,
+                original_step_run_id=(
+                    step_run.original_step_run_id or step_run.id
+                ),
+                parent_step_ids=[
+                    reused_step_run_ids[step_names[parent_step_id]]
+                    for parent_step_id in step_run.parent_step_ids
+                    if step_names.get(parent_step_id) in reused_step_run_ids
+                ],
+                inputs={
+                    name: artifact.id
+                    for name, artifact in step_run.inputs.items()
+                },
+                outputs={
+                    name: artifact.id
+                    for name, artifact in step_run.outputs.items()
+                },
+                # The configuration of reused steps is only part of the
+                # original deployment
+                deployment=step_run.deployment_id,
+                model_version_id=step_run.model_version_id,
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+            )
+        )
+        reused_step_run_ids[step_name] = reused_step_run.id
+
+
 def wait_for_pipeline_run_to_finish(run_id: UUID) -> "PipelineRunResponse":
     """Waits until a pipeline run is finished.
 
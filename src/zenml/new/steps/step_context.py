@@ -21,8 +21,10 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
 )
+from uuid import UUID
 
 from zenml.exceptions import EntityExistsError, StepContextError
 from zenml.logger import get_logger
@@ -31,6 +33,7 @@ from zenml.utils.singleton import SingletonMetaClass
 if TYPE_CHECKING:
     from zenml.artifacts.artifact_config import ArtifactConfig
     from zenml.config.step_run_info import StepRunInfo
+    from zenml.enums import MetadataResourceTypes
     from zenml.materializers.base_materializer import BaseMaterializer
     from zenml.metadata.metadata_types import MetadataType
     from zenml.model.model import Model
@@ -130,6 +133,13 @@ class StepContext(metaclass=SingletonMetaClass):
         self.step_run = step_run
         self._step_run_info = step_run_info
         self._cache_enabled = cache_enabled
+        self._model: Optional["Model"] = None
+        # Run metadata that is published once the step function finished
+        self._run_metadata: Optional[
+            Dict[
+                Tuple[UUID, "MetadataResourceTypes"], Dict[str, "MetadataType"]
+            ]
+        ] = {}
 
         # Get the stack that we are running in
         self._stack = Client().active_stack
@@ -179,12 +189,18 @@ class StepContext(metaclass=SingletonMetaClass):
             1. Model from @step
             2. Model from @pipeline
 
+        The model is only resolved once per step, so the IDs of the model and
+        model version are only fetched once as well.
+
         Returns:
             The `Model` object associated with the current step.
 
         Raises:
             StepContextError: If the `Model` object is not set in `@step` or `@pipeline`.
         """
+        if self._model is not None:
+            return self._model
+
         if (
             self.step_run.config.model is not None
             and self.step_run.model_version is not None
@@ -201,6 +217,7 @@ class StepContext(metaclass=SingletonMetaClass):
                 f"run '{self.pipeline_run.id}': it was not set in `@step` or `@pipeline`."
             )
 
+        self._model = model
         return model
 
     # TODO: deprecate me
@@ -409,6 +426,60 @@ class StepContext(metaclass=SingletonMetaClass):
             output.tags = []
         output.tags += tags
 
+    def add_run_metadata(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        resource_id: UUID,
+        resource_type: "MetadataResourceTypes",
+    ) -> None:
+        """Adds run metadata for a resource.
+
+        While the step function is running, the metadata is buffered and
+        published with a single request once the step function finished.
+        Metadata that is added after that is published right away.
+
+        Args:
+            metadata: The metadata to add.
+            resource_id: The ID of the resource for which the metadata was
+                produced.
+            resource_type: The type of the resource for which the metadata
+                was produced.
+        """
+        if self._run_metadata is None:
+            from zenml.client import Client
+
+            Client().create_run_metadata(
+                metadata=metadata,
+                resource_id=resource_id,
+                resource_type=resource_type,
+            )
+            return
+
+        self._run_metadata.setdefault((resource_id, resource_type), {}).update(
+            metadata
+        )
+
+    def _flush_run_metadata(self, close: bool = False) -> None:
+        """Publishes the buffered run metadata.
+
+        Args:
+            close: If True, metadata that is added afterwards is published
+                right away instead of being buffered.
+        """
+        run_metadata = self._run_metadata
+        self._run_metadata = None if close else {}
+        if not run_metadata:
+            return
+
+        from zenml.client import Client
+
+        Client().create_run_metadata_batch(
+            [
+                (metadata, resource[0], resource[1], None)
+                for resource, metadata in run_metadata.items()
+            ]
+        )
+
     def _set_artifact_config(
         self,
         artifact_config: "ArtifactConfig",
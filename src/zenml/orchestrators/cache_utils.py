@@ -57,6 +57,41 @@ def generate_cache_key(
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
 
+    Returns:
+        A cache key.
+    """
+    return compute_cache_key(
+        step=step,
+        input_artifact_ids=input_artifact_ids,
+        workspace_id=workspace_id,
+        artifact_store_id=artifact_store.id,
+        artifact_store_path=artifact_store.path,
+        artifact_store_cache_key=artifact_store.custom_cache_key,
+    )
+
+
+def compute_cache_key(
+    step: "Step",
+    input_artifact_ids: Dict[str, "UUID"],
+    workspace_id: "UUID",
+    artifact_store_id: "UUID",
+    artifact_store_path: str,
+    artifact_store_cache_key: Optional[bytes] = None,
+) -> str:
+    """Computes the cache key for a step run from its individual components.
+
+    This does not require an instantiated artifact store and can therefore
+    also be used on the server. See `generate_cache_key(...)` for details on
+    what is included in the cache key.
+
+    Args:
+        step: The step to compute the cache key for.
+        input_artifact_ids: The input artifact IDs for the step.
+        workspace_id: The ID of the workspace.
+        artifact_store_id: The ID of the artifact store.
+        artifact_store_path: The path of the artifact store.
+        artifact_store_cache_key: Custom cache key of the artifact store.
+
     Returns:
         A cache key.
     """
@@ -66,11 +101,11 @@ def generate_cache_key(
     hash_.update(workspace_id.bytes)
 
     # Artifact store ID and path
-    hash_.update(artifact_store.id.bytes)
-    hash_.update(artifact_store.path.encode())
+    hash_.update(artifact_store_id.bytes)
+    hash_.update(artifact_store_path.encode())
 
-    if artifact_store.custom_cache_key:
-        hash_.update(artifact_store.custom_cache_key)
+    if artifact_store_cache_key:
+        hash_.update(artifact_store_cache_key)
 
     # Step source. This currently only uses the string representation of the
     # source (e.g. my_module.step_class) instead of the full source to keep
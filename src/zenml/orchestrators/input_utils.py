@@ -133,7 +133,9 @@ def resolve_step_inputs(
 
     parent_step_ids = [
         current_run_steps[upstream_step].id
-        for upstream_step in step.spec.upstream_steps
+        for upstream_step in (
+            step.spec.upstream_steps + step.spec.reused_upstream_steps
+        )
     ]
 
     return input_artifacts, parent_step_ids
@@ -125,14 +125,17 @@ def publish_pipeline_run_metadata(
         pipeline_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
-    for stack_component_id, metadata in pipeline_run_metadata.items():
-        client.create_run_metadata(
-            metadata=metadata,
-            resource_id=pipeline_run_id,
-            resource_type=MetadataResourceTypes.PIPELINE_RUN,
-            stack_component_id=stack_component_id,
-        )
+    Client().create_run_metadata_batch(
+        [
+            (
+                metadata,
+                pipeline_run_id,
+                MetadataResourceTypes.PIPELINE_RUN,
+                stack_component_id,
+            )
+            for stack_component_id, metadata in pipeline_run_metadata.items()
+        ]
+    )
 
 
 def publish_step_run_metadata(
@@ -146,11 +149,14 @@ def publish_step_run_metadata(
         step_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
-    for stack_component_id, metadata in step_run_metadata.items():
-        client.create_run_metadata(
-            metadata=metadata,
-            resource_id=step_run_id,
-            resource_type=MetadataResourceTypes.STEP_RUN,
-            stack_component_id=stack_component_id,
-        )
+    Client().create_run_metadata_batch(
+        [
+            (
+                metadata,
+                step_run_id,
+                MetadataResourceTypes.STEP_RUN,
+                stack_component_id,
+            )
+            for stack_component_id, metadata in step_run_metadata.items()
+        ]
+    )
@@ -18,7 +18,9 @@ import time
 from contextlib import nullcontext
 from datetime import datetime
 from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple
+from uuid import UUID, uuid4
+from weakref import WeakKeyDictionary
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
@@ -30,7 +32,7 @@ from zenml.constants import (
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
 )
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, StoreType
 from zenml.environment import get_run_environment_dict
 from zenml.logger import get_logger
 from zenml.logging import step_logging
@@ -40,6 +42,7 @@ from zenml.models import (
     PipelineDeploymentResponse,
     PipelineRunRequest,
     PipelineRunResponse,
+    StepRunBeginRequest,
     StepRunRequest,
     StepRunResponse,
 )
@@ -55,10 +58,27 @@ from zenml.stack import Stack
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
+    from zenml.model.model import Model
     from zenml.step_operators import BaseStepOperator
 
 logger = get_logger(__name__)
 
+# The source code of a step is stored once per code hash by the ZenML store,
+# so it only needs to be sent with the first step run of each code hash. Older
+# servers still store it with each step run and always need it. The uploaded
+# sources are tracked per client instance as tuples of the store URL and the
+# code hash, which forgets them once the client gets reset.
+_UPLOADED_STEP_SOURCES: "WeakKeyDictionary[Client, Set[Tuple[str, str]]]" = (
+    WeakKeyDictionary()
+)
+
+# Whether the ZenML store supports beginning step runs in a single request is
+# only known once the first step run was begun. The support is tracked per
+# client instance by the store URL.
+_BEGIN_STEP_RUN_SUPPORT: "WeakKeyDictionary[Client, Dict[str, bool]]" = (
+    WeakKeyDictionary()
+)
+
 
 def _get_step_operator(
     stack: "Stack", step_operator_name: str
@@ -93,6 +113,66 @@ def _get_step_operator(
     return step_operator
 
 
+def _supports_beginning_step_runs() -> Optional[bool]:
+    """Checks whether the active ZenML store supports beginning step runs.
+
+    Returns:
+        Whether the store supports beginning step runs in a single request or
+        `None` if this is not known yet.
+    """
+    client = Client()
+    return _BEGIN_STEP_RUN_SUPPORT.get(client, {}).get(client.zen_store.url)
+
+
+def _remember_begin_step_run_support(supported: bool) -> None:
+    """Remembers whether the active ZenML store supports beginning step runs.
+
+    Args:
+        supported: Whether the store supports beginning step runs in a single
+            request.
+    """
+    client = Client()
+    _BEGIN_STEP_RUN_SUPPORT.setdefault(client, {})[client.zen_store.url] = (
+        supported
+    )
+
+
+def _stores_step_sources_once() -> bool:
+    """Checks whether the active ZenML store stores step sources once.
+
+    This applies to SQL stores and all servers that support beginning step
+    runs in a single request.
+
+    Returns:
+        Whether the store is known to store the source code of steps once per
+        code hash.
+    """
+    return (
+        Client().zen_store.type == StoreType.SQL
+        or _supports_beginning_step_runs() is True
+    )
+
+
+def _remember_uploaded_step_source(step_run: StepRunRequest) -> None:
+    """Remembers that the source code of a step run was stored.
+
+    The source code is only remembered for stores which are known to store it
+    once per code hash.
+
+    Args:
+        step_run: The step run request that was sent to the ZenML store.
+    """
+    if not _stores_step_sources_once():
+        return
+
+    client = Client()
+
+    if step_run.code_hash and step_run.source_code is not None:
+        _UPLOADED_STEP_SOURCES.setdefault(client, set()).add(
+            (client.zen_store.url, step_run.code_hash)
+        )
+
+
 class StepLauncher:
     """A class responsible for launching a step of a ZenML pipeline.
 
@@ -145,8 +225,6 @@ class StepLauncher:
         Raises:
             BaseException: If the step failed to launch, run, or publish.
         """
-        pipeline_run, run_was_created = self._create_or_reuse_run()
-
         # Enable or disable step logs storage
         if handle_bool_env_var(ENV_ZENML_DISABLE_STEP_LOGS_STORAGE, False):
             step_logging_enabled = False
@@ -156,181 +234,227 @@ class StepLauncher:
                 is_enabled_on_pipeline=self._deployment.pipeline_configuration.enable_step_logs,
             )
 
-        logs_context = nullcontext()
+        logs_uri = None
         logs_model = None
 
         if step_logging_enabled:
-            # Configure the logs
-            logs_uri = step_logging.prepare_logs_uri(
+            # Only generate the URI here: The logs storage is prepared once
+            # it's clear that the step needs to be executed or failed to be
+            # prepared, so cached steps don't access the artifact store at
+            # all. Messages logged while preparing a step that gets executed
+            # are therefore only shown in the console.
+            logs_uri = step_logging.get_logs_uri(
                 self._stack.artifact_store,
                 self._step.config.name,
             )
-
-            logs_context = step_logging.StepLogsStorageContext(
-                logs_uri=logs_uri
-            )  # type: ignore[assignment]
-
             logs_model = LogsRequest(
                 uri=logs_uri,
                 artifact_store_id=self._stack.artifact_store.id,
             )
 
+        step_run_begin_request: Optional[StepRunBeginRequest] = None
+        if self._can_begin_step_run_in_single_request():
+            try:
+                step_run_begin_request = self._get_step_run_begin_request(
+                    logs_model=logs_model
+                )
+            except Exception as e:
+                # Nothing was sent to the ZenML store yet, so the step can
+                # still be prepared on the client, which reports errors like
+                # missing inputs in the failed step run.
+                logger.debug(
+                    "Failed to create the request to begin step `%s`, "
+                    "falling back to separate requests: %s",
+                    self._step_name,
+                    e,
+                )
+
+        step_run_response: Optional[StepRunResponse] = None
+        if step_run_begin_request:
+            try:
+                response = Client().zen_store.begin_run_step(
+                    step_run_begin_request
+                )
+            except NotImplementedError as e:
+                _remember_begin_step_run_support(supported=False)
+                logger.debug(
+                    "Failed to begin step `%s` in a single request, falling "
+                    "back to separate requests: %s",
+                    self._step_name,
+                    e,
+                )
+            except OSError:
+                # Connection errors might have lost the response of a request
+                # that was processed, so beginning the step again could
+                # create a second step run
+                raise
+            except Exception as e:
+                # The ZenML store rejected the step run, e.g. because its
+                # inputs could not be resolved, but the pipeline run might
+                # already exist. The step is prepared on the client instead,
+                # which records the error in a failed step run.
+                _remember_begin_step_run_support(supported=True)
+                logger.debug(
+                    "Failed to begin step `%s` in a single request, falling "
+                    "back to separate requests: %s",
+                    self._step_name,
+                    e,
+                )
+            else:
+                _remember_begin_step_run_support(supported=True)
+                _remember_uploaded_step_source(step_run_begin_request.step_run)
+                pipeline_run = response.pipeline_run
+                run_was_created = response.pipeline_run_created
+                step_run_response = response.step_run
+
+        if step_run_response is None:
+            pipeline_run, run_was_created = self._create_or_reuse_run()
+
         try:
-            with logs_context:
-                if run_was_created:
-                    pipeline_run_metadata = (
-                        self._stack.get_pipeline_run_metadata(
-                            run_id=pipeline_run.id
-                        )
-                    )
-                    publish_utils.publish_pipeline_run_metadata(
-                        pipeline_run_id=pipeline_run.id,
-                        pipeline_run_metadata=pipeline_run_metadata,
-                    )
-                client = Client()
-                (
-                    docstring,
-                    source_code,
-                ) = self._get_step_docstring_and_source_code()
-
-                code_hash = self._deployment.step_configurations[
-                    self._step_name
-                ].config.caching_parameters.get(STEP_SOURCE_PARAMETER_NAME)
-                step_run = StepRunRequest(
-                    name=self._step_name,
+            if run_was_created:
+                pipeline_run_metadata = self._stack.get_pipeline_run_metadata(
+                    run_id=pipeline_run.id
+                )
+                publish_utils.publish_pipeline_run_metadata(
                     pipeline_run_id=pipeline_run.id,
-                    deployment=self._deployment.id,
-                    code_hash=code_hash,
-                    status=ExecutionStatus.RUNNING,
-                    docstring=docstring,
-                    source_code=source_code,
-                    start_time=datetime.utcnow(),
-                    user=client.active_user.id,
-                    workspace=client.active_workspace.id,
-                    logs=logs_model,
+                    pipeline_run_metadata=pipeline_run_metadata,
+                )
+            if step_run_response is None:
+                step_run = self._get_step_run_request(
+                    pipeline_run_id=pipeline_run.id, logs_model=logs_model
                 )
                 try:
                     execution_needed, step_run = self._prepare(
                         step_run=step_run
                     )
                 except:
-                    logger.exception(
-                        f"Failed preparing run step `{self._step_name}`."
-                    )
                     step_run.status = ExecutionStatus.FAILED
                     step_run.end_time = datetime.utcnow()
+                    failure_logs_context = nullcontext()
+                    if logs_uri:
+                        step_logging.prepare_logs_storage(
+                            self._stack.artifact_store, logs_uri
+                        )
+                        failure_logs_context = (
+                            step_logging.StepLogsStorageContext(  # type: ignore[assignment]
+                                logs_uri=logs_uri
+                            )
+                        )
+                    with failure_logs_context:
+                        logger.exception(
+                            f"Failed preparing run step `{self._step_name}`."
+                        )
                     raise
                 finally:
                     step_run_response = Client().zen_store.create_run_step(
                         step_run
                     )
-
-                    # warm-up and register model version
-                    _step_run = None
-                    model = (
-                        self._deployment.step_configurations[
-                            step_run.name
-                        ].config.model
-                        or self._deployment.pipeline_configuration.model
+                    _remember_uploaded_step_source(step_run)
+                    model = self._prepare_model_version(
+                        pipeline_run=pipeline_run,
+                        step_run=step_run_response,
                     )
-                    if self._deployment.step_configurations[
-                        step_run.name
-                    ].config.model:
-                        _step_run = step_run_response
-
-                    if model:
-                        prep_logs_to_show = (
-                            model._prepare_model_version_before_step_launch(
-                                pipeline_run=pipeline_run,
-                                step_run=_step_run,
-                                return_logs=True,
-                            )
-                        )
-                        if prep_logs_to_show:
-                            logger.info(prep_logs_to_show)
+            else:
+                execution_needed = (
+                    step_run_response.status != ExecutionStatus.CACHED
+                )
+                if not execution_needed:
+                    logger.info(
+                        f"Using cached version of `{self._step_name}`."
+                    )
+                model = self._prepare_model_version(
+                    pipeline_run=pipeline_run,
+                    step_run=step_run_response,
+                )
+
+            if not execution_needed:
+                self._link_cached_step_run_to_model(
+                    pipeline_run=pipeline_run,
+                    step_run=step_run_response,
+                    model=model,
+                )
+                return
+
+            logs_context = nullcontext()
+            if logs_uri:
+                step_logging.prepare_logs_storage(
+                    self._stack.artifact_store, logs_uri
+                )
+                logs_context = step_logging.StepLogsStorageContext(
+                    logs_uri=logs_uri
+                )  # type: ignore[assignment]
 
+            with logs_context:
                 logger.info(f"Step `{self._step_name}` has started.")
-                if execution_needed:
-                    retries = 0
-                    last_retry = True
-                    max_retries = (
-                        step_run_response.config.retry.max_retries
-                        if step_run_response.config.retry
-                        else 1
-                    )
-                    delay = (
-                        step_run_response.config.retry.delay
-                        if step_run_response.config.retry
-                        else 0
-                    )
-                    backoff = (
-                        step_run_response.config.retry.backoff
-                        if step_run_response.config.retry
-                        else 1
-                    )
+                retries = 0
+                last_retry = True
+                max_retries = (
+                    step_run_response.config.retry.max_retries
+                    if step_run_response.config.retry
+                    else 1
+                )
+                delay = (
+                    step_run_response.config.retry.delay
+                    if step_run_response.config.retry
+                    else 0
+                )
+                backoff = (
+                    step_run_response.config.retry.backoff
+                    if step_run_response.config.retry
+                    else 1
+                )
 
-                    while retries < max_retries:
-                        last_retry = retries == max_retries - 1
-                        try:
-                            # here pass a forced save_to_file callable to be
-                            # used as a dump function to use before starting
-                            # the external jobs in step operators
-                            if isinstance(
-                                logs_context,
-                                step_logging.StepLogsStorageContext,
-                            ):
-                                force_write_logs = partial(
-                                    logs_context.storage.save_to_file,
-                                    force=True,
-                                )
-                            else:
-
-                                def _bypass() -> None:
-                                    return None
-
-                                force_write_logs = _bypass
-                            self._run_step(
-                                pipeline_run=pipeline_run,
-                                step_run=step_run_response,
-                                last_retry=last_retry,
-                                force_write_logs=force_write_logs,
+                while retries < max_retries:
+                    last_retry = retries == max_retries - 1
+                    try:
+                        # here pass a forced save_to_file callable to be
+                        # used as a dump function to use before starting
+                        # the external jobs in step operators
+                        if isinstance(
+                            logs_context,
+                            step_logging.StepLogsStorageContext,
+                        ):
+                            force_write_logs = partial(
+                                logs_context.storage.save_to_file,
+                                force=True,
                             )
+                        else:
+
+                            def _bypass() -> None:
+                                return None
+
+                            force_write_logs = _bypass
+                        self._run_step(
+                            pipeline_run=pipeline_run,
+                            step_run=step_run_response,
+                            last_retry=last_retry,
+                            force_write_logs=force_write_logs,
+                        )
+                        logger.info(
+                            f"Step `{self._step_name}` completed successfully."
+                        )
+                        break
+                    except BaseException as e:  # noqa: E722
+                        retries += 1
+                        if retries < max_retries:
+                            logger.error(
+                                f"Failed to run step `{self._step_name}`. Retrying..."
+                            )
+                            logger.exception(e)
                             logger.info(
-                                f"Step `{self._step_name}` completed successfully."
+                                f"Sleeping for {delay} seconds before retrying."
                             )
-                            break
-                        except BaseException as e:  # noqa: E722
-                            retries += 1
-                            if retries < max_retries:
-                                logger.error(
-                                    f"Failed to run step `{self._step_name}`. Retrying..."
-                                )
-                                logger.exception(e)
-                                logger.info(
-                                    f"Sleeping for {delay} seconds before retrying."
-                                )
-                                time.sleep(delay)
-                                delay *= backoff
-                            else:
-                                logger.error(
-                                    f"Failed to run step `{self._step_name}` after {max_retries} retries. Exiting."
-                                )
-                                logger.exception(e)
-                                publish_utils.publish_failed_step_run(
-                                    step_run_response.id
-                                )
-                                raise
-                else:
-                    orchestrator_utils._link_cached_artifacts_to_model(
-                        model_from_context=model,
-                        step_run=step_run,
-                        step_source=self._step.spec.source,
-                    )
-                    if model:
-                        orchestrator_utils._link_pipeline_run_to_model_from_context(
-                            pipeline_run_id=step_run.pipeline_run_id,
-                            model=model,
-                        )
+                            time.sleep(delay)
+                            delay *= backoff
+                        else:
+                            logger.error(
+                                f"Failed to run step `{self._step_name}` after {max_retries} retries. Exiting."
+                            )
+                            logger.exception(e)
+                            publish_utils.publish_failed_step_run(
+                                step_run_response.id
+                            )
+                            raise
 
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
@@ -359,12 +483,11 @@ class StepLauncher:
 
         return docstring, source_code
 
-    def _create_or_reuse_run(self) -> Tuple[PipelineRunResponse, bool]:
-        """Creates a pipeline run or reuses an existing one.
+    def _get_pipeline_run_request(self) -> PipelineRunRequest:
+        """Gets the request to create or reuse the pipeline run.
 
         Returns:
-            The created or existing pipeline run,
-            and a boolean indicating whether the run was created or reused.
+            The pipeline run request.
         """
         run_name = orchestrator_utils.get_run_name(
             run_name_template=self._deployment.run_name_template
@@ -373,7 +496,7 @@ class StepLauncher:
         logger.debug("Creating pipeline run %s", run_name)
 
         client = Client()
-        pipeline_run = PipelineRunRequest(
+        return PipelineRunRequest(
             name=run_name,
             orchestrator_run_id=self._orchestrator_run_id,
             user=client.active_user.id,
@@ -388,7 +511,182 @@ class StepLauncher:
             orchestrator_environment=get_run_environment_dict(),
             start_time=datetime.utcnow(),
         )
-        return client.zen_store.get_or_create_run(pipeline_run)
+
+    def _create_or_reuse_run(self) -> Tuple[PipelineRunResponse, bool]:
+        """Creates a pipeline run or reuses an existing one.
+
+        Returns:
+            The created or existing pipeline run,
+            and a boolean indicating whether the run was created or reused.
+        """
+        return Client().zen_store.get_or_create_run(
+            self._get_pipeline_run_request()
+        )
+
+    def _get_step_run_request(
+        self, pipeline_run_id: UUID, logs_model: Optional[LogsRequest]
+    ) -> StepRunRequest:
+        """Gets the request to create the step run.
+
+        Args:
+            pipeline_run_id: The ID of the pipeline run of the step.
+            logs_model: The logs of the step run.
+
+        Returns:
+            The step run request.
+        """
+        client = Client()
+        code_hash = self._deployment.step_configurations[
+            self._step_name
+        ].config.caching_parameters.get(STEP_SOURCE_PARAMETER_NAME)
+
+        docstring, source_code = None, None
+        uploaded_sources = _UPLOADED_STEP_SOURCES.get(client, set())
+        if (client.zen_store.url, code_hash) not in uploaded_sources:
+            (
+                docstring,
+                source_code,
+            ) = self._get_step_docstring_and_source_code()
+
+        return StepRunRequest(
+            name=self._step_name,
+            pipeline_run_id=pipeline_run_id,
+            deployment=self._deployment.id,
+            code_hash=code_hash,
+            status=ExecutionStatus.RUNNING,
+            docstring=docstring,
+            source_code=source_code,
+            start_time=datetime.utcnow(),
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            logs=logs_model,
+        )
+
+    def _can_begin_step_run_in_single_request(self) -> bool:
+        """Checks whether the step run can be begun in a single request.
+
+        Inputs and parameters that are loaded from models or by lazy loaders
+        need to be resolved on the client before the cache key can be
+        computed, which requires separate requests. The same applies to
+        servers which are known to not support beginning step runs.
+
+        Returns:
+            Whether the step run can be begun in a single request.
+        """
+        return (
+            not self._step.config.model_artifacts_or_metadata
+            and not self._step.config.client_lazy_loaders
+            and _supports_beginning_step_runs() is not False
+        )
+
+    def _get_step_run_begin_request(
+        self, logs_model: Optional[LogsRequest]
+    ) -> StepRunBeginRequest:
+        """Gets the request to create or reuse the run and begin the step run.
+
+        The step inputs, parent steps and the cache key are resolved on the
+        server, which allows the step to start after a single request.
+
+        Args:
+            logs_model: The logs of the step run.
+
+        Returns:
+            The request to begin the step run.
+        """
+        # The ID of the pipeline run is not known yet and gets set by the
+        # server once the run was created or reused
+        step_run = self._get_step_run_request(
+            pipeline_run_id=uuid4(), logs_model=logs_model
+        )
+        step_run.inputs = {
+            name: external_artifact.get_artifact_version_id()
+            for name, external_artifact in self._step.config.external_input_artifacts.items()
+        }
+
+        artifact_store = self._stack.artifact_store
+        custom_cache_key = artifact_store.custom_cache_key
+        return StepRunBeginRequest(
+            pipeline_run=self._get_pipeline_run_request(),
+            step_run=step_run,
+            artifact_store_id=artifact_store.id,
+            artifact_store_path=artifact_store.path,
+            artifact_store_cache_key=(
+                custom_cache_key.hex() if custom_cache_key else None
+            ),
+            cache_enabled=self._is_cache_enabled(),
+        )
+
+    def _is_cache_enabled(self) -> bool:
+        """Checks whether caching is enabled for the step.
+
+        Returns:
+            Whether caching is enabled for the step.
+        """
+        step_cache = self._step.config.enable_cache
+        if step_cache is not None:
+            logger.info(
+                f"Caching {'`enabled`' if step_cache else '`disabled`'} "
+                f"explicitly for `{self._step_name}`."
+            )
+
+        return orchestrator_utils.is_setting_enabled(
+            is_enabled_on_step=step_cache,
+            is_enabled_on_pipeline=self._deployment.pipeline_configuration.enable_cache,
+        )
+
+    def _prepare_model_version(
+        self, pipeline_run: PipelineRunResponse, step_run: StepRunResponse
+    ) -> Optional["Model"]:
+        """Warms up and registers the model version of the step.
+
+        Args:
+            pipeline_run: The pipeline run of the step.
+            step_run: The step run.
+
+        Returns:
+            The model configured for the step or pipeline, if any.
+        """
+        step_model = self._deployment.step_configurations[
+            self._step_name
+        ].config.model
+        model = step_model or self._deployment.pipeline_configuration.model
+
+        if model:
+            prep_logs_to_show = (
+                model._prepare_model_version_before_step_launch(
+                    pipeline_run=pipeline_run,
+                    step_run=step_run if step_model else None,
+                    return_logs=True,
+                )
+            )
+            if prep_logs_to_show:
+                logger.info(prep_logs_to_show)
+
+        return model
+
+    def _link_cached_step_run_to_model(
+        self,
+        pipeline_run: PipelineRunResponse,
+        step_run: StepRunResponse,
+        model: Optional["Model"],
+    ) -> None:
+        """Links the outputs and pipeline run of a cached step to the model.
+
+        Args:
+            pipeline_run: The pipeline run of the step.
+            step_run: The cached step run.
+            model: The model configured for the step or pipeline, if any.
+        """
+        orchestrator_utils._link_cached_artifacts_to_model(
+            model_from_context=model,
+            step_run=step_run,
+            step_source=self._step.spec.source,
+        )
+        if model:
+            orchestrator_utils._link_pipeline_run_to_model_from_context(
+                pipeline_run_id=pipeline_run.id,
+                model=model,
+            )
 
     def _prepare(
         self,
@@ -423,20 +721,8 @@ class StepLauncher:
         step_run.parent_step_ids = parent_step_ids
         step_run.cache_key = cache_key
 
-        cache_enabled = orchestrator_utils.is_setting_enabled(
-            is_enabled_on_step=self._step.config.enable_cache,
-            is_enabled_on_pipeline=self._deployment.pipeline_configuration.enable_cache,
-        )
-
-        step_cache = self._step.config.enable_cache
-        if step_cache is not None:
-            logger.info(
-                f"Caching {'`enabled`' if step_cache else '`disabled`'} "
-                f"explicitly for `{self._step_name}`."
-            )
-
         execution_needed = True
-        if cache_enabled:
+        if self._is_cache_enabled():
             cached_step_run = cache_utils.get_cached_step_run(
                 cache_key=cache_key
             )
@@ -454,6 +740,14 @@ class StepLauncher:
                 step_run.status = ExecutionStatus.CACHED
                 step_run.end_time = step_run.start_time
 
+                # Cached steps don't write logs. Stores which store the
+                # source code once per code hash already have it from the
+                # original step run, others store it with each step run.
+                step_run.logs = None
+                if _stores_step_sources_once():
+                    step_run.docstring = None
+                    step_run.source_code = None
+
         return execution_needed, step_run
 
     def _run_step(
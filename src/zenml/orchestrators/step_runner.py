@@ -16,11 +16,13 @@
 
 import copy
 import inspect
-from contextlib import nullcontext
+import os
+from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -30,6 +32,7 @@ from uuid import UUID
 
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.artifacts.utils import save_artifact
+from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
 from zenml.constants import (
@@ -37,10 +40,12 @@ from zenml.constants import (
     ENV_ZENML_IGNORE_FAILURE_HOOK,
     handle_bool_env_var,
 )
+from zenml.enums import MetadataResourceTypes
 from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
 from zenml.logging.step_logging import StepLogsStorageContext, redirected
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.metadata.metadata_types import Uri
 from zenml.model.utils import (
     link_step_artifacts_to_model,
 )
@@ -60,12 +65,13 @@ from zenml.steps.utils import (
     parse_return_type_annotations,
     resolve_type_annotation,
 )
-from zenml.utils import materializer_utils, source_utils
+from zenml.utils import materializer_utils, profiling_utils, source_utils
 from zenml.utils.typing_utils import get_origin, is_union
 
 if TYPE_CHECKING:
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.models import (
         ArtifactVersionResponse,
         PipelineRunResponse,
@@ -143,7 +149,7 @@ class StepRunner:
                     "step logging storage is disabled."
                 )
 
-        with logs_context:
+        with logs_context, self._profile(step_run_info=step_run_info):
             step_instance = self._load_step()
             output_materializers = self._load_output_materializers()
             spec = inspect.getfullargspec(
@@ -183,11 +189,12 @@ class StepRunner:
                 )
 
                 # Parse the inputs for the entrypoint function.
-                function_params = self._parse_inputs(
-                    args=spec.args,
-                    annotations=spec.annotations,
-                    input_artifacts=input_artifacts,
-                )
+                with profiling_utils.profile_phase("input_loading"):
+                    function_params = self._parse_inputs(
+                        args=spec.args,
+                        annotations=spec.annotations,
+                        input_artifacts=input_artifacts,
+                    )
 
                 _link_pipeline_run_to_model_from_context(
                     pipeline_run_id=pipeline_run.id
@@ -195,9 +202,10 @@ class StepRunner:
 
                 step_failed = False
                 try:
-                    return_values = step_instance.call_entrypoint(
-                        **function_params
-                    )
+                    with profiling_utils.profile_phase("step_function"):
+                        return_values = step_instance.call_entrypoint(
+                            **function_params
+                        )
                 except BaseException as step_exception:  # noqa: E722
                     step_failed = True
                     if not handle_bool_env_var(
@@ -214,6 +222,16 @@ class StepRunner:
                             )
                     raise
                 finally:
+                    # Publish the run metadata that was logged while the step
+                    # function was running. Failing to do so must neither
+                    # replace the exception of the step nor skip the cleanup.
+                    try:
+                        get_step_context()._flush_run_metadata(close=True)
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to publish the run metadata logged by "
+                            f"step `{step_run.name}`: {e}"
+                        )
                     step_run_metadata = self._stack.get_step_run_metadata(
                         info=step_run_info,
                     )
@@ -247,14 +265,15 @@ class StepRunner:
                             is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
                             is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
                         )
-                        output_artifact_ids = self._store_output_artifacts(
-                            output_data=output_data,
-                            output_artifact_uris=output_artifact_uris,
-                            output_materializers=output_materializers,
-                            output_annotations=output_annotations,
-                            artifact_metadata_enabled=artifact_metadata_enabled,
-                            artifact_visualization_enabled=artifact_visualization_enabled,
-                        )
+                        with profiling_utils.profile_phase("output_storing"):
+                            output_artifact_ids = self._store_output_artifacts(
+                                output_data=output_data,
+                                output_artifact_uris=output_artifact_uris,
+                                output_materializers=output_materializers,
+                                output_annotations=output_annotations,
+                                artifact_metadata_enabled=artifact_metadata_enabled,
+                                artifact_visualization_enabled=artifact_visualization_enabled,
+                            )
                         link_step_artifacts_to_model(
                             artifact_version_ids=output_artifact_ids
                         )
@@ -273,6 +292,77 @@ class StepRunner:
                 output_artifact_ids=output_artifact_ids,
             )
 
+    @contextmanager
+    def _profile(self, step_run_info: StepRunInfo) -> Iterator[None]:
+        """Profiles the step run if enabled in the profiling settings.
+
+        Once the step run finishes, the recorded timings and counters are
+        published as run metadata of the step run.
+
+        Args:
+            step_run_info: The step run info.
+
+        Yields:
+            None.
+        """
+        settings = self.configuration.profiling_settings
+        if not settings.enabled:
+            yield
+            return
+
+        profiler = profiling_utils.StepProfiler(
+            capture_cprofile=settings.capture_cprofile
+        )
+        try:
+            with profiler:
+                yield
+        finally:
+            self._publish_profile(
+                profiler=profiler, step_run_info=step_run_info
+            )
+
+    def _publish_profile(
+        self,
+        profiler: profiling_utils.StepProfiler,
+        step_run_info: StepRunInfo,
+    ) -> None:
+        """Publishes the results of a step profiler.
+
+        Args:
+            profiler: The profiler of the step run.
+            step_run_info: The step run info.
+        """
+        metadata: Dict[str, "MetadataType"] = {
+            profiling_utils.PROFILING_METADATA_KEY: profiler.get_run_metadata()
+        }
+        try:
+            if cprofile_stats := profiler.get_cprofile_stats():
+                artifact_store = self._stack.artifact_store
+                stats_uri = os.path.join(
+                    artifact_store.path,
+                    "profiles",
+                    step_run_info.pipeline_step_name,
+                    f"{step_run_info.step_run_id}.prof",
+                )
+                artifact_store.makedirs(os.path.dirname(stats_uri))
+                with artifact_store.open(stats_uri, "wb") as file:
+                    file.write(cprofile_stats)
+                metadata[profiling_utils.CPROFILE_STATS_METADATA_KEY] = Uri(
+                    stats_uri
+                )
+
+            Client().create_run_metadata(
+                metadata=metadata,
+                resource_id=step_run_info.step_run_id,
+                resource_type=MetadataResourceTypes.STEP_RUN,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish the profile of step `%s`: %s",
+                step_run_info.pipeline_step_name,
+                e,
+            )
+
     def _load_step(self) -> "BaseStep":
         """Load the step instance.
 
@@ -667,7 +757,8 @@ class StepRunner:
                 step_exception=step_exception,
             )
             logger.debug(f"Running hook {hook} with params: {function_params}")
-            hook(**function_params)
+            with profiling_utils.profile_phase("hooks"):
+                hook(**function_params)
         except Exception as e:
             logger.error(
                 f"Failed to load hook source with exception: '{hook_source}': "
@@ -33,8 +33,8 @@ from zenml.constants import (
 from zenml.enums import StackComponentType, StoreType
 from zenml.exceptions import StepContextError
 from zenml.logger import get_logger
-from zenml.model.utils import link_artifact_config_to_model
-from zenml.models.v2.core.step_run import StepRunRequest
+from zenml.model.utils import link_artifact_configs_to_model
+from zenml.models.v2.core.step_run import StepRunResponse
 from zenml.new.steps.step_context import get_step_context
 from zenml.stack import StackComponent
 from zenml.utils.string_utils import format_name_template
@@ -204,14 +204,14 @@ def _get_model_versions_from_config() -> Tuple[Optional[UUID], Optional[UUID]]:
 
 def _link_cached_artifacts_to_model(
     model_from_context: Optional["Model"],
-    step_run: StepRunRequest,
+    step_run: StepRunResponse,
     step_source: Source,
 ) -> None:
     """Links the output artifacts of the cached step to the model version in Control Plane.
 
     Args:
         model_from_context: The model version of the current step.
-        step_run: The step to run.
+        step_run: The cached step run.
         step_source: The source of the step.
     """
     from zenml.artifacts.artifact_config import ArtifactConfig
@@ -222,7 +222,8 @@ def _link_cached_artifacts_to_model(
     output_annotations = parse_return_type_annotations(
         step_instance.entrypoint
     )
-    for output_name_, output_id in step_run.outputs.items():
+    artifact_configs = []
+    for output_name_, output in step_run.outputs.items():
         artifact_config_ = None
         if output_name_ in output_annotations:
             annotation = output_annotations.get(output_name_, None)
@@ -233,11 +234,11 @@ def _link_cached_artifacts_to_model(
         if artifact_config_ is None:
             artifact_config_ = ArtifactConfig(name=output_name_)
 
-        link_artifact_config_to_model(
-            artifact_config=artifact_config_,
-            model=model_from_context,
-            artifact_version_id=output_id,
-        )
+        artifact_configs.append((artifact_config_, output.id))
+
+    link_artifact_configs_to_model(
+        artifact_configs=artifact_configs, model=model_from_context
+    )
 
 
 def _link_pipeline_run_to_model_from_artifacts(
@@ -0,0 +1,190 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache for service connector clients."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from typing_extensions import Protocol
+
+from zenml.constants import (
+    SERVICE_CONNECTOR_CLIENT_CACHE_SIZE,
+    SERVICE_CONNECTOR_CLIENT_CACHE_TTL,
+    SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS,
+)
+from zenml.logger import get_logger
+from zenml.utils.cache_utils import CacheStats, LRUCache
+
+logger = get_logger(__name__)
+
+
+class ExpiringCredentials(Protocol):
+    """Protocol for objects holding credentials that might expire."""
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """The expiration time of the credentials."""
+
+    @property
+    def expires_skew_tolerance(self) -> Optional[int]:
+        """The tolerance in seconds to subtract from the expiration time."""
+
+
+C = TypeVar("C", bound=ExpiringCredentials)
+
+ConnectorClientKey = Tuple[UUID, Optional[datetime], str, str]
+
+
+class ConnectorClientCache(Generic[C]):
+    """Cache for service connector clients.
+
+    Getting a connector client usually involves generating short-lived
+    credentials (e.g. STS tokens) with the cloud provider. This cache reuses
+    connector clients until their credentials are about to expire and makes
+    sure that concurrent requests for the same client only generate
+    credentials once.
+
+    Clients are cached by the ID and update time of the connector and by
+    the resource type and ID, so updating a connector invalidates all its
+    cached clients.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SERVICE_CONNECTOR_CLIENT_CACHE_SIZE,
+        ttl: Optional[float] = SERVICE_CONNECTOR_CLIENT_CACHE_TTL,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of connector clients to cache.
+            ttl: The maximum time in seconds to cache a connector client, even
+                if its credentials don't expire.
+        """
+        self._cache: LRUCache[ConnectorClientKey, C] = LRUCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._locks: Dict[ConnectorClientKey, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @staticmethod
+    def is_valid(connector_client: ExpiringCredentials) -> bool:
+        """Checks whether the credentials of a connector client are still valid.
+
+        Args:
+            connector_client: The connector client to check.
+
+        Returns:
+            False if the credentials expire within the skew tolerance of the
+            client, True otherwise.
+        """
+        if connector_client.expires_at is None:
+            return True
+
+        skew_tolerance = connector_client.expires_skew_tolerance
+        if skew_tolerance is None:
+            skew_tolerance = SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS
+
+        expires_at = connector_client.expires_at.replace(tzinfo=timezone.utc)
+        return expires_at - timedelta(seconds=skew_tolerance) > datetime.now(
+            timezone.utc
+        )
+
+    def get(self, key: ConnectorClientKey) -> Optional[C]:
+        """Gets a cached connector client if its credentials are still valid.
+
+        Args:
+            key: The cache key of the connector client.
+
+        Returns:
+            The cached connector client or None if no valid connector client
+            is cached.
+        """
+        connector_client = self._cache.get(key)
+        if connector_client is None:
+            return None
+
+        if not self.is_valid(connector_client):
+            self._cache.invalidate(key)
+            return None
+
+        return connector_client
+
+    def get_or_create(
+        self,
+        connector_id: UUID,
+        connector_updated: Optional[datetime],
+        resource_type: Optional[str],
+        resource_id: Optional[str],
+        create: Callable[[], C],
+    ) -> C:
+        """Gets a cached connector client or creates a new one.
+
+        Args:
+            connector_id: The ID of the connector.
+            connector_updated: The time the connector was last updated.
+            resource_type: The requested resource type.
+            resource_id: The requested resource ID.
+            create: Function that creates a new connector client.
+
+        Returns:
+            The cached or newly created connector client.
+        """
+        key = (
+            connector_id,
+            connector_updated,
+            resource_type or "",
+            resource_id or "",
+        )
+        if connector_client := self.get(key):
+            return connector_client
+
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            # Another thread might have created the connector client while
+            # we were waiting for the lock
+            if connector_client := self.get(key):
+                return connector_client
+
+            try:
+                logger.debug(
+                    f"Creating new client for service connector "
+                    f"{connector_id} and resource {resource_type} "
+                    f"{resource_id}."
+                )
+                connector_client = create()
+                if self.is_valid(connector_client):
+                    self._cache.set(key, connector_client)
+            finally:
+                with self._locks_lock:
+                    self._locks.pop(key, None)
+
+        return connector_client
+
+    def clear(self) -> None:
+        """Removes all connector clients from the cache."""
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hit and miss statistics of the cache.
+
+        Returns:
+            The cache statistics.
+        """
+        return self._cache.stats
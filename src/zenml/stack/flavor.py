@@ -14,7 +14,7 @@
 """Base ZenML Flavor implementation."""
 
 from abc import abstractmethod
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Dict, Optional, Tuple, Type, cast
 
 from zenml.enums import StackComponentType
 from zenml.models import (
@@ -25,8 +25,13 @@ from zenml.models import (
 from zenml.models.v2.core.flavor import InternalFlavorRequest
 from zenml.stack.stack_component import StackComponent, StackComponentConfig
 from zenml.utils import source_utils
+from zenml.utils.cache_utils import LRUCache
 from zenml.utils.package_utils import is_latest_zenml_version
 
+_FLAVOR_CLASS_CACHE: LRUCache[Tuple[str, Optional[str]], Type["Flavor"]] = (
+    LRUCache(maxsize=256)
+)
+
 
 class Flavor:
     """Class for ZenML Flavors."""
@@ -128,8 +133,15 @@ class Flavor:
         Returns:
             The loaded flavor.
         """
-        flavor = source_utils.load(flavor_model.source)()
-        return cast(Flavor, flavor)
+        key = (flavor_model.source, flavor_model.integration)
+        flavor_class = _FLAVOR_CLASS_CACHE.get(key)
+        if flavor_class is None:
+            flavor_class = cast(
+                Type[Flavor], source_utils.load(flavor_model.source)
+            )
+            _FLAVOR_CLASS_CACHE.set(key, flavor_class)
+
+        return flavor_class()
 
     def to_model(
         self,
@@ -22,6 +22,7 @@ from typing import (
     AbstractSet,
     Any,
     Dict,
+    Iterable,
     List,
     NoReturn,
     Optional,
@@ -37,6 +38,8 @@ from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
     ENV_ZENML_SECRET_VALIDATION_LEVEL,
     ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT,
+    STACK_CACHE_SIZE,
+    STACK_CACHE_TTL,
     handle_bool_env_var,
 )
 from zenml.enums import SecretValidationLevel, StackComponentType
@@ -45,6 +48,7 @@ from zenml.logger import get_logger
 from zenml.metadata.metadata_types import MetadataType
 from zenml.models import StackResponse
 from zenml.utils import pagination_utils, settings_utils
+from zenml.utils.cache_utils import LRUCache
 
 if TYPE_CHECKING:
     from zenml.alerter import BaseAlerter
@@ -75,7 +79,37 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-_STACK_CACHE: Dict[Tuple[UUID, Optional[datetime]], "Stack"] = {}
+_STACK_CACHE: LRUCache[Tuple[UUID, Optional[datetime]], "Stack"] = LRUCache(
+    maxsize=STACK_CACHE_SIZE, ttl=STACK_CACHE_TTL
+)
+
+
+def invalidate_stack_cache(
+    stack_id: Optional[UUID] = None, component_id: Optional[UUID] = None
+) -> None:
+    """Removes stacks from the stack instance cache.
+
+    If neither a stack nor a component ID is given, the whole cache is
+    cleared.
+
+    Args:
+        stack_id: ID of the stack to remove.
+        component_id: ID of a component. All stacks that contain this
+            component will be removed.
+    """
+    if stack_id is None and component_id is None:
+        _STACK_CACHE.clear()
+        return
+
+    def _matches(key: Tuple[UUID, Optional[datetime]], stack: "Stack") -> bool:
+        if key[0] == stack_id:
+            return True
+        return component_id is not None and any(
+            component.id == component_id
+            for component in stack.components.values()
+        )
+
+    _STACK_CACHE.invalidate_if(_matches)
 
 
 class Stack:
@@ -149,10 +183,9 @@ class Stack:
         Returns:
             The created Stack instance.
         """
-        global _STACK_CACHE
         key = (stack_model.id, stack_model.updated)
-        if key in _STACK_CACHE:
-            return _STACK_CACHE[key]
+        if cached_stack := _STACK_CACHE.get(key):
+            return cached_stack
 
         from zenml.stack import StackComponent
 
@@ -172,7 +205,7 @@ class Stack:
             name=stack_model.name,
             components=stack_components,
         )
-        _STACK_CACHE[key] = stack
+        _STACK_CACHE.set(key, stack)
 
         client = Client()
         if stack_model.id == client.active_stack_model.id:
@@ -647,22 +680,28 @@ class Stack:
                     )
                     logger.warning(message)
 
-            client = Client()
+            # Attempt to resolve all secrets through the secrets store at
+            # once. This also caches them for when the stack components
+            # resolve their secret references.
+            try:
+                secrets = Client().get_secrets_by_name(
+                    [secret_ref.name for secret_ref in required_secrets]
+                )
+            except NotImplementedError:
+                secrets = {}
 
-            # Attempt to resolve secrets through the secrets store
             for secret_ref in required_secrets.copy():
-                try:
-                    secret = client.get_secret(secret_ref.name)
-                    if (
-                        secret_validation_level
-                        == SecretValidationLevel.SECRET_AND_KEY_EXISTS
-                    ):
-                        _ = secret.values[secret_ref.key]
-                except (KeyError, NotImplementedError):
-                    pass
-                else:
-                    # Drop this secret from the list of required secrets
-                    required_secrets.remove(secret_ref)
+                secret = secrets.get(secret_ref.name)
+                if secret is None:
+                    continue
+                if (
+                    secret_validation_level
+                    == SecretValidationLevel.SECRET_AND_KEY_EXISTS
+                    and secret_ref.key not in secret.values
+                ):
+                    continue
+                # Drop this secret from the list of required secrets
+                required_secrets.remove(secret_ref)
 
             if not required_secrets:
                 return
@@ -888,11 +927,36 @@ class Stack:
         Args:
             info: Info about the step that will be executed.
         """
-        for component in self._get_active_components_for_step(
-            info.config
-        ).values():
+        components = self._get_active_components_for_step(info.config)
+        self._prefetch_secrets(components.values())
+        for component in components.values():
             component.prepare_step_run(info=info)
 
+    @staticmethod
+    def _prefetch_secrets(components: Iterable["StackComponent"]) -> None:
+        """Fetches the secrets referenced by stack components in bulk.
+
+        The fetched secrets are cached, so that resolving the secret
+        references of the components doesn't require a request per reference.
+
+        Args:
+            components: The components for which to fetch the secrets.
+        """
+        secret_names = {
+            secret_ref.name
+            for component in components
+            for secret_ref in component.config.required_secrets
+        }
+        if not secret_names:
+            return
+
+        try:
+            Client().get_secrets_by_name(sorted(secret_names))
+        except Exception as e:
+            # Missing secrets are reported once the components try to
+            # resolve them
+            logger.debug(f"Failed to prefetch stack secrets: {e}")
+
     def get_pipeline_run_metadata(
         self, run_id: UUID
     ) -> Dict[UUID, Dict[str, MetadataType]]:
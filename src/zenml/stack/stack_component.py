@@ -18,7 +18,17 @@ from abc import ABC
 from collections.abc import Mapping, Sequence
 from datetime import datetime
 from inspect import isclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -26,6 +36,10 @@ from pydantic import BaseModel, ConfigDict, model_validator
 from zenml.config.build_configuration import BuildConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import (
+    STACK_CACHE_TTL,
+    STACK_COMPONENT_CACHE_SIZE,
+)
 from zenml.enums import StackComponentType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
@@ -36,6 +50,7 @@ from zenml.utils import (
     settings_utils,
     typing_utils,
 )
+from zenml.utils.cache_utils import LRUCache
 
 if TYPE_CHECKING:
     from zenml.config.base_settings import BaseSettings
@@ -50,6 +65,30 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_COMPONENT_CACHE: LRUCache[
+    Tuple[UUID, Optional[datetime]], "StackComponent"
+] = LRUCache(maxsize=STACK_COMPONENT_CACHE_SIZE, ttl=STACK_CACHE_TTL)
+
+
+def invalidate_component_cache(component_id: Optional[UUID] = None) -> None:
+    """Removes components from the stack component instance cache.
+
+    Cached stacks that contain the component are removed as well.
+
+    Args:
+        component_id: ID of the component to remove. If not given, the whole
+            cache is cleared.
+    """
+    from zenml.stack.stack import invalidate_stack_cache
+
+    if component_id is None:
+        _COMPONENT_CACHE.clear()
+        invalidate_stack_cache()
+        return
+
+    _COMPONENT_CACHE.invalidate_if(lambda key, _: key[0] == component_id)
+    invalidate_stack_cache(component_id=component_id)
+
 
 class StackComponentConfig(BaseModel, ABC):
     """Base class for all ZenML stack component configs."""
@@ -389,6 +428,29 @@ class StackComponent:
     ) -> "StackComponent":
         """Creates a StackComponent from a ComponentModel.
 
+        Args:
+            component_model: The ComponentModel to create the StackComponent
+
+        Returns:
+            The created StackComponent.
+
+        Raises:
+            ImportError: If the flavor can't be imported.
+        """
+        key = (component_model.id, component_model.updated)
+        if cached_component := _COMPONENT_CACHE.get(key):
+            return cached_component
+
+        component = cls._from_model(component_model)
+        _COMPONENT_CACHE.set(key, component)
+        return component
+
+    @classmethod
+    def _from_model(
+        cls, component_model: "ComponentResponse"
+    ) -> "StackComponent":
+        """Instantiates a StackComponent from a ComponentModel.
+
         Args:
             component_model: The ComponentModel to create the StackComponent
 
@@ -19,8 +19,13 @@ from zenml.client import Client
 from zenml.enums import StackComponentType, StoreType
 from zenml.logger import get_logger
 from zenml.models import FlavorFilter, FlavorResponse
-from zenml.stack.flavor import Flavor
-from zenml.stack.stack_component import StackComponentConfig
+from zenml.stack.flavor import _FLAVOR_CLASS_CACHE, Flavor
+from zenml.stack.stack import _STACK_CACHE
+from zenml.stack.stack_component import (
+    _COMPONENT_CACHE,
+    StackComponentConfig,
+)
+from zenml.utils.cache_utils import CacheStats
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
 logger = get_logger(__name__)
@@ -148,3 +153,17 @@ def get_flavor_by_name_and_type_from_zen_store(
             f"'{component_type}' exists."
         )
     return flavors[0]
+
+
+def get_instance_cache_stats() -> Dict[str, CacheStats]:
+    """Get the statistics of the stack, component and flavor caches.
+
+    Returns:
+        The hit and miss statistics of the caches used when instantiating
+        stacks, stack components and flavors from their models.
+    """
+    return {
+        "stacks": _STACK_CACHE.stats,
+        "components": _COMPONENT_CACHE.stats,
+        "flavors": _FLAVOR_CLASS_CACHE.stats,
+    }
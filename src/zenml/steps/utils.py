@@ -470,10 +470,17 @@ def log_step_metadata(
             "within a step. Please provide a step name."
         )
 
-    client = Client()
     if step_context:
-        step_run_id = step_context.step_run.id
-    elif run_id:
+        # Buffered and published once the step function finished
+        step_context.add_run_metadata(
+            metadata=metadata,
+            resource_id=step_context.step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+        )
+        return
+
+    client = Client()
+    if run_id:
         step_run_id = UUID(int=int(run_id))
     else:
         if not pipeline_name_id_or_prefix:
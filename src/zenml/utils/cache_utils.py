@@ -0,0 +1,158 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions and classes for in-memory caching."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe LRU cache with an optional time-to-live for entries.
+
+    Once the cache is full, the least recently used entry is evicted to make
+    room for a new one. If a TTL is configured, entries older than the TTL
+    are treated as missing.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of entries to keep in the cache.
+            ttl: The time in seconds after which an entry expires. If not
+                set, entries only get evicted when the cache is full.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Gets a value from the cache.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The cached value or `None` if the key is not in the cache or
+            the entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            created, value = entry
+            if self.ttl is not None and time.monotonic() - created > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Stores a value in the cache.
+
+        Args:
+            key: The key of the value.
+            value: The value to store.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Removes a value from the cache.
+
+        Args:
+            key: The key of the value to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """Removes all values from the cache that match a predicate.
+
+        Args:
+            predicate: Function that receives the key and value of an entry
+                and returns whether the entry should be removed.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all values from the cache and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hit and miss statistics of the cache.
+
+        Returns:
+            The cache statistics.
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        """Number of entries in the cache.
+
+        Returns:
+            The number of entries in the cache.
+        """
+        return len(self._entries)
@@ -0,0 +1,342 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions and classes to profile step runs."""
+
+import cProfile
+import marshal
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+PROFILING_METADATA_KEY = "profiling"
+CPROFILE_STATS_METADATA_KEY = "profiling_cprofile_stats"
+
+STORE_REQUESTS_COUNTER = "store_requests"
+BYTES_READ_COUNTER = "bytes_read"
+BYTES_WRITTEN_COUNTER = "bytes_written"
+FILES_OPENED_COUNTER = "files_opened"
+
+
+class StepProfiler:
+    """Records the time spent in the phases of a step run.
+
+    Phases can be nested, in which case the time spent in the inner phase
+    is also included in the time of the outer phase. Entering the same
+    phase multiple times accumulates its time.
+    """
+
+    def __init__(self, capture_cprofile: bool = False) -> None:
+        """Initializes the profiler.
+
+        Args:
+            capture_cprofile: Whether to run `cProfile` while the profiler is
+                active.
+        """
+        self._phases: Dict[str, float] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._start_time: Optional[float] = None
+        self._total_time = 0.0
+        self._cprofile = cProfile.Profile() if capture_cprofile else None
+
+    def start(self) -> None:
+        """Starts profiling and makes this the active profiler."""
+        global _active_profiler
+        _active_profiler = self
+        self._start_time = time.perf_counter()
+        if self._cprofile:
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stops profiling."""
+        global _active_profiler
+        if self._cprofile:
+            self._cprofile.disable()
+        if self._start_time is not None:
+            self._total_time += time.perf_counter() - self._start_time
+            self._start_time = None
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def __enter__(self) -> "StepProfiler":
+        """Starts profiling.
+
+        Returns:
+            The profiler.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops profiling.
+
+        Args:
+            *args: The exception info, if an exception was raised.
+        """
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Records the time spent in a phase.
+
+        Args:
+            name: The name of the phase.
+
+        Yields:
+            None.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, duration: float) -> None:
+        """Adds time to a phase.
+
+        Args:
+            name: The name of the phase.
+            duration: The time in seconds to add.
+        """
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + duration
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increments a counter.
+
+        Args:
+            name: The name of the counter.
+            value: The value to add to the counter.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """The time in seconds spent in each phase.
+
+        Returns:
+            The time in seconds spent in each phase.
+        """
+        with self._lock:
+            return dict(self._phases)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """The values of all counters.
+
+        Returns:
+            The values of all counters.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def total_time(self) -> float:
+        """The total time in seconds the profiler was active.
+
+        Returns:
+            The total time in seconds the profiler was active.
+        """
+        if self._start_time is not None:
+            return self._total_time + time.perf_counter() - self._start_time
+        return self._total_time
+
+    def get_run_metadata(self) -> Dict[str, "MetadataType"]:
+        """Gets the recorded timings and counters as run metadata.
+
+        Returns:
+            The run metadata.
+        """
+        return {
+            "total_seconds": round(self.total_time, 6),
+            "phases": {
+                name: round(duration, 6)
+                for name, duration in self.phases.items()
+            },
+            "counters": self.counters,
+        }
+
+    def get_cprofile_stats(self) -> Optional[bytes]:
+        """Gets the `cProfile` stats.
+
+        The stats use the same format as `pstats.Stats.dump_stats(...)` and
+        can be loaded using `pstats.Stats(<path>)` once written to a file.
+
+        Returns:
+            The serialized stats or None if `cProfile` was not captured.
+        """
+        if not self._cprofile:
+            return None
+
+        self._cprofile.create_stats()
+        return marshal.dumps(self._cprofile.stats)
+
+    def wrap_file(self, file: Any) -> Any:
+        """Wraps a file object to count the bytes read from and written to it.
+
+        Args:
+            file: The file object to wrap.
+
+        Returns:
+            The wrapped file object.
+        """
+        if isinstance(file, _CountingFile):
+            # Files opened through `fileio` are usually opened by the
+            # artifact store, which already wrapped them
+            return file
+
+        self.count(FILES_OPENED_COUNTER)
+        return _CountingFile(file, profiler=self)
+
+
+class _CountingFile:
+    """File object wrapper which counts the bytes read and written."""
+
+    def __init__(self, file: Any, profiler: StepProfiler) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            file: The file object to wrap.
+            profiler: The profiler which counts the bytes.
+        """
+        self._file = file
+        self._profiler = profiler
+
+    def read(self, *args: Any, **kwargs: Any) -> Any:
+        """Reads from the file.
+
+        Args:
+            *args: Positional arguments of the read method.
+            **kwargs: Keyword arguments of the read method.
+
+        Returns:
+            The read data.
+        """
+        data = self._file.read(*args, **kwargs)
+        self._profiler.count(BYTES_READ_COUNTER, len(data))
+        return data
+
+    def readline(self, *args: Any, **kwargs: Any) -> Any:
+        """Reads a line from the file.
+
+        Args:
+            *args: Positional arguments of the readline method.
+            **kwargs: Keyword arguments of the readline method.
+
+        Returns:
+            The read line.
+        """
+        line = self._file.readline(*args, **kwargs)
+        self._profiler.count(BYTES_READ_COUNTER, len(line))
+        return line
+
+    def write(self, data: Any) -> Any:
+        """Writes to the file.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The return value of the write method of the file.
+        """
+        self._profiler.count(BYTES_WRITTEN_COUNTER, len(data))
+        return self._file.write(data)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the lines of the file.
+
+        Yields:
+            The lines of the file.
+        """
+        for line in self._file:
+            self._profiler.count(BYTES_READ_COUNTER, len(line))
+            yield line
+
+    def __enter__(self) -> "_CountingFile":
+        """Enters the context of the file.
+
+        Returns:
+            The wrapper.
+        """
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> Any:
+        """Exits the context of the file.
+
+        Args:
+            *args: The exception info, if an exception was raised.
+
+        Returns:
+            The return value of the exit method of the file.
+        """
+        return self._file.__exit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the wrapped file.
+
+        Args:
+            name: The name of the attribute.
+
+        Returns:
+            The attribute of the wrapped file.
+        """
+        return getattr(self._file, name)
+
+
+_active_profiler: Optional[StepProfiler] = None
+
+
+def get_active_profiler() -> Optional[StepProfiler]:
+    """Gets the active step profiler.
+
+    Returns:
+        The active step profiler or None if no step is being profiled.
+    """
+    return _active_profiler
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Records the time spent in a phase if a step is being profiled.
+
+    Args:
+        name: The name of the phase.
+
+    Yields:
+        None.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+
+    with profiler.phase(name):
+        yield
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increments a counter if a step is being profiled.
+
+    Args:
+        name: The name of the counter.
+        value: The value to add to the counter.
+    """
+    if profiler := _active_profiler:
+        profiler.count(name, value)
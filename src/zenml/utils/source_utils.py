@@ -14,6 +14,7 @@
 """Utilities for loading/resolving objects."""
 
 import contextlib
+import functools
 import importlib
 import inspect
 import os
@@ -22,7 +23,19 @@ import sys
 from distutils.sysconfig import get_python_lib
 from pathlib import Path, PurePath
 from types import BuiltinFunctionType, FunctionType, ModuleType
-from typing import Any, Callable, Dict, Iterator, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from zenml.config.source import (
@@ -32,10 +45,11 @@ from zenml.config.source import (
     Source,
     SourceType,
 )
-from zenml.constants import ENV_ZENML_CUSTOM_SOURCE_ROOT
+from zenml.constants import ENV_ZENML_CUSTOM_SOURCE_ROOT, SOURCE_CACHE_SIZE
 from zenml.environment import Environment
 from zenml.logger import get_logger
 from zenml.utils import notebook_utils
+from zenml.utils.cache_utils import LRUCache
 
 logger = get_logger(__name__)
 
@@ -65,6 +79,29 @@ _SHARED_TEMPDIR: Optional[str] = None
 _resolved_notebook_sources: Dict[str, str] = {}
 _notebook_modules: Dict[str, UUID] = {}
 
+# Source types whose resolution only depends on the object itself and not on
+# the source root, the code repository state or notebook cells
+_CACHEABLE_SOURCE_TYPES = {
+    SourceType.BUILTIN,
+    SourceType.INTERNAL,
+    SourceType.DISTRIBUTION_PACKAGE,
+}
+# Resolved sources by object identity. The object is stored next to the
+# source so its ID can't be reused by another object while it's cached.
+_RESOLVED_SOURCES: LRUCache[int, Tuple[Any, Source]] = LRUCache(
+    maxsize=SOURCE_CACHE_SIZE
+)
+# Modules loaded for sources, by module name and source type
+_LOADED_MODULES: LRUCache[Tuple[str, SourceType], ModuleType] = LRUCache(
+    maxsize=SOURCE_CACHE_SIZE
+)
+
+
+def clear_source_cache() -> None:
+    """Clears the cache of resolved sources and loaded modules."""
+    _RESOLVED_SOURCES.clear()
+    _LOADED_MODULES.clear()
+
 
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
@@ -87,6 +124,33 @@ def load(source: Union[Source, str]) -> Any:
     elif source.import_path == BuiltinFunctionTypeSource.import_path:
         return BuiltinFunctionType
 
+    cache_key = (source.module, source.type)
+    module = _LOADED_MODULES.get(cache_key)
+    # Only use the cached module if it wasn't removed or replaced since
+    if module is None or sys.modules.get(source.module) is not module:
+        module = _load_source_module(source)
+        if module is None:
+            # Notebook source loaded from the cell code
+            return _try_to_load_notebook_source(
+                NotebookSource.model_validate(dict(source))
+            )
+        _LOADED_MODULES.set(cache_key, module)
+
+    if source.attribute:
+        return getattr(module, source.attribute)
+    return module
+
+
+def _load_source_module(source: Source) -> Optional[ModuleType]:
+    """Load the module of a source.
+
+    Args:
+        source: The source for which to load the module.
+
+    Returns:
+        The loaded module or None if the source is a notebook source that
+        needs to be loaded from its cell code.
+    """
     import_root = None
     if source.type == SourceType.CODE_REPOSITORY:
         source = CodeRepositorySource.model_validate(dict(source))
@@ -114,21 +178,13 @@ def load(source: Union[Source, str]) -> Any:
             # loading from the __main__ module should work just fine.
             pass
         else:
-            notebook_source = NotebookSource.model_validate(dict(source))
-            return _try_to_load_notebook_source(notebook_source)
+            return None
     elif source.type in {SourceType.USER, SourceType.UNKNOWN}:
         # Unknown source might also refer to a user file, include source
         # root in python path just to be sure
         import_root = get_source_root()
 
-    module = _load_module(module_name=source.module, import_root=import_root)
-
-    if source.attribute:
-        obj = getattr(module, source.attribute)
-    else:
-        obj = module
-
-    return obj
+    return _load_module(module_name=source.module, import_root=import_root)
 
 
 def resolve(
@@ -187,6 +243,9 @@ def resolve(
             "holds the object you want to resolve."
         )
 
+    if (cached := _RESOLVED_SOURCES.get(id(obj))) and cached[0] is obj:
+        return cached[1]
+
     module_name = module.__name__
     if module_name == "__main__":
         module_name = _resolve_module(module)
@@ -220,13 +279,15 @@ def resolve(
         package_name = _get_package_for_module(module_name=module_name)
         if package_name:
             package_version = _get_package_version(package_name=package_name)
-            return DistributionPackageSource(
+            source = DistributionPackageSource(
                 module=module_name,
                 attribute=attribute_name,
                 package_name=package_name,
                 version=package_version,
                 type=source_type,
             )
+            _RESOLVED_SOURCES.set(id(obj), (obj, source))
+            return source
         else:
             # Fallback to an unknown source if we can't find the package
             source_type = SourceType.UNKNOWN
@@ -251,9 +312,12 @@ def resolve(
 
         return source
 
-    return Source(
+    source = Source(
         module=module_name, attribute=attribute_name, type=source_type
     )
+    if source_type in _CACHEABLE_SOURCE_TYPES:
+        _RESOLVED_SOURCES.set(id(obj), (obj, source))
+    return source
 
 
 def get_source_root() -> str:
@@ -673,22 +737,35 @@ def _try_to_load_notebook_source(source: NotebookSource) -> Any:
     return obj
 
 
-def _get_package_for_module(module_name: str) -> Optional[str]:
-    """Get the package name for a module.
+@functools.lru_cache(maxsize=None)
+def _get_packages_distributions() -> Mapping[str, List[str]]:
+    """Get the distribution packages that provide each top-level module.
 
-    Args:
-        module_name: The module name.
+    Computing this mapping requires reading the metadata of all installed
+    distributions, so it is only done once per process.
 
     Returns:
-        The package name or None if no package was found.
+        Mapping of top-level module names to distribution package names.
     """
     if sys.version_info < (3, 10):
         from importlib_metadata import packages_distributions
     else:
         from importlib.metadata import packages_distributions
 
+    return packages_distributions()
+
+
+def _get_package_for_module(module_name: str) -> Optional[str]:
+    """Get the package name for a module.
+
+    Args:
+        module_name: The module name.
+
+    Returns:
+        The package name or None if no package was found.
+    """
     top_level_module = module_name.split(".", maxsplit=1)[0]
-    package_names = packages_distributions().get(top_level_module, [])
+    package_names = _get_packages_distributions().get(top_level_module, [])
 
     if len(package_names) == 1:
         return package_names[0]
@@ -697,6 +774,7 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _get_package_version(package_name: str) -> Optional[str]:
     """Gets the version of a package.
 
@@ -14,17 +14,18 @@
 """Rate limiting for the ZenML Server."""
 
 import inspect
+import threading
 import time
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import wraps
 from typing import (
     Any,
     Callable,
-    Dict,
     Generator,
-    List,
     Optional,
+    Tuple,
     TypeVar,
     cast,
 )
@@ -37,9 +38,176 @@ from zenml.zen_server.utils import server_config
 logger = get_logger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
+MINUTE = 60
+DAY = 60 * 60 * 24
+
+
+class RateLimitStore(ABC):
+    """Interface for storing the request counts used by the rate limiter.
+
+    Implementations keep track of the number of requests issued by a key
+    (e.g. a client IP address) within the last minute and day. Custom
+    implementations, e.g. backed by a database that is shared between
+    several server replicas, can be configured through the
+    `rate_limit_store_implementation_source` server setting.
+    """
+
+    @abstractmethod
+    def hit(self, key: str, timestamp: float) -> Tuple[float, float]:
+        """Register a request for a key.
+
+        Args:
+            key: The key that issued the request.
+            timestamp: The time of the request as seconds since the epoch.
+
+        Returns:
+            The number of requests issued by the key within the last minute
+            and within the last day, including the current one.
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Reset the request counts of a key.
+
+        Args:
+            key: The key to reset.
+        """
+
+
+class SlidingWindowCounter:
+    """Fixed-memory approximation of the request count in a sliding window.
+
+    Only the counts of the current and the previous fixed window are kept.
+    The count of the sliding window is estimated by weighting the count of
+    the previous window by its overlap with the sliding window.
+    """
+
+    __slots__ = ("window", "window_start", "current", "previous")
+
+    def __init__(self, window: float) -> None:
+        """Initializes the counter.
+
+        Args:
+            window: The size of the window in seconds.
+        """
+        self.window = window
+        self.window_start = 0.0
+        self.current = 0
+        self.previous = 0
+
+    def hit(self, timestamp: float) -> float:
+        """Register a hit and estimate the count in the sliding window.
+
+        Args:
+            timestamp: The time of the hit as seconds since the epoch.
+
+        Returns:
+            The estimated number of hits within the sliding window ending at
+            the given timestamp, including the current one.
+        """
+        if timestamp >= self.window_start + self.window:
+            if timestamp < self.window_start + 2 * self.window:
+                self.previous = self.current
+            else:
+                self.previous = 0
+            self.current = 0
+            self.window_start = timestamp - timestamp % self.window
+
+        self.current += 1
+        previous_weight = (
+            self.window - (timestamp - self.window_start)
+        ) / self.window
+        return self.current + self.previous * previous_weight
+
+
+_CounterEntry = Tuple[float, SlidingWindowCounter, SlidingWindowCounter]
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """In-memory rate limit store with bounded memory usage.
+
+    Each key only stores a pair of sliding window counters. Keys that have
+    been idle for more than a day are evicted periodically and the total
+    number of tracked keys is capped, evicting the least recently used keys
+    first.
+    """
+
+    def __init__(
+        self, max_keys: int = 100_000, eviction_interval: float = MINUTE
+    ) -> None:
+        """Initializes the store.
+
+        Args:
+            max_keys: The maximum number of keys to track.
+            eviction_interval: The minimum time in seconds between two
+                evictions of idle keys.
+        """
+        self.max_keys = max_keys
+        self.eviction_interval = eviction_interval
+        # Maps each key to the time of its last hit and its minute and day
+        # counters, ordered from the least to the most recently used key
+        self._counters: "OrderedDict[str, _CounterEntry]" = OrderedDict()
+        self._last_eviction = 0.0
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, timestamp: float) -> Tuple[float, float]:
+        """Register a request for a key.
+
+        Args:
+            key: The key that issued the request.
+            timestamp: The time of the request as seconds since the epoch.
+
+        Returns:
+            The number of requests issued by the key within the last minute
+            and within the last day, including the current one.
+        """
+        with self._lock:
+            self._evict(timestamp)
+
+            entry = self._counters.pop(key, None)
+            if entry is None:
+                minute_counter = SlidingWindowCounter(window=MINUTE)
+                day_counter = SlidingWindowCounter(window=DAY)
+            else:
+                _, minute_counter, day_counter = entry
+
+            # Re-inserting the key keeps the dictionary ordered by the time
+            # of the last hit
+            self._counters[key] = (timestamp, minute_counter, day_counter)
+            return minute_counter.hit(timestamp), day_counter.hit(timestamp)
+
+    def reset(self, key: str) -> None:
+        """Reset the request counts of a key.
+
+        Args:
+            key: The key to reset.
+        """
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def _evict(self, timestamp: float) -> None:
+        """Evict idle keys and keys exceeding the maximum number of keys.
+
+        Args:
+            timestamp: The current time as seconds since the epoch.
+        """
+        while len(self._counters) >= self.max_keys:
+            self._counters.popitem(last=False)
+
+        if timestamp - self._last_eviction < self.eviction_interval:
+            return
+        self._last_eviction = timestamp
+
+        idle_threshold = timestamp - DAY
+        while self._counters:
+            last_hit, _, _ = next(iter(self._counters.values()))
+            if last_hit >= idle_threshold:
+                break
+            self._counters.popitem(last=False)
+
 
 class RequestLimiter:
-    """Simple in-memory rate limiter."""
+    """Simple rate limiter based on sliding window request counts."""
 
     def __init__(
         self,
@@ -62,7 +230,28 @@ class RequestLimiter:
             raise ValueError("Pass either day or minuter limits, or both.")
         self.day_limit = day_limit
         self.minute_limit = minute_limit
-        self.limiter: Dict[str, List[float]] = defaultdict(list)
+        self.store = self._create_store()
+
+    @staticmethod
+    def _create_store() -> RateLimitStore:
+        """Create the store used to keep track of the request counts.
+
+        Returns:
+            The configured rate limit store or an in-memory store if none is
+            configured.
+        """
+        if (
+            store_source
+            := server_config().rate_limit_store_implementation_source
+        ):
+            from zenml.utils import source_utils
+
+            implementation_class = source_utils.load_and_validate_class(
+                store_source, expected_class=RateLimitStore
+            )
+            return cast(RateLimitStore, implementation_class())
+
+        return InMemoryRateLimitStore()
 
     def hit_limiter(self, request: Request) -> None:
         """Increase the number of hits in the limiter.
@@ -78,28 +267,14 @@ class RequestLimiter:
         from fastapi import HTTPException
 
         requester = self._get_ipaddr(request)
-        now = time.time()
-        minute_ago = now - 60
-        day_ago = now - 60 * 60 * 24
-        self.limiter[requester].append(now)
-
-        from bisect import bisect_left
-
-        # remove failures older than a day
-        older_index = bisect_left(self.limiter[requester], day_ago)
-        self.limiter[requester] = self.limiter[requester][older_index:]
+        minute_requests, day_requests = self.store.hit(
+            requester, timestamp=time.time()
+        )
 
-        if self.day_limit and len(self.limiter[requester]) > self.day_limit:
+        if self.day_limit and day_requests > self.day_limit:
             raise HTTPException(
                 status_code=429, detail="Daily request limit exceeded."
             )
-        minute_requests = len(
-            [
-                limiter_hit
-                for limiter_hit in self.limiter[requester][::-1]
-                if limiter_hit >= minute_ago
-            ]
-        )
         if self.minute_limit and minute_requests > self.minute_limit:
             raise HTTPException(
                 status_code=429, detail="Minute request limit exceeded."
@@ -112,9 +287,7 @@ class RequestLimiter:
             request: Request object.
         """
         if self.limiting_enabled:
-            requester = self._get_ipaddr(request)
-            if requester in self.limiter:
-                del self.limiter[requester]
+            self.store.reset(self._get_ipaddr(request))
 
     def _get_ipaddr(self, request: Request) -> str:
         """Returns the IP address for the current request.
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for models."""
 
-from typing import Union
+from typing import List, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
@@ -21,14 +21,17 @@ from fastapi import APIRouter, Depends, Security
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
     MODEL_VERSION_ARTIFACTS,
     MODEL_VERSION_PIPELINE_RUNS,
     MODEL_VERSIONS,
     RUNS,
     VERSION_1,
 )
+from zenml.exceptions import IllegalOperationError
 from zenml.models import (
     ModelVersionArtifactFilter,
+    ModelVersionArtifactRequest,
     ModelVersionArtifactResponse,
     ModelVersionFilter,
     ModelVersionPipelineRunFilter,
@@ -198,6 +201,56 @@ model_version_artifacts_router = APIRouter(
 )
 
 
+@model_version_artifacts_router.post(
+    BATCH,
+    response_model=List[ModelVersionArtifactResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_model_version_artifact_links(
+    model_version_artifact_links: List[ModelVersionArtifactRequest],
+    auth_context: AuthContext = Security(authorize),
+) -> List[ModelVersionArtifactResponse]:
+    """Create multiple model version to artifact links at once.
+
+    Args:
+        model_version_artifact_links: The model version to artifact links to
+            create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created model version to artifact links.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in one of
+            the links does not match the workspace of the model version or
+            the authenticated user.
+    """
+    model_versions = {}
+    for model_version_id in {
+        link.model_version for link in model_version_artifact_links
+    }:
+        model_version = zen_store().get_model_version(model_version_id)
+        verify_permission_for_model(model_version, action=Action.UPDATE)
+        model_versions[model_version_id] = model_version
+
+    for link in model_version_artifact_links:
+        if link.workspace != model_versions[link.model_version].workspace.id:
+            raise IllegalOperationError(
+                "Creating model version to artifact links outside of the "
+                "workspace of the model version is not supported."
+            )
+        if link.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating model to artifact links for a user other than "
+                "yourself is not supported."
+            )
+
+    return zen_store().create_model_version_artifact_links(
+        model_version_artifact_links
+    )
+
+
 @model_version_artifacts_router.get(
     "",
     response_model=Page[ModelVersionArtifactResponse],
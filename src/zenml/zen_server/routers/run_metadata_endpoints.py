@@ -13,18 +13,32 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for run metadata."""
 
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
-from zenml.constants import API, RUN_METADATA, VERSION_1
-from zenml.models import Page, RunMetadataFilter, RunMetadataResponse
+from zenml.constants import API, BATCH, RUN_METADATA, VERSION_1
+from zenml.enums import MetadataResourceTypes
+from zenml.exceptions import IllegalOperationError
+from zenml.models import (
+    Page,
+    RunMetadataFilter,
+    RunMetadataRequest,
+    RunMetadataResponse,
+    WorkspaceScopedResponse,
+)
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_list_entities,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
+from zenml.zen_server.rbac.utils import (
+    verify_permission,
+    verify_permission_for_model,
+)
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
@@ -38,6 +52,72 @@ router = APIRouter(
 )
 
 
+@router.post(
+    BATCH,
+    response_model=List[RunMetadataResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_run_metadata_batch(
+    run_metadata: List[RunMetadataRequest],
+    auth_context: AuthContext = Security(authorize),
+) -> List[RunMetadataResponse]:
+    """Creates run metadata for multiple resources at once.
+
+    Args:
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created run metadata.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in the run
+            metadata does not match the workspace of the resource or the
+            authenticated user.
+        RuntimeError: If the resource type is not supported.
+    """
+    resource_workspaces: Dict[
+        Tuple[MetadataResourceTypes, UUID], Set[UUID]
+    ] = defaultdict(set)
+    for request in run_metadata:
+        if request.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating run metadata for a user other than yourself "
+                "is not supported."
+            )
+        resource_workspaces[(request.resource_type, request.resource_id)].add(
+            request.workspace
+        )
+
+    for resource_key, workspaces in resource_workspaces.items():
+        resource_type, resource_id = resource_key
+        resource: WorkspaceScopedResponse[Any, Any, Any]
+        if resource_type == MetadataResourceTypes.PIPELINE_RUN:
+            resource = zen_store().get_run(resource_id)
+        elif resource_type == MetadataResourceTypes.STEP_RUN:
+            resource = zen_store().get_run_step(resource_id)
+        elif resource_type == MetadataResourceTypes.ARTIFACT_VERSION:
+            resource = zen_store().get_artifact_version(resource_id)
+        elif resource_type == MetadataResourceTypes.MODEL_VERSION:
+            resource = zen_store().get_model_version(resource_id)
+        else:
+            raise RuntimeError(f"Unknown resource type: {resource_type}")
+
+        verify_permission_for_model(resource, action=Action.UPDATE)
+        if workspaces != {resource.workspace.id}:
+            raise IllegalOperationError(
+                "Creating run metadata outside of the workspace of the "
+                f"{resource_type.value} `{resource_id}` is not supported."
+            )
+
+    verify_permission(
+        resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
+    )
+
+    return zen_store().create_run_metadata_batch(run_metadata)
+
+
 @router.get(
     "",
     response_model=Page[RunMetadataResponse],
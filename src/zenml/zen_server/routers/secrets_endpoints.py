@@ -13,13 +13,14 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline run secrets."""
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
 from zenml.constants import (
     API,
+    BATCH,
     SECRETS,
     SECRETS_BACKUP,
     SECRETS_OPERATIONS,
@@ -42,6 +43,8 @@ from zenml.zen_server.rbac.endpoint_utils import (
 )
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
+    batch_verify_permissions_for_models,
+    dehydrate_response_model,
     get_allowed_resource_ids,
     has_permissions_for_model,
     is_owned_by_authenticated_user,
@@ -114,6 +117,48 @@ def list_secrets(
     return secrets
 
 
+@router.post(
+    BATCH,
+    response_model=List[SecretResponse],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_secrets_batch(
+    secret_ids: List[UUID],
+    hydrate: bool = True,
+    _: AuthContext = Security(authorize),
+) -> List[SecretResponse]:
+    """Gets multiple secrets including their values.
+
+    Args:
+        secret_ids: IDs of the secrets to get.
+        hydrate: Flag deciding whether to hydrate the output model(s)
+            by including metadata fields in the response.
+
+    Returns:
+        The secrets that exist. The values of secrets which the user is not
+        allowed to read are removed.
+    """
+    secrets = zen_store().get_secrets_batch(
+        secret_ids=secret_ids, hydrate=hydrate
+    )
+    batch_verify_permissions_for_models(secrets, action=Action.READ)
+
+    allowed_ids = get_allowed_resource_ids(
+        resource_type=ResourceType.SECRET,
+        action=Action.READ_SECRET_VALUE,
+    )
+    for secret in secrets:
+        if not (
+            allowed_ids is None
+            or secret.id in allowed_ids
+            or is_owned_by_authenticated_user(secret)
+        ):
+            secret.remove_secrets()
+
+    return [dehydrate_response_model(secret) for secret in secrets]
+
+
 @router.get(
     "/{secret_id}",
     response_model=SecretResponse,
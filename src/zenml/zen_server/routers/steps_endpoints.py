@@ -20,6 +20,7 @@ from fastapi import APIRouter, Depends, HTTPException, Security
 
 from zenml.constants import (
     API,
+    BEGIN,
     LOGS,
     STATUS,
     STEP_CONFIGURATION,
@@ -27,9 +28,12 @@ from zenml.constants import (
     VERSION_1,
 )
 from zenml.enums import ExecutionStatus
+from zenml.exceptions import IllegalOperationError
 from zenml.logging.step_logging import fetch_logs
 from zenml.models import (
     Page,
+    StepRunBeginRequest,
+    StepRunBeginResponse,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -37,11 +41,16 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
+from zenml.zen_server.feature_gate.endpoint_utils import (
+    check_entitlement,
+    report_usage,
+)
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     dehydrate_response_model,
     get_allowed_resource_ids,
+    verify_permission,
     verify_permission_for_model,
 )
 from zenml.zen_server.utils import (
@@ -121,6 +130,67 @@ def create_run_step(
     return dehydrate_response_model(step_response)
 
 
+@router.post(
+    BEGIN,
+    response_model=StepRunBeginResponse,
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def begin_run_step(
+    request: StepRunBeginRequest,
+    auth_context: AuthContext = Security(authorize),
+) -> StepRunBeginResponse:
+    """Get or create a pipeline run and begin one of its steps.
+
+    Args:
+        request: The request to begin the step run.
+        auth_context: Authentication context.
+
+    Returns:
+        The pipeline run and the created step run.
+
+    Raises:
+        IllegalOperationError: If the user specified in the pipeline run or
+            step run does not match the authenticated user.
+    """
+    if (
+        request.pipeline_run.user != auth_context.user.id
+        or request.step_run.user != auth_context.user.id
+    ):
+        raise IllegalOperationError(
+            "Creating pipeline runs or steps for a user other than yourself "
+            "is not supported."
+        )
+
+    verify_permission(
+        resource_type=ResourceType.PIPELINE_RUN, action=Action.CREATE
+    )
+
+    response = zen_store().begin_run_step(
+        request=request,
+        pre_creation_hook=lambda: check_entitlement(
+            resource_type=ResourceType.PIPELINE_RUN
+        ),
+        pre_step_creation_hook=lambda pipeline_run: (
+            verify_permission_for_model(pipeline_run, action=Action.UPDATE)
+        ),
+        cache_allowed_pipeline_run_ids=get_allowed_resource_ids(
+            resource_type=ResourceType.PIPELINE_RUN
+        ),
+    )
+    if response.pipeline_run_created:
+        report_usage(
+            resource_type=ResourceType.PIPELINE_RUN,
+            resource_id=response.pipeline_run.id,
+        )
+
+    return StepRunBeginResponse(
+        pipeline_run=dehydrate_response_model(response.pipeline_run),
+        pipeline_run_created=response.pipeline_run_created,
+        step_run=dehydrate_response_model(response.step_run),
+    )
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponse,
@@ -20,6 +20,7 @@ from fastapi import APIRouter, Depends, Security
 from zenml import TriggerRequest
 from zenml.constants import API, TRIGGER_EXECUTIONS, TRIGGERS, VERSION_1
 from zenml.enums import PluginType
+from zenml.event_hub.event_hub import event_hub
 from zenml.event_sources.base_event_source import BaseEventSourceHandler
 from zenml.models import (
     Page,
@@ -160,11 +161,14 @@ def create_trigger(
             trigger.event_filter
         )
 
-    return verify_permissions_and_create_entity(
+    created_trigger = verify_permissions_and_create_entity(
         request_model=trigger,
         resource_type=ResourceType.TRIGGER,
         create_method=zen_store().create_trigger,
     )
+    event_hub.activate_trigger(created_trigger)
+
+    return created_trigger
 
 
 @router.put(
@@ -227,6 +231,10 @@ def update_trigger(
     updated_trigger = zen_store().update_trigger(
         trigger_id=trigger_id, trigger_update=trigger_update
     )
+    if updated_trigger.is_active:
+        event_hub.activate_trigger(updated_trigger)
+    else:
+        event_hub.deactivate_trigger(updated_trigger)
 
     return dehydrate_response_model(updated_trigger)
 
@@ -248,6 +256,7 @@ def delete_trigger(
     trigger = zen_store().get_trigger(trigger_id=trigger_id)
     verify_permission_for_model(trigger, action=Action.DELETE)
     zen_store().delete_trigger(trigger_id=trigger_id)
+    event_hub.deactivate_trigger(trigger)
 
 
 executions_router = APIRouter(
@@ -13,10 +13,11 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for workspaces."""
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
+from fastapi.responses import StreamingResponse
 
 from zenml.constants import (
     API,
@@ -1316,8 +1317,9 @@ def list_service_connector_resources(
     connector_type: Optional[str] = None,
     resource_type: Optional[str] = None,
     resource_id: Optional[str] = None,
+    stream: bool = False,
     auth_context: AuthContext = Security(authorize),
-) -> List[ServiceConnectorResourcesModel]:
+) -> Union[List[ServiceConnectorResourcesModel], StreamingResponse]:
     """List resources that can be accessed by service connectors.
 
     Args:
@@ -1325,6 +1327,9 @@ def list_service_connector_resources(
         connector_type: the service connector type identifier to filter by.
         resource_type: the resource type identifier to filter by.
         resource_id: the resource identifier to filter by.
+        stream: If set, the resources of each service connector are streamed
+            as newline-delimited JSON as soon as they are available instead
+            of being returned all at once.
         auth_context: Authentication context.
 
     Returns:
@@ -1346,6 +1351,22 @@ def list_service_connector_resources(
         authenticated_user_id=auth_context.user.id, id=allowed_ids
     )
 
+    if stream:
+
+        def _stream_resources() -> Iterator[str]:
+            for resources in zen_store().iter_service_connector_resources(
+                workspace_name_or_id=workspace_name_or_id,
+                connector_type=connector_type,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                filter_model=filter_model,
+            ):
+                yield resources.model_dump_json() + "\n"
+
+        return StreamingResponse(
+            _stream_resources(), media_type="application/x-ndjson"
+        )
+
     return zen_store().list_service_connector_resources(
         workspace_name_or_id=workspace_name_or_id,
         connector_type=connector_type,
@@ -39,6 +39,7 @@ from zenml.new.pipelines.build_utils import compute_stack_checksum
 from zenml.new.pipelines.run_utils import (
     create_placeholder_run,
     get_default_run_name,
+    get_deployment_of_placeholder_run,
     validate_run_config_is_runnable_from_server,
     validate_stack_is_runnable_from_server,
 )
@@ -142,14 +143,17 @@ def run_template(
         "ZENML_STORE_VERIFY_SSL": "True",
     }
 
+    placeholder_run = create_placeholder_run(deployment=new_deployment)
+    assert placeholder_run
+    new_deployment = get_deployment_of_placeholder_run(
+        placeholder_run=placeholder_run, deployment=new_deployment
+    )
+
     command = RunnerEntrypointConfiguration.get_entrypoint_command()
     args = RunnerEntrypointConfiguration.get_entrypoint_arguments(
         deployment_id=new_deployment.id
     )
 
-    placeholder_run = create_placeholder_run(deployment=new_deployment)
-    assert placeholder_run
-
     def _task() -> None:
         pypi_requirements, apt_packages = get_requirements_for_stack(
             stack=stack
@@ -20,11 +20,13 @@ To run this file locally, execute:
     ```
 """
 
+import asyncio
 import os
 from asyncio.log import logger
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import partial
 from genericpath import isfile
-from typing import Any, List
+from typing import Any, List, Optional
 
 from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request
@@ -120,9 +122,9 @@ app = FastAPI(
 
 # Initialize last_user_activity
 last_user_activity: datetime = datetime.now(timezone.utc)
-last_user_activity_reported: datetime = datetime.now(timezone.utc) + timedelta(
-    seconds=-DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS
-)
+# Only activity of actual requests gets reported, not the server start time
+last_user_activity_reported: datetime = last_user_activity
+last_user_activity_reporter: Optional["asyncio.Task[None]"] = None
 
 
 # Customize the default request validation handler that comes with FastAPI
@@ -179,7 +181,10 @@ async def track_last_user_activity(request: Request, call_next: Any) -> Any:
     """A middleware to track last user activity.
 
     This middleware checks if the incoming request is a user request and
-    updates the last activity timestamp if it is.
+    updates the last activity timestamp if it is. The timestamp is only kept
+    in memory here and persisted periodically by
+    `report_last_user_activity`, so no database call is made on the event
+    loop.
 
     Args:
         request: The incoming request object.
@@ -190,7 +195,6 @@ async def track_last_user_activity(request: Request, call_next: Any) -> Any:
         The response to the request.
     """
     global last_user_activity
-    global last_user_activity_reported
 
     try:
         if is_user_request(request):
@@ -199,19 +203,43 @@ async def track_last_user_activity(request: Request, call_next: Any) -> Any:
         logger.debug(
             f"An unexpected error occurred while checking user activity: {e}"
         )
-    if (
-        (
-            datetime.now(timezone.utc) - last_user_activity_reported
-        ).total_seconds()
-        > DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS
-    ):
-        last_user_activity_reported = datetime.now(timezone.utc)
-        zen_store()._update_last_user_activity_timestamp(
-            last_user_activity=last_user_activity
-        )
     return await call_next(request)
 
 
+async def flush_last_user_activity() -> None:
+    """Persist the last user activity timestamp if it changed.
+
+    The database update runs in a worker thread to avoid blocking the event
+    loop.
+    """
+    global last_user_activity_reported
+
+    activity = last_user_activity
+    if activity <= last_user_activity_reported:
+        return
+
+    try:
+        await to_thread.run_sync(
+            partial(
+                zen_store()._update_last_user_activity_timestamp,
+                last_user_activity=activity,
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Failed to report the last user activity: {e}")
+    else:
+        last_user_activity_reported = activity
+
+
+async def report_last_user_activity() -> None:
+    """Periodically persist the last user activity timestamp."""
+    while True:
+        await flush_last_user_activity()
+        await asyncio.sleep(
+            DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS
+        )
+
+
 @app.middleware("http")
 async def infer_source_context(request: Request, call_next: Any) -> Any:
     """A middleware to track the source of an event.
@@ -261,6 +289,24 @@ def initialize() -> None:
     initialize_secure_headers()
 
 
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    """Start the background tasks of the ZenML server."""
+    global last_user_activity_reporter
+
+    last_user_activity_reporter = asyncio.create_task(
+        report_last_user_activity()
+    )
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks() -> None:
+    """Stop the background tasks of the ZenML server."""
+    if last_user_activity_reporter is not None:
+        last_user_activity_reporter.cancel()
+    await flush_last_user_activity()
+
+
 if server_config().use_legacy_dashboard:
     app.mount(
         "/static",
@@ -0,0 +1,98 @@
+"""Add indexes for frequent queries [3b1776345020].
+
+Revision ID: 3b1776345020
+Revises: 0.67.0
+Create Date: 2024-10-01 11:27:13.514360
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b1776345020"
+down_revision = "0.67.0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_key",
+            ["cache_key", "status", "workspace_id", "created"],
+            unique=False,
+        )
+        batch_op.create_index("ix_step_run_created", ["created"], unique=False)
+
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.create_index("ix_artifact_name", ["name"], unique=False)
+
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_artifact_version_artifact_id_version_number",
+            ["artifact_id", "version_number"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_artifact_version_artifact_id_version",
+            ["artifact_id", "version"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_artifact_version_uri",
+            ["uri"],
+            unique=False,
+            mysql_length=255,
+        )
+        batch_op.create_index(
+            "ix_artifact_version_created", ["created"], unique=False
+        )
+
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.create_index("ix_pipeline_run_name", ["name"], unique=False)
+        batch_op.create_index(
+            "ix_pipeline_run_created", ["created"], unique=False
+        )
+
+    # Tags and run metadata are attached to resources of different types,
+    # so these columns are not covered by foreign key indexes
+    with op.batch_alter_table("tag_resource", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_tag_resource_resource_id_resource_type",
+            ["resource_id", "resource_type"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("run_metadata", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_run_metadata_resource_id_resource_type",
+            ["resource_id", "resource_type"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("run_metadata", schema=None) as batch_op:
+        batch_op.drop_index("ix_run_metadata_resource_id_resource_type")
+
+    with op.batch_alter_table("tag_resource", schema=None) as batch_op:
+        batch_op.drop_index("ix_tag_resource_resource_id_resource_type")
+
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_pipeline_run_created")
+        batch_op.drop_index("ix_pipeline_run_name")
+
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.drop_index("ix_artifact_version_created")
+        batch_op.drop_index("ix_artifact_version_uri")
+        batch_op.drop_index("ix_artifact_version_artifact_id_version")
+        batch_op.drop_index("ix_artifact_version_artifact_id_version_number")
+
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.drop_index("ix_artifact_name")
+
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_created")
+        batch_op.drop_index("ix_step_run_cache_key")
@@ -0,0 +1,69 @@
+"""Deduplicate step source code [3f5362ea1db1].
+
+Revision ID: 3f5362ea1db1
+Revises: 3b1776345020
+Create Date: 2024-10-08 10:12:41.318265
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f5362ea1db1"
+down_revision = "3b1776345020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    op.create_table(
+        "step_source_code",
+        sa.Column(
+            "code_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("docstring", sa.TEXT(), nullable=True),
+        sa.Column("source_code", sa.TEXT(), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("code_hash"),
+    )
+
+    # Move the source code of existing step runs into the new table, keeping
+    # a single copy for each code hash
+    op.execute(
+        """
+        INSERT INTO step_source_code (code_hash, docstring, source_code, created)
+        SELECT code_hash, MAX(docstring), MAX(source_code), MIN(created)
+        FROM step_run
+        WHERE code_hash IS NOT NULL AND source_code IS NOT NULL
+        GROUP BY code_hash
+        """
+    )
+    op.execute(
+        """
+        UPDATE step_run SET docstring = NULL, source_code = NULL
+        WHERE code_hash IN (SELECT code_hash FROM step_source_code)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    op.execute(
+        """
+        UPDATE step_run
+        SET
+            docstring = (
+                SELECT docstring FROM step_source_code
+                WHERE step_source_code.code_hash = step_run.code_hash
+            ),
+            source_code = (
+                SELECT source_code FROM step_source_code
+                WHERE step_source_code.code_hash = step_run.code_hash
+            )
+        WHERE code_hash IN (SELECT code_hash FROM step_source_code)
+        """
+    )
+    op.drop_table("step_source_code")
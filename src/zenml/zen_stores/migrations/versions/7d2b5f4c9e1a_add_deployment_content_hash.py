@@ -0,0 +1,41 @@
+"""Add deployment content hash [7d2b5f4c9e1a].
+
+Revision ID: 7d2b5f4c9e1a
+Revises: 3f5362ea1db1
+Create Date: 2024-10-10 09:21:37.104512
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2b5f4c9e1a"
+down_revision = "3f5362ea1db1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "content_hash",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            "ix_pipeline_deployment_content_hash",
+            ["content_hash"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.drop_index("ix_pipeline_deployment_content_hash")
+        batch_op.drop_column("content_hash")
@@ -56,6 +56,8 @@ from zenml.constants import (
     ARTIFACT_VERSIONS,
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
+    BATCH,
+    BEGIN,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CONFIG,
@@ -226,6 +228,8 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunBeginRequest,
+    StepRunBeginResponse,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -253,6 +257,7 @@ from zenml.models import (
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
+from zenml.utils import profiling_utils
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
@@ -1958,6 +1963,33 @@ class RestZenStore(BaseZenStore):
                 result.append(RunMetadataResponse.model_validate(metadata))
         return result
 
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources at once.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+        if not run_metadata:
+            return []
+
+        path = f"{RUN_METADATA}{BATCH}"
+        logger.debug(f"Sending POST request to {path}...")
+        response_body = self._request(
+            "POST",
+            self.url + API + VERSION_1 + path,
+            json=[request.model_dump(mode="json") for request in run_metadata],
+        )
+
+        assert isinstance(response_body, list)
+        return [
+            RunMetadataResponse.model_validate(item) for item in response_body
+        ]
+
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
     ) -> RunMetadataResponse:
@@ -2138,6 +2170,34 @@ class RestZenStore(BaseZenStore):
             params={"hydrate": hydrate},
         )
 
+    def get_secrets_batch(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets including their values.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets that exist, in the order of the given IDs.
+        """
+        if not secret_ids:
+            return []
+
+        path = f"{SECRETS}{BATCH}"
+        logger.debug(f"Sending POST request to {path}...")
+        response_body = self._request(
+            "POST",
+            self.url + API + VERSION_1 + path,
+            params={"hydrate": hydrate},
+            json=[str(secret_id) for secret_id in secret_ids],
+        )
+
+        assert isinstance(response_body, list)
+        return [SecretResponse.model_validate(item) for item in response_body]
+
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
     ) -> Page[SecretResponse]:
@@ -3006,6 +3066,47 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def begin_run_step(
+        self, request: StepRunBeginRequest
+    ) -> StepRunBeginResponse:
+        """Gets or creates a pipeline run and begins one of its steps.
+
+        Args:
+            request: The request to begin the step run.
+
+        Raises:
+            NotImplementedError: If the server does not support beginning step
+                runs in a single request.
+
+        Returns:
+            The pipeline run and the created step run.
+        """
+        status_codes: List[int] = []
+
+        def _record_status_code(
+            response: requests.Response, *args: Any, **kwargs: Any
+        ) -> None:
+            status_codes.append(response.status_code)
+
+        try:
+            response_body = self.post(
+                f"{STEPS}{BEGIN}",
+                body=request,
+                hooks={"response": _record_status_code},
+            )
+        except (KeyError, MethodNotAllowedError) as e:
+            # Servers without the endpoint either don't find the route at
+            # all or match it to the route of a single step run, which
+            # doesn't allow POST requests
+            if status_codes and status_codes[-1] in (404, 405):
+                raise NotImplementedError(
+                    "Beginning step runs in a single request is not "
+                    "supported for this server."
+                ) from e
+            raise
+
+        return StepRunBeginResponse.model_validate(response_body)
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -3653,6 +3754,41 @@ class RestZenStore(BaseZenStore):
             route=f"{MODEL_VERSIONS}/{model_version_artifact_link.model_version}{ARTIFACTS}",
         )
 
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version links at once.
+
+        Links that already exist are not created again.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or already existing model version to artifact links,
+            in the same order as the requests.
+        """
+        if not model_version_artifact_links:
+            return []
+
+        path = f"{MODEL_VERSION_ARTIFACTS}{BATCH}"
+        logger.debug(f"Sending POST request to {path}...")
+        response_body = self._request(
+            "POST",
+            self.url + API + VERSION_1 + path,
+            json=[
+                link.model_dump(mode="json")
+                for link in model_version_artifact_links
+            ],
+        )
+
+        assert isinstance(response_body, list)
+        return [
+            ModelVersionArtifactResponse.model_validate(item)
+            for item in response_body
+        ]
+
     def list_model_version_artifact_links(
         self,
         model_version_artifact_link_filter_model: ModelVersionArtifactFilter,
@@ -4164,41 +4300,43 @@ class RestZenStore(BaseZenStore):
         self.session.headers.update(
             {source_context.name: source_context.get().value}
         )
+        profiling_utils.count(profiling_utils.STORE_REQUESTS_COUNTER)
 
-        try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=timeout or self.config.http_timeout,
-                    **kwargs,
+        with profiling_utils.profile_phase("store_requests"):
+            try:
+                return self._handle_response(
+                    self.session.request(
+                        method,
+                        url,
+                        params=params,
+                        verify=self.config.verify_ssl,
+                        timeout=timeout or self.config.http_timeout,
+                        **kwargs,
+                    )
                 )
-            )
-        except AuthorizationException:
-            # The authentication token could have expired; refresh it and try
-            # again. This will clear any cached token and trigger a new
-            # authentication flow.
-            self.clear_session()
-            logger.info("Authentication token expired; refreshing...")
+            except AuthorizationException:
+                # The authentication token could have expired; refresh it and try
+                # again. This will clear any cached token and trigger a new
+                # authentication flow.
+                self.clear_session()
+                logger.info("Authentication token expired; refreshing...")
 
-        try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
+            try:
+                return self._handle_response(
+                    self.session.request(
+                        method,
+                        url,
+                        params=params,
+                        verify=self.config.verify_ssl,
+                        timeout=self.config.http_timeout,
+                        **kwargs,
+                    )
                 )
-            )
-        except AuthorizationException:
-            logger.info(
-                "Your authentication token has expired. Please re-authenticate."
-            )
-            raise
+            except AuthorizationException:
+                logger.info(
+                    "Your authentication token has expired. Please re-authenticate."
+                )
+                raise
 
     def get(
         self,
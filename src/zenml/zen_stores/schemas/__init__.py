@@ -55,6 +55,7 @@ from zenml.zen_stores.schemas.step_run_schemas import (
     StepRunOutputArtifactSchema,
     StepRunParentsSchema,
     StepRunSchema,
+    StepSourceCodeSchema,
 )
 from zenml.zen_stores.schemas.tag_schemas import TagSchema, TagResourceSchema
 from zenml.zen_stores.schemas.trigger_schemas import (
@@ -103,6 +104,7 @@ __all__ = [
     "StepRunOutputArtifactSchema",
     "StepRunParentsSchema",
     "StepRunSchema",
+    "StepSourceCodeSchema",
     "RunTemplateSchema",
     "TagSchema",
     "TagResourceSchema",
@@ -14,11 +14,13 @@
 """SQLModel implementation of artifact table."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, Index
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlmodel import Field, Relationship
 
 from zenml.config.source import Source
@@ -42,7 +44,10 @@ from zenml.models import (
 from zenml.models.v2.core.artifact import ArtifactRequest
 from zenml.zen_stores.schemas.base_schemas import BaseSchema, NamedSchema
 from zenml.zen_stores.schemas.component_schemas import StackComponentSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.step_run_schemas import (
     StepRunInputArtifactSchema,
     StepRunOutputArtifactSchema,
@@ -65,6 +70,7 @@ class ArtifactSchema(NamedSchema, table=True):
     """SQL Model for artifacts."""
 
     __tablename__ = "artifact"
+    __table_args__ = (Index("ix_artifact_name", "name"),)
 
     # Fields
     has_custom_name: bool
@@ -99,6 +105,32 @@ class ArtifactSchema(NamedSchema, table=True):
             has_custom_name=artifact_request.has_custom_name,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        return [
+            selectinload(jl_arg(ArtifactSchema.versions)),
+            selectinload(jl_arg(ArtifactSchema.tags)).joinedload(
+                jl_arg(TagResourceSchema.tag)
+            ),
+        ]
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -167,6 +199,21 @@ class ArtifactVersionSchema(BaseSchema, table=True):
     """SQL Model for artifact versions."""
 
     __tablename__ = "artifact_version"
+    __table_args__ = (
+        Index(
+            "ix_artifact_version_artifact_id_version_number",
+            "artifact_id",
+            "version_number",
+        ),
+        Index(
+            "ix_artifact_version_artifact_id_version",
+            "artifact_id",
+            "version",
+        ),
+        # MySQL can only index a prefix of TEXT columns
+        Index("ix_artifact_version_uri", "uri", mysql_length=255),
+        Index("ix_artifact_version_created", "created"),
+    )
 
     # Fields
     version: str
@@ -283,6 +330,52 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             data_type=artifact_version_request.data_type.model_dump_json(),
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        options: List[_AbstractLoad] = [
+            joinedload(jl_arg(ArtifactVersionSchema.artifact)).options(
+                *ArtifactSchema.get_query_options()
+            ),
+            joinedload(jl_arg(ArtifactVersionSchema.user)),
+            selectinload(jl_arg(ArtifactVersionSchema.tags)).joinedload(
+                jl_arg(TagResourceSchema.tag)
+            ),
+            selectinload(
+                jl_arg(ArtifactVersionSchema.output_of_step_runs)
+            ).joinedload(jl_arg(StepRunOutputArtifactSchema.step_run)),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(ArtifactVersionSchema.workspace)),
+                    selectinload(jl_arg(ArtifactVersionSchema.visualizations)),
+                    selectinload(
+                        jl_arg(ArtifactVersionSchema.run_metadata)
+                    ).options(*RunMetadataSchema.get_query_options()),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
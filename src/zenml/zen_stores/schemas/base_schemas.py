@@ -14,12 +14,14 @@
 """Base classes for SQLModel schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
+
     from zenml.models.v2.base.base import BaseResponse
 
     B = TypeVar("B", bound=BaseResponse)  # type: ignore[type-arg]
@@ -32,6 +34,29 @@ class BaseSchema(SQLModel):
     created: datetime = Field(default_factory=datetime.utcnow)
     updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["_AbstractLoad"]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        The returned options should cover all relationships that are accessed
+        when calling `to_model(...)` with the same arguments. Applying them to
+        a query avoids issuing a separate query for every related row.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        return []
+
     def to_model(
         self,
         include_metadata: bool = False,
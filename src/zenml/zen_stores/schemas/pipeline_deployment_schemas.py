@@ -13,12 +13,15 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of pipeline deployment tables."""
 
+import hashlib
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import TEXT, Column, String
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -39,7 +42,10 @@ from zenml.zen_stores.schemas.code_repository_schemas import (
 from zenml.zen_stores.schemas.pipeline_build_schemas import PipelineBuildSchema
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
@@ -53,6 +59,9 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
 
     __tablename__ = "pipeline_deployment"
+    __table_args__ = (
+        Index("ix_pipeline_deployment_content_hash", "content_hash"),
+    )
 
     # Fields
     pipeline_configuration: str = Field(
@@ -85,6 +94,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
     )
     code_path: Optional[str] = Field(nullable=True)
+    content_hash: Optional[str] = Field(nullable=True, default=None)
 
     # Foreign keys
     user_id: Optional[UUID] = build_foreign_key_field(
@@ -183,7 +193,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         Returns:
             The created `PipelineDeploymentSchema`.
         """
-        return cls(
+        schema = cls(
             stack_id=request.stack,
             workspace_id=request.workspace,
             pipeline_id=request.pipeline,
@@ -210,6 +220,76 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             else None,
             code_path=request.code_path,
         )
+        schema.content_hash = schema.compute_content_hash()
+        return schema
+
+    def compute_content_hash(self) -> str:
+        """Computes a hash of the stored content of the deployment.
+
+        Deployments with the same content hash are identical apart from their
+        ID and creation time.
+
+        Returns:
+            The content hash.
+        """
+        hash_ = hashlib.sha256()
+        for value in (
+            self.workspace_id,
+            self.user_id,
+            self.stack_id,
+            self.pipeline_id,
+            self.build_id,
+            self.schedule_id,
+            self.template_id,
+            self.code_reference_id,
+            self.run_name_template,
+            self.pipeline_configuration,
+            self.step_configurations,
+            self.client_environment,
+            self.client_version,
+            self.server_version,
+            self.pipeline_version_hash,
+            self.pipeline_spec,
+            self.code_path,
+        ):
+            hash_.update(json.dumps(value, default=str).encode())
+            hash_.update(b"\0")
+        return hash_.hexdigest()
+
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        options: List[_AbstractLoad] = [
+            joinedload(jl_arg(PipelineDeploymentSchema.user)),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineDeploymentSchema.workspace)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.pipeline)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.stack)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.build)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.schedule)),
+                    joinedload(
+                        jl_arg(PipelineDeploymentSchema.code_reference)
+                    ),
+                ]
+            )
+        return options
 
     def to_model(
         self,
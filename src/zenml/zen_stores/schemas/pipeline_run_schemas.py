@@ -15,11 +15,13 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ConfigDict
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -44,7 +46,10 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
 )
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.trigger_schemas import TriggerExecutionSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
@@ -72,6 +77,8 @@ class PipelineRunSchema(NamedSchema, table=True):
             "orchestrator_run_id",
             name="unique_orchestrator_run_id_for_deployment_id",
         ),
+        Index("ix_pipeline_run_name", "name"),
+        Index("ix_pipeline_run_created", "created"),
     )
 
     # Fields
@@ -244,6 +251,61 @@ class PipelineRunSchema(NamedSchema, table=True):
             model_version_id=request.model_version_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        options: List[_AbstractLoad] = [
+            joinedload(jl_arg(PipelineRunSchema.user)),
+            joinedload(jl_arg(PipelineRunSchema.deployment)).options(
+                *PipelineDeploymentSchema.get_query_options(
+                    include_metadata=True
+                )
+            ),
+            joinedload(jl_arg(PipelineRunSchema.trigger_execution)),
+            selectinload(jl_arg(PipelineRunSchema.run_metadata)).options(
+                *RunMetadataSchema.get_query_options()
+            ),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineRunSchema.workspace)),
+                    selectinload(jl_arg(PipelineRunSchema.step_runs)).options(
+                        *StepRunSchema.get_query_options()
+                    ),
+                ]
+            )
+        if include_resources:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineRunSchema.model_version)),
+                    selectinload(jl_arg(PipelineRunSchema.tags)).joinedload(
+                        jl_arg(TagResourceSchema.tag)
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -276,7 +338,10 @@ class PipelineRunSchema(NamedSchema, table=True):
         }
 
         if self.deployment is not None:
-            deployment = self.deployment.to_model()
+            # The deployment metadata is required below, so we load it right
+            # away instead of lazily fetching the hydrated deployment through
+            # the client.
+            deployment = self.deployment.to_model(include_metadata=True)
 
             config = deployment.pipeline_configuration
             client_environment = deployment.client_environment
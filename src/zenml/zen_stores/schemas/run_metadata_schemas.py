@@ -14,10 +14,12 @@
 """SQLModel implementation of pipeline run metadata tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import TEXT, VARCHAR, Column
+from sqlalchemy import TEXT, VARCHAR, Column, Index
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlmodel import Field, Relationship
 
 from zenml.enums import MetadataResourceTypes
@@ -29,7 +31,10 @@ from zenml.models import (
 )
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
 from zenml.zen_stores.schemas.component_schemas import StackComponentSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
@@ -44,6 +49,13 @@ class RunMetadataSchema(BaseSchema, table=True):
     """SQL Model for run metadata."""
 
     __tablename__ = "run_metadata"
+    __table_args__ = (
+        Index(
+            "ix_run_metadata_resource_id_resource_type",
+            "resource_id",
+            "resource_type",
+        ),
+    )
 
     resource_id: UUID
     resource_type: str = Field(sa_column=Column(VARCHAR(255), nullable=False))
@@ -111,6 +123,30 @@ class RunMetadataSchema(BaseSchema, table=True):
     value: str = Field(sa_column=Column(TEXT, nullable=False))
     type: str
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        options: List[_AbstractLoad] = [
+            joinedload(jl_arg(RunMetadataSchema.user)),
+        ]
+        if include_metadata:
+            options.append(joinedload(jl_arg(RunMetadataSchema.workspace)))
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """Utility functions for SQLModel schemas."""
 
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy import Column, ForeignKey
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import Field
 
 
@@ -84,3 +85,19 @@ def build_foreign_key_field(
             **sa_column_kwargs,
         ),
     )
+
+
+def jl_arg(column: Any) -> InstrumentedAttribute[Any]:
+    """Cast a SQLModel relationship so it can be used in a loader option.
+
+    SQLModel annotates relationship attributes with the type of the related
+    schema, which means they can not be passed to `joinedload(...)` or
+    `selectinload(...)` without upsetting mypy.
+
+    Args:
+        column: The relationship attribute of the schema class.
+
+    Returns:
+        The relationship attribute as an `InstrumentedAttribute`.
+    """
+    return cast(InstrumentedAttribute[Any], column)
@@ -15,12 +15,14 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ConfigDict
-from sqlalchemy import TEXT, Column, String
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
@@ -43,7 +45,10 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
     PipelineDeploymentSchema,
 )
 from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
@@ -58,6 +63,18 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        # Used for step cache lookups, which filter by cache key, status and
+        # workspace and pick the most recent step run.
+        Index(
+            "ix_step_run_cache_key",
+            "cache_key",
+            "status",
+            "workspace_id",
+            "created",
+        ),
+        Index("ix_step_run_created", "created"),
+    )
 
     # Fields
     start_time: Optional[datetime] = Field(nullable=True)
@@ -161,6 +178,14 @@ class StepRunSchema(NamedSchema, table=True):
     model_version: "ModelVersionSchema" = Relationship(
         back_populates="step_runs",
     )
+    step_source_code: Optional["StepSourceCodeSchema"] = Relationship(
+        sa_relationship_kwargs={
+            "primaryjoin": "foreign(StepRunSchema.code_hash) == "
+            "StepSourceCodeSchema.code_hash",
+            "uselist": False,
+            "viewonly": True,
+        },
+    )
 
     model_config = ConfigDict(protected_namespaces=())  # type: ignore[assignment]
 
@@ -191,6 +216,57 @@ class StepRunSchema(NamedSchema, table=True):
             model_version_id=request.model_version_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[_AbstractLoad]:
+        """Get the query options to eagerly load the relationships of a schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.artifact_schemas import (
+            ArtifactVersionSchema,
+        )
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+
+        artifact_version_options = ArtifactVersionSchema.get_query_options()
+        options: List[_AbstractLoad] = [
+            joinedload(jl_arg(StepRunSchema.user)),
+            selectinload(jl_arg(StepRunSchema.deployment)),
+            selectinload(jl_arg(StepRunSchema.run_metadata)).options(
+                *RunMetadataSchema.get_query_options()
+            ),
+            selectinload(jl_arg(StepRunSchema.input_artifacts))
+            .joinedload(jl_arg(StepRunInputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+            selectinload(jl_arg(StepRunSchema.output_artifacts))
+            .joinedload(jl_arg(StepRunOutputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(StepRunSchema.workspace)),
+                    joinedload(jl_arg(StepRunSchema.logs)),
+                    selectinload(jl_arg(StepRunSchema.parents)),
+                    selectinload(jl_arg(StepRunSchema.step_source_code)),
+                ]
+            )
+        if include_resources:
+            options.append(joinedload(jl_arg(StepRunSchema.model_version)))
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -270,14 +346,21 @@ class StepRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            # Step runs with a code hash share the docstring and source code
+            # with all other step runs with the same code
+            docstring, source_code = self.docstring, self.source_code
+            if source_code is None and self.step_source_code:
+                docstring = self.step_source_code.docstring
+                source_code = self.step_source_code.source_code
+
             metadata = StepRunResponseMetadata(
                 workspace=self.workspace.to_model(),
                 config=full_step_config.config,
                 spec=full_step_config.spec,
                 cache_key=self.cache_key,
                 code_hash=self.code_hash,
-                docstring=self.docstring,
-                source_code=self.source_code,
+                docstring=docstring,
+                source_code=source_code,
                 start_time=self.start_time,
                 end_time=self.end_time,
                 logs=self.logs.to_model() if self.logs else None,
@@ -329,6 +412,21 @@ class StepRunSchema(NamedSchema, table=True):
         return self
 
 
+class StepSourceCodeSchema(SQLModel, table=True):
+    """SQL Model for the docstrings and source code of steps.
+
+    Step runs reference these by their code hash, so the source code of a
+    step is only stored once no matter how often the step runs.
+    """
+
+    __tablename__ = "step_source_code"
+
+    code_hash: str = Field(primary_key=True)
+    docstring: Optional[str] = Field(sa_column=Column(TEXT, nullable=True))
+    source_code: Optional[str] = Field(sa_column=Column(TEXT, nullable=True))
+    created: datetime = Field(default_factory=datetime.utcnow)
+
+
 class StepRunParentsSchema(SQLModel, table=True):
     """SQL Model that defines the order of steps."""
 
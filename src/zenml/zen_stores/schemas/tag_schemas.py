@@ -17,7 +17,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, List
 from uuid import UUID
 
-from sqlalchemy import VARCHAR, Column
+from sqlalchemy import VARCHAR, Column, Index
 from sqlmodel import Field, Relationship
 
 from zenml.enums import ColorVariants, TaggableResourceTypes
@@ -121,6 +121,13 @@ class TagResourceSchema(BaseSchema, table=True):
     """SQL Model for tag resource relationship."""
 
     __tablename__ = "tag_resource"
+    __table_args__ = (
+        Index(
+            "ix_tag_resource_resource_id_resource_type",
+            "resource_id",
+            "resource_type",
+        ),
+    )
 
     tag_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -20,6 +20,13 @@ import math
 import os
 import re
 import sys
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
@@ -29,6 +36,7 @@ from typing import (
     ClassVar,
     Dict,
     ForwardRef,
+    Iterator,
     List,
     NoReturn,
     Optional,
@@ -59,7 +67,8 @@ from sqlalchemy.exc import (
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import Mapped, noload
+from sqlalchemy.orm import Mapped, noload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.util import immutabledict
 from sqlmodel import (
     Session,
@@ -85,6 +94,7 @@ from zenml.config.global_config import GlobalConfiguration
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.config.server_config import ServerConfiguration
+from zenml.config.step_configurations import Step
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     DEFAULT_PASSWORD,
@@ -96,6 +106,10 @@ from zenml.constants import (
     ENV_ZENML_LOCAL_SERVER,
     ENV_ZENML_SERVER,
     FINISHED_ONBOARDING_SURVEY_KEY,
+    SECRETS_BATCH_WORKERS,
+    SERVICE_CONNECTOR_RESOURCES_CACHE_TTL,
+    SERVICE_CONNECTOR_RESOURCES_TIMEOUT,
+    SERVICE_CONNECTOR_RESOURCES_WORKERS,
     SORT_PIPELINES_BY_LATEST_RUN_KEY,
     SQL_STORE_BACKUP_DIRECTORY_NAME,
     TEXT_FIELD_MAX_LENGTH,
@@ -127,6 +141,7 @@ from zenml.exceptions import (
     EntityExistsError,
     EventSourceExistsError,
     IllegalOperationError,
+    InputResolutionError,
     SecretsStoreNotConfiguredError,
     StackComponentExistsError,
     StackExistsError,
@@ -254,6 +269,8 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunBeginRequest,
+    StepRunBeginResponse,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -282,12 +299,16 @@ from zenml.models import (
     WorkspaceUpdate,
 )
 from zenml.models.v2.core.component import InternalComponentRequest
+from zenml.service_connectors.connector_client_cache import (
+    ConnectorClientCache,
+)
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
 from zenml.stack.flavor_registry import FlavorRegistry
 from zenml.stack_deployments.utils import get_stack_deployment_class
 from zenml.utils import uuid_utils
+from zenml.utils.cache_utils import LRUCache
 from zenml.utils.enum_utils import StrEnum
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
@@ -334,6 +355,7 @@ from zenml.zen_stores.schemas import (
     StepRunOutputArtifactSchema,
     StepRunParentsSchema,
     StepRunSchema,
+    StepSourceCodeSchema,
     TagResourceSchema,
     TagSchema,
     TriggerExecutionSchema,
@@ -344,6 +366,7 @@ from zenml.zen_stores.schemas.artifact_visualization_schemas import (
     ArtifactVisualizationSchema,
 )
 from zenml.zen_stores.schemas.logs_schemas import LogsSchema
+from zenml.zen_stores.schemas.schema_utils import jl_arg
 from zenml.zen_stores.schemas.service_schemas import ServiceSchema
 from zenml.zen_stores.schemas.trigger_schemas import TriggerSchema
 from zenml.zen_stores.secrets_stores.base_secrets_store import BaseSecretsStore
@@ -370,6 +393,14 @@ logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
 
+_CONNECTOR_CLIENT_CACHE: ConnectorClientCache[ServiceConnectorResponse] = (
+    ConnectorClientCache()
+)
+_CONNECTOR_RESOURCES_CACHE: LRUCache[
+    Tuple[UUID, Optional[datetime], Optional[str], Optional[str]],
+    ServiceConnectorResourcesModel,
+] = LRUCache(maxsize=256, ttl=SERVICE_CONNECTOR_RESOURCES_CACHE_TTL)
+
 
 class SQLDatabaseDriver(StrEnum):
     """SQL database drivers supported by the SQL ZenML store."""
@@ -1021,6 +1052,14 @@ class SqlZenStore(BaseZenStore):
                 filter_model.offset : filter_model.offset + filter_model.size
             ]
         else:
+            # Eagerly load all relationships that are needed to convert the
+            # schemas to models instead of lazy loading them for each item.
+            if not custom_schema_to_model_conversion:
+                query = query.options(
+                    *table.get_query_options(
+                        include_metadata=hydrate, include_resources=True
+                    )
+                )
             item_schemas = session.exec(
                 query.limit(filter_model.size).offset(filter_model.offset)
             ).all()
@@ -2776,8 +2815,12 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             artifact_version = session.exec(
-                select(ArtifactVersionSchema).where(
-                    ArtifactVersionSchema.id == artifact_version_id
+                select(ArtifactVersionSchema)
+                .where(ArtifactVersionSchema.id == artifact_version_id)
+                .options(
+                    *ArtifactVersionSchema.get_query_options(
+                        include_metadata=hydrate, include_resources=True
+                    )
                 )
             ).first()
             if artifact_version is None:
@@ -4359,11 +4402,18 @@ class SqlZenStore(BaseZenStore):
     ) -> PipelineDeploymentResponse:
         """Creates a new deployment in a workspace.
 
+        If an identical deployment already exists, it is returned instead of
+        creating a new one. Deployments which still have a placeholder run
+        are not reused, as placeholder runs are matched to the runs that
+        replace them by their deployment. Concurrent submissions might still
+        receive the same deployment, in which case the second placeholder run
+        is created for a copy of it.
+
         Args:
             deployment: The deployment to create.
 
         Returns:
-            The newly created deployment.
+            The newly created or existing deployment.
         """
         with Session(self.engine) as session:
             code_reference_id = self._create_or_reuse_code_reference(
@@ -4375,6 +4425,35 @@ class SqlZenStore(BaseZenStore):
             new_deployment = PipelineDeploymentSchema.from_request(
                 deployment, code_reference_id=code_reference_id
             )
+            existing_deployment = session.exec(
+                select(PipelineDeploymentSchema)
+                .where(
+                    PipelineDeploymentSchema.content_hash
+                    == new_deployment.content_hash
+                )
+                .where(
+                    PipelineDeploymentSchema.workspace_id
+                    == deployment.workspace
+                )
+                .where(
+                    col(PipelineDeploymentSchema.id).not_in(
+                        select(PipelineRunSchema.deployment_id)
+                        .where(
+                            col(PipelineRunSchema.deployment_id).is_not(None)
+                        )
+                        .where(
+                            col(PipelineRunSchema.orchestrator_run_id).is_(
+                                None
+                            )
+                        )
+                    )
+                )
+                .order_by(desc(col(PipelineDeploymentSchema.created)))
+                .limit(1)
+            ).first()
+            if existing_deployment:
+                return existing_deployment.to_model(include_metadata=True)
+
             session.add(new_deployment)
             session.commit()
             session.refresh(new_deployment)
@@ -4904,6 +4983,15 @@ class SqlZenStore(BaseZenStore):
 
             # Create the pipeline run
             new_run = PipelineRunSchema.from_request(pipeline_run)
+            if (
+                pipeline_run.deployment
+                and not pipeline_run.orchestrator_run_id
+            ):
+                new_run.deployment_id = (
+                    self._get_deployment_id_for_placeholder_run(
+                        deployment_id=pipeline_run.deployment, session=session
+                    )
+                )
 
             if pipeline_run.tags:
                 self._attach_tags_to_resource(
@@ -4919,6 +5007,56 @@ class SqlZenStore(BaseZenStore):
                 include_metadata=True, include_resources=True
             )
 
+    def _get_deployment_id_for_placeholder_run(
+        self, deployment_id: UUID, session: Session
+    ) -> UUID:
+        """Gets the ID of the deployment to create a placeholder run for.
+
+        Placeholder runs are matched to the runs that replace them by their
+        deployment, so a deployment can only have a single placeholder run at
+        a time. As identical deployments get reused, concurrent submissions
+        might still receive the same deployment. If the deployment already
+        has a placeholder run, a copy of the deployment is created for the
+        new placeholder run instead.
+
+        Args:
+            deployment_id: The ID of the deployment of the placeholder run.
+            session: DB session.
+
+        Returns:
+            The ID of the deployment or its copy.
+        """
+        # Lock the deployment row, so placeholder runs for the same
+        # deployment are created one after the other and see each other.
+        deployment = session.exec(
+            select(PipelineDeploymentSchema)
+            .with_for_update()
+            .where(PipelineDeploymentSchema.id == deployment_id)
+        ).first()
+        if not deployment:
+            return deployment_id
+
+        # SQLite ignores `SELECT ... FOR UPDATE` and only locks the database
+        # once something gets written, which is why the deployment is updated
+        # before checking for existing placeholder runs.
+        deployment.updated = datetime.utcnow()
+        session.add(deployment)
+        session.flush()
+
+        existing_placeholder_run = session.exec(
+            select(PipelineRunSchema.id)
+            .where(PipelineRunSchema.deployment_id == deployment_id)
+            .where(col(PipelineRunSchema.orchestrator_run_id).is_(None))
+        ).first()
+        if not existing_placeholder_run:
+            return deployment_id
+
+        deployment_copy = PipelineDeploymentSchema(
+            **deployment.model_dump(exclude={"id", "created", "updated"})
+        )
+        session.add(deployment_copy)
+        return deployment_copy.id
+
     def get_run(
         self, run_name_or_id: Union[str, UUID], hydrate: bool = True
     ) -> PipelineRunResponse:
@@ -4934,7 +5072,11 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             return self._get_run_schema(
-                run_name_or_id, session=session
+                run_name_or_id,
+                session=session,
+                query_options=PipelineRunSchema.get_query_options(
+                    include_metadata=hydrate, include_resources=True
+                ),
             ).to_model(include_metadata=hydrate, include_resources=True)
 
     def _replace_placeholder_run(
@@ -5268,26 +5410,45 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The created run metadata.
         """
-        return_value: List[RunMetadataResponse] = []
-        with Session(self.engine) as session:
-            for key, value in run_metadata.values.items():
-                type_ = run_metadata.types[key]
-                run_metadata_schema = RunMetadataSchema(
-                    workspace_id=run_metadata.workspace,
-                    user_id=run_metadata.user,
-                    resource_id=run_metadata.resource_id,
-                    resource_type=run_metadata.resource_type.value,
-                    stack_component_id=run_metadata.stack_component_id,
-                    key=key,
-                    value=json.dumps(value),
-                    type=type_,
-                )
-                session.add(run_metadata_schema)
-                session.commit()
-                return_value.append(
-                    run_metadata_schema.to_model(include_metadata=True)
-                )
-        return return_value
+        return self.create_run_metadata_batch([run_metadata])
+
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources at once.
+
+        All metadata entries are inserted in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+        run_metadata_schemas = [
+            RunMetadataSchema(
+                workspace_id=request.workspace,
+                user_id=request.user,
+                resource_id=request.resource_id,
+                resource_type=request.resource_type.value,
+                stack_component_id=request.stack_component_id,
+                key=key,
+                value=json.dumps(value),
+                type=request.types[key],
+            )
+            for request in run_metadata
+            for key, value in request.values.items()
+        ]
+        if not run_metadata_schemas:
+            return []
+
+        with Session(self.engine) as session:
+            session.add_all(run_metadata_schemas)
+            session.commit()
+            return [
+                run_metadata_schema.to_model(include_metadata=True)
+                for run_metadata_schema in run_metadata_schemas
+            ]
 
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
@@ -5960,6 +6121,58 @@ class SqlZenStore(BaseZenStore):
 
         return secret_model
 
+    def get_secrets_batch(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets including their values.
+
+        The secrets are fetched with a single query and their values are
+        fetched concurrently from the secrets store, which for external
+        secrets stores saves one round trip per secret.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets that exist, in the order of the given IDs.
+        """
+        if not secret_ids:
+            return []
+
+        with Session(self.engine) as session:
+            secrets_in_db = session.exec(
+                select(SecretSchema).where(
+                    col(SecretSchema.id).in_(secret_ids)
+                )
+            ).all()
+            secrets_by_id = {
+                secret.id: secret.to_model(include_metadata=hydrate)
+                for secret in secrets_in_db
+            }
+
+        secret_models = [
+            secrets_by_id[secret_id]
+            for secret_id in dict.fromkeys(secret_ids)
+            if secret_id in secrets_by_id
+        ]
+        if not secret_models:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(SECRETS_BATCH_WORKERS, len(secret_models)),
+            thread_name_prefix="zenml-secret-values",
+        ) as executor:
+            secret_values = executor.map(
+                lambda secret: self._get_secret_values(secret_id=secret.id),
+                secret_models,
+            )
+            for secret_model, values in zip(secret_models, secret_values):
+                secret_model.set_secrets(values)
+
+        return secret_models
+
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
     ) -> Page[SecretResponse]:
@@ -7063,27 +7276,39 @@ class SqlZenStore(BaseZenStore):
         """
         connector = self.get_service_connector(service_connector_id)
 
-        connector_instance = service_connector_registry.instantiate_connector(
-            model=connector
-        )
+        def _create_connector_client() -> ServiceConnectorResponse:
+            connector_instance = (
+                service_connector_registry.instantiate_connector(
+                    model=connector
+                )
+            )
 
-        # Fetch the connector client
-        connector_client = connector_instance.get_connector_client(
-            resource_type=resource_type,
-            resource_id=resource_id,
-        )
+            # Fetch the connector client
+            connector_client = connector_instance.get_connector_client(
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
 
-        # Return the model for the connector client
-        connector = connector_client.to_response_model(
-            user=connector.user,
-            workspace=connector.workspace,
-            description=connector.description,
-            labels=connector.labels,
-        )
+            # Return the model for the connector client
+            connector_client_model = connector_client.to_response_model(
+                user=connector.user,
+                workspace=connector.workspace,
+                description=connector.description,
+                labels=connector.labels,
+            )
 
-        self._populate_connector_type(connector)
+            self._populate_connector_type(connector_client_model)
+            return connector_client_model
 
-        return connector
+        # Generating the client credentials usually involves a request to the
+        # cloud provider, so we reuse clients until they are about to expire
+        return _CONNECTOR_CLIENT_CACHE.get_or_create(
+            connector_id=connector.id,
+            connector_updated=connector.updated,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            create=_create_connector_client,
+        )
 
     def list_service_connector_resources(
         self,
@@ -7107,6 +7332,85 @@ class SqlZenStore(BaseZenStore):
             The matching list of resources that available service
             connectors have access to.
         """
+        service_connectors = self._list_service_connectors_for_resources(
+            workspace_name_or_id=workspace_name_or_id,
+            connector_type=connector_type,
+            resource_type=resource_type,
+            filter_model=filter_model,
+        )
+        resources = {
+            connector_resources.id: connector_resources
+            for connector_resources in self._discover_service_connector_resources(
+                service_connectors=service_connectors,
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
+        }
+
+        # Keep the order of the connectors, independent of the order in which
+        # the resource discovery finished
+        return [
+            resources[connector.id]
+            for connector in service_connectors
+            if connector.id in resources
+        ]
+
+    def iter_service_connector_resources(
+        self,
+        workspace_name_or_id: Union[str, UUID],
+        connector_type: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        filter_model: Optional[ServiceConnectorFilter] = None,
+    ) -> Iterator[ServiceConnectorResourcesModel]:
+        """Iterate over resources that can be accessed by service connectors.
+
+        Unlike `list_service_connector_resources`, the resources of each
+        connector are returned as soon as their discovery finishes.
+
+        Args:
+            workspace_name_or_id: The name or ID of the workspace to scope to.
+            connector_type: The type of service connector to scope to.
+            resource_type: The type of resource to scope to.
+            resource_id: The ID of the resource to scope to.
+            filter_model: Optional filter model to use when fetching service
+                connectors.
+
+        Yields:
+            The resources that each of the available service connectors have
+            access to.
+        """
+        service_connectors = self._list_service_connectors_for_resources(
+            workspace_name_or_id=workspace_name_or_id,
+            connector_type=connector_type,
+            resource_type=resource_type,
+            filter_model=filter_model,
+        )
+        yield from self._discover_service_connector_resources(
+            service_connectors=service_connectors,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
+
+    def _list_service_connectors_for_resources(
+        self,
+        workspace_name_or_id: Union[str, UUID],
+        connector_type: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        filter_model: Optional[ServiceConnectorFilter] = None,
+    ) -> List[ServiceConnectorResponse]:
+        """List the service connectors to discover resources for.
+
+        Args:
+            workspace_name_or_id: The name or ID of the workspace to scope to.
+            connector_type: The type of service connector to scope to.
+            resource_type: The type of resource to scope to.
+            filter_model: Optional filter model to use when fetching service
+                connectors.
+
+        Returns:
+            The matching service connectors.
+        """
         workspace = self.get_workspace(workspace_name_or_id)
 
         if not filter_model:
@@ -7116,70 +7420,174 @@ class SqlZenStore(BaseZenStore):
                 workspace_id=workspace.id,
             )
 
-        service_connectors = self.list_service_connectors(
-            filter_model=filter_model
-        ).items
+        return self.list_service_connectors(filter_model=filter_model).items
 
-        resource_list: List[ServiceConnectorResourcesModel] = []
+    def _discover_service_connector_resources(
+        self,
+        service_connectors: List[ServiceConnectorResponse],
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+    ) -> Iterator[ServiceConnectorResourcesModel]:
+        """Discover the resources of multiple service connectors concurrently.
 
-        for connector in service_connectors:
-            if not service_connector_registry.is_registered(connector.type):
-                # For connectors that we can instantiate, i.e. those that have a
-                # connector type available locally, we return complete
-                # information about the resources that they have access to.
-                #
-                # For those that are not locally available, we only return
-                # rudimentary information extracted from the connector model
-                # without actively trying to discover the resources that they
-                # have access to.
+        Args:
+            service_connectors: The service connectors to discover resources
+                for.
+            resource_type: The type of resource to scope to.
+            resource_id: The ID of the resource to scope to.
 
-                if resource_id and connector.resource_id != resource_id:
-                    # If an explicit resource ID is required, the connector
-                    # has to be configured with it.
-                    continue
+        Yields:
+            The resources of each service connector, in the order in which
+            their discovery finished. Connectors for which the discovery
+            failed are skipped and connectors for which it timed out are
+            returned with an error.
+        """
+        if not service_connectors:
+            return
+
+        def _discover(
+            connector: ServiceConnectorResponse,
+        ) -> Optional[ServiceConnectorResourcesModel]:
+            return self._get_service_connector_resources(
+                connector=connector,
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
 
+        executor = ThreadPoolExecutor(
+            max_workers=min(
+                SERVICE_CONNECTOR_RESOURCES_WORKERS, len(service_connectors)
+            ),
+            thread_name_prefix="zenml-connector-resources",
+        )
+        pending: Dict[
+            "Future[Optional[ServiceConnectorResourcesModel]]",
+            ServiceConnectorResponse,
+        ] = {
+            executor.submit(_discover, connector): connector
+            for connector in service_connectors
+        }
+        # A single deadline for the whole discovery, so that connectors which
+        # are still queued behind slow ones are bounded as well
+        deadline = time.monotonic() + SERVICE_CONNECTOR_RESOURCES_TIMEOUT
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, _ = wait(
+                    pending, timeout=remaining, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    pending.pop(future)
+                    if resources := future.result():
+                        yield resources
+
+            # The discovery of a connector can't be interrupted, but we stop
+            # waiting for the remaining ones once the deadline is exceeded
+            for connector in pending.values():
+                logger.error(
+                    f"Timed out fetching resources from service "
+                    f"connector {connector.name}/{connector.id}."
+                )
                 resources = (
                     ServiceConnectorResourcesModel.from_connector_model(
-                        connector,
-                        resource_type=resource_type,
+                        connector, resource_type=resource_type
                     )
                 )
-                for r in resources.resources:
-                    if not r.resource_ids:
-                        r.error = (
-                            f"The service '{connector.type}' connector type is "
-                            "not available."
-                        )
+                resources.set_error(
+                    "Timed out while fetching the resources the service "
+                    f"connector has access to after "
+                    f"{SERVICE_CONNECTOR_RESOURCES_TIMEOUT} seconds."
+                )
+                yield resources
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            else:
-                try:
-                    connector_instance = (
-                        service_connector_registry.instantiate_connector(
-                            model=connector
-                        )
-                    )
+    def _get_service_connector_resources(
+        self,
+        connector: ServiceConnectorResponse,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+    ) -> Optional[ServiceConnectorResourcesModel]:
+        """Get the resources that a service connector has access to.
 
-                    resources = connector_instance.verify(
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        list_resources=True,
-                    )
-                except (ValueError, AuthorizationException) as e:
-                    error = (
-                        f'Failed to fetch {resource_type or "available"} '
-                        f"resources from service connector {connector.name}/"
-                        f"{connector.id}: {e}"
+        The results of the resource discovery are cached for a short time.
+
+        Args:
+            connector: The service connector.
+            resource_type: The type of resource to scope to.
+            resource_id: The ID of the resource to scope to.
+
+        Returns:
+            The resources that the service connector has access to or None if
+            the resources could not be fetched.
+        """
+        if not service_connector_registry.is_registered(connector.type):
+            # For connectors that we can instantiate, i.e. those that have a
+            # connector type available locally, we return complete
+            # information about the resources that they have access to.
+            #
+            # For those that are not locally available, we only return
+            # rudimentary information extracted from the connector model
+            # without actively trying to discover the resources that they
+            # have access to.
+
+            if resource_id and connector.resource_id != resource_id:
+                # If an explicit resource ID is required, the connector
+                # has to be configured with it.
+                return None
+
+            resources = ServiceConnectorResourcesModel.from_connector_model(
+                connector,
+                resource_type=resource_type,
+            )
+            for r in resources.resources:
+                if not r.resource_ids:
+                    r.error = (
+                        f"The service '{connector.type}' connector type is "
+                        "not available."
                     )
-                    # Log an exception if debug logging is enabled
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception(error)
-                    else:
-                        logger.error(error)
-                    continue
+            return resources
+
+        cache_key = (
+            connector.id,
+            connector.updated,
+            resource_type,
+            resource_id,
+        )
+        if cached_resources := _CONNECTOR_RESOURCES_CACHE.get(cache_key):
+            return cached_resources.model_copy(deep=True)
 
-            resource_list.append(resources)
+        try:
+            connector_instance = (
+                service_connector_registry.instantiate_connector(
+                    model=connector
+                )
+            )
+
+            resources = connector_instance.verify(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                list_resources=True,
+            )
+        except (ValueError, AuthorizationException) as e:
+            error = (
+                f'Failed to fetch {resource_type or "available"} '
+                f"resources from service connector {connector.name}/"
+                f"{connector.id}: {e}"
+            )
+            # Log an exception if debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception(error)
+            else:
+                logger.error(error)
+            return None
 
-        return resource_list
+        _CONNECTOR_RESOURCES_CACHE.set(
+            cache_key, resources.model_copy(deep=True)
+        )
+        return resources
 
     def list_service_connector_types(
         self,
@@ -7884,6 +8292,13 @@ class SqlZenStore(BaseZenStore):
             EntityExistsError: if the step run already exists.
             KeyError: if the pipeline run doesn't exist.
         """
+        if step_run.code_hash and step_run.source_code is not None:
+            self._create_step_source_code(
+                code_hash=step_run.code_hash,
+                docstring=step_run.docstring,
+                source_code=step_run.source_code,
+            )
+
         with Session(self.engine) as session:
             # Check if the pipeline run exists
             run = session.exec(
@@ -7914,6 +8329,10 @@ class SqlZenStore(BaseZenStore):
 
             # Create the step
             step_schema = StepRunSchema.from_request(step_run)
+            if step_run.code_hash:
+                # The docstring and source code are stored once per code hash
+                step_schema.docstring = None
+                step_schema.source_code = None
             session.add(step_schema)
 
             # Add logs entry for the step if exists
@@ -7962,6 +8381,206 @@ class SqlZenStore(BaseZenStore):
 
             return step_schema.to_model(include_metadata=True)
 
+    def _create_step_source_code(
+        self,
+        code_hash: str,
+        docstring: Optional[str],
+        source_code: Optional[str],
+    ) -> None:
+        """Stores the docstring and source code of a step if necessary.
+
+        Args:
+            code_hash: The hash of the step source code.
+            docstring: The docstring of the step.
+            source_code: The source code of the step.
+        """
+        with Session(self.engine) as session:
+            existing_source_code = session.exec(
+                select(StepSourceCodeSchema.code_hash).where(
+                    StepSourceCodeSchema.code_hash == code_hash
+                )
+            ).first()
+            if existing_source_code is not None:
+                return
+
+            session.add(
+                StepSourceCodeSchema(
+                    code_hash=code_hash,
+                    docstring=docstring,
+                    source_code=source_code,
+                )
+            )
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another step run with the same code stored it concurrently
+                session.rollback()
+
+    def begin_run_step(
+        self,
+        request: StepRunBeginRequest,
+        pre_creation_hook: Optional[Callable[[], None]] = None,
+        pre_step_creation_hook: Optional[
+            Callable[[PipelineRunResponse], None]
+        ] = None,
+        cache_allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+    ) -> StepRunBeginResponse:
+        """Gets or creates a pipeline run and begins one of its steps.
+
+        This resolves the inputs of the step that are produced by upstream
+        steps of the same run, computes the cache key, reuses a cached step
+        run if possible and finally creates the step run.
+
+        Args:
+            request: The request to begin the step run.
+            pre_creation_hook: Optional function to run before creating the
+                pipeline run.
+            pre_step_creation_hook: Optional function to run with the created
+                or existing pipeline run before creating the step run.
+            cache_allowed_pipeline_run_ids: Optional IDs of the pipeline runs
+                whose step runs can be reused as cached step runs. Step runs
+                owned by the user of the step run or by no user can always be
+                reused. If `None`, step runs of all pipeline runs can be
+                reused.
+
+        Returns:
+            The pipeline run and the created step run.
+
+        Raises:
+            KeyError: If the deployment or the step configuration doesn't
+                exist.
+            InputResolutionError: If an input of the step can not be resolved.
+        """
+        from zenml.orchestrators import cache_utils
+
+        pipeline_run, pipeline_run_created = self.get_or_create_run(
+            request.pipeline_run, pre_creation_hook=pre_creation_hook
+        )
+        if pre_step_creation_hook:
+            pre_step_creation_hook(pipeline_run)
+
+        step_run = request.step_run.model_copy(deep=True)
+        step_run.pipeline_run_id = pipeline_run.id
+
+        with Session(self.engine) as session:
+            deployment = session.exec(
+                select(PipelineDeploymentSchema).where(
+                    PipelineDeploymentSchema.id == step_run.deployment
+                )
+            ).first()
+            if deployment is None:
+                raise KeyError(
+                    f"Unable to begin step `{step_run.name}`: No deployment "
+                    f"with ID '{step_run.deployment}' found."
+                )
+
+            step_configurations = json.loads(deployment.step_configurations)
+            if step_run.name not in step_configurations:
+                raise KeyError(
+                    f"Unable to begin step `{step_run.name}`: No step with "
+                    f"this name found in deployment '{step_run.deployment}'."
+                )
+            step = Step.model_validate(step_configurations[step_run.name])
+
+            run_steps = {
+                run_step.name: run_step
+                for run_step in session.exec(
+                    select(StepRunSchema)
+                    .where(StepRunSchema.pipeline_run_id == pipeline_run.id)
+                    .options(
+                        selectinload(jl_arg(StepRunSchema.output_artifacts))
+                    )
+                ).all()
+            }
+
+            # Inputs that were resolved on the client, e.g. external
+            # artifacts, come after the outputs of upstream steps to keep
+            # the same input order and therefore the same cache key as when
+            # resolving all inputs on the client
+            inputs: Dict[str, UUID] = {}
+            for name, input_ in step.spec.inputs.items():
+                if input_.step_name not in run_steps:
+                    raise InputResolutionError(
+                        f"No step `{input_.step_name}` found in current run."
+                    )
+
+                outputs = {
+                    output.name: output.artifact_id
+                    for output in run_steps[input_.step_name].output_artifacts
+                }
+                if input_.output_name not in outputs:
+                    raise InputResolutionError(
+                        f"No output `{input_.output_name}` found for step "
+                        f"`{input_.step_name}`."
+                    )
+                inputs[name] = outputs[input_.output_name]
+
+            inputs.update(step_run.inputs)
+            step_run.inputs = inputs
+
+            parent_step_ids = []
+            for upstream_step in (
+                step.spec.upstream_steps + step.spec.reused_upstream_steps
+            ):
+                if upstream_step not in run_steps:
+                    raise InputResolutionError(
+                        f"No step `{upstream_step}` found in current run."
+                    )
+                parent_step_ids.append(run_steps[upstream_step].id)
+            step_run.parent_step_ids = parent_step_ids
+
+            step_run.cache_key = cache_utils.compute_cache_key(
+                step=step,
+                input_artifact_ids=step_run.inputs,
+                workspace_id=step_run.workspace,
+                artifact_store_id=request.artifact_store_id,
+                artifact_store_path=request.artifact_store_path,
+                artifact_store_cache_key=(
+                    bytes.fromhex(request.artifact_store_cache_key)
+                    if request.artifact_store_cache_key
+                    else None
+                ),
+            )
+
+            if request.cache_enabled:
+                cached_step_run_query = (
+                    select(StepRunSchema)
+                    .where(StepRunSchema.cache_key == step_run.cache_key)
+                    .where(
+                        StepRunSchema.status == ExecutionStatus.COMPLETED.value
+                    )
+                    .where(StepRunSchema.workspace_id == step_run.workspace)
+                    .order_by(desc(col(StepRunSchema.created)))
+                    .limit(1)
+                )
+                if cache_allowed_pipeline_run_ids is not None:
+                    cached_step_run_query = cached_step_run_query.where(
+                        or_(
+                            col(StepRunSchema.pipeline_run_id).in_(
+                                cache_allowed_pipeline_run_ids
+                            ),
+                            col(StepRunSchema.user_id).is_(None),
+                            StepRunSchema.user_id == step_run.user,
+                        )
+                    )
+                cached_step_run = session.exec(cached_step_run_query).first()
+                if cached_step_run:
+                    step_run.original_step_run_id = cached_step_run.id
+                    step_run.outputs = {
+                        output.name: output.artifact_id
+                        for output in cached_step_run.output_artifacts
+                    }
+                    step_run.status = ExecutionStatus.CACHED
+                    step_run.end_time = step_run.start_time
+                    # Cached steps don't write logs
+                    step_run.logs = None
+
+        return StepRunBeginResponse(
+            pipeline_run=pipeline_run,
+            pipeline_run_created=pipeline_run_created,
+            step_run=self.create_run_step(step_run),
+        )
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -7980,7 +8599,13 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+                select(StepRunSchema)
+                .where(StepRunSchema.id == step_run_id)
+                .options(
+                    *StepRunSchema.get_query_options(
+                        include_metadata=hydrate, include_resources=True
+                    )
+                )
             ).first()
             if step_run is None:
                 raise KeyError(
@@ -8288,6 +8913,14 @@ class SqlZenStore(BaseZenStore):
                 PipelineRunSchema.id == pipeline_run_id
             )
         ).one()
+        if (
+            pipeline_run.orchestrator_run_id is None
+            and pipeline_run.status == ExecutionStatus.INITIALIZING.value
+        ):
+            # Placeholder runs of resumed runs already contain the reused
+            # step runs, but only start once an orchestrator replaces them
+            return
+
         step_runs = session.exec(
             select(StepRunSchema).where(
                 StepRunSchema.pipeline_run_id == pipeline_run_id
@@ -8296,7 +8929,18 @@ class SqlZenStore(BaseZenStore):
 
         # Deployment always exists for pipeline runs of newer versions
         assert pipeline_run.deployment
-        num_steps = len(pipeline_run.deployment.to_model().step_configurations)
+        step_configurations = (
+            pipeline_run.deployment.to_model().step_configurations
+        )
+        # Resumed runs contain step runs reused from the original run, which
+        # are not part of the deployment
+        num_steps = len(step_configurations) + len(
+            [
+                step_run
+                for step_run in step_runs
+                if step_run.name not in step_configurations
+            ]
+        )
         new_status = get_pipeline_run_status(
             step_statuses=[
                 ExecutionStatus(step_run.status) for step_run in step_runs
@@ -9473,6 +10117,7 @@ class SqlZenStore(BaseZenStore):
         schema_class: Type[AnyNamedSchema],
         schema_name: str,
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> AnyNamedSchema:
         """Query a schema by its 'name' or 'id' field.
 
@@ -9482,6 +10127,8 @@ class SqlZenStore(BaseZenStore):
             schema_name: The name of the schema used for error messages.
                 E.g., "workspace".
             session: The database session to use.
+            query_options: Optional query options, e.g. to eagerly load
+                relationships of the schema.
 
         Returns:
             The schema object.
@@ -9510,7 +10157,7 @@ class SqlZenStore(BaseZenStore):
             )
 
         schema = session.exec(
-            select(schema_class).where(filter_params)
+            select(schema_class).where(filter_params).options(*query_options)
         ).first()
 
         if schema is None:
@@ -9606,6 +10253,7 @@ class SqlZenStore(BaseZenStore):
         self,
         run_name_or_id: Union[str, UUID],
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> PipelineRunSchema:
         """Gets a run schema by name or ID.
 
@@ -9615,6 +10263,8 @@ class SqlZenStore(BaseZenStore):
         Args:
             run_name_or_id: The name or ID of the run to get.
             session: The database session to use.
+            query_options: Optional query options, e.g. to eagerly load
+                relationships of the schema.
 
         Returns:
             The run schema.
@@ -9624,6 +10274,7 @@ class SqlZenStore(BaseZenStore):
             schema_class=PipelineRunSchema,
             schema_name="run",
             session=session,
+            query_options=query_options,
         )
 
     def _get_model_schema(
@@ -10221,6 +10872,74 @@ class SqlZenStore(BaseZenStore):
                 include_metadata=True
             )
 
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version links at once.
+
+        Links that already exist are not created again.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or already existing model version to artifact links,
+            in the same order as the requests.
+        """
+        if not model_version_artifact_links:
+            return []
+
+        with Session(self.engine) as session:
+            existing_links = session.exec(
+                select(ModelVersionArtifactSchema)
+                .where(
+                    col(ModelVersionArtifactSchema.model_version_id).in_(
+                        {
+                            link.model_version
+                            for link in model_version_artifact_links
+                        }
+                    )
+                )
+                .where(
+                    col(ModelVersionArtifactSchema.artifact_version_id).in_(
+                        {
+                            link.artifact_version
+                            for link in model_version_artifact_links
+                        }
+                    )
+                )
+            ).all()
+            links: Dict[Tuple[UUID, UUID], ModelVersionArtifactSchema] = {
+                (link.model_version_id, link.artifact_version_id): link
+                for link in existing_links
+            }
+
+            new_links = []
+            for link_request in model_version_artifact_links:
+                key = (
+                    link_request.model_version,
+                    link_request.artifact_version,
+                )
+                if key in links:
+                    continue
+
+                links[key] = ModelVersionArtifactSchema.from_request(
+                    model_version_artifact_request=link_request,
+                )
+                new_links.append(links[key])
+
+            if new_links:
+                session.add_all(new_links)
+                session.commit()
+
+            return [
+                links[
+                    (link_request.model_version, link_request.artifact_version)
+                ].to_model(include_metadata=True)
+                for link_request in model_version_artifact_links
+            ]
+
     def list_model_version_artifact_links(
         self,
         model_version_artifact_link_filter_model: ModelVersionArtifactFilter,
@@ -128,6 +128,8 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunBeginRequest,
+    StepRunBeginResponse,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -1632,6 +1634,19 @@ class ZenStoreInterface(ABC):
             The created run metadata.
         """
 
+    @abstractmethod
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources at once.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+
     @abstractmethod
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
@@ -1794,6 +1809,21 @@ class ZenStoreInterface(ABC):
             KeyError: if the secret does not exist.
         """
 
+    @abstractmethod
+    def get_secrets_batch(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets including their values.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets that exist, in the order of the given IDs.
+        """
+
     @abstractmethod
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
@@ -2382,6 +2412,27 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def begin_run_step(
+        self, request: StepRunBeginRequest
+    ) -> StepRunBeginResponse:
+        """Gets or creates a pipeline run and begins one of its steps.
+
+        This resolves the inputs of the step that are produced by upstream
+        steps of the same run, computes the cache key, reuses a cached step
+        run if possible and finally creates the step run.
+
+        Args:
+            request: The request to begin the step run.
+
+        Returns:
+            The pipeline run and the created step run.
+
+        Raises:
+            EntityExistsError: if the step run already exists.
+            InputResolutionError: if an input of the step can not be resolved.
+        """
+
     @abstractmethod
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -2929,6 +2980,23 @@ class ZenStoreInterface(ABC):
             EntityExistsError: If a link with the given name already exists.
         """
 
+    @abstractmethod
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version links at once.
+
+        Links that already exist are not created again.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or already existing model version to artifact links,
+            in the same order as the requests.
+        """
+
     @abstractmethod
     def list_model_version_artifact_links(
         self,
@@ -0,0 +1,85 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Configuration of the ZenML orchestration overhead benchmarks.
+
+The size of the synthetic workloads is controlled with the
+`--benchmark-scale` option:
+
+* `small` (default): quick sanity run, suitable for CI.
+* `medium`: larger DAGs, artifacts and databases.
+* `large`: DAGs of 1000 steps, GB sized artifacts and databases with
+    millions of rows. This takes a long time and needs several GB of disk
+    space.
+"""
+
+from typing import Dict, List
+
+import pytest
+
+KB = 1 << 10
+MB = 1 << 20
+GB = 1 << 30
+
+# The parameters of each benchmark scale:
+# * compiled_steps: Number of steps of the compiled synthetic pipelines.
+# * run_steps: Number of steps of the synthetic pipelines that get run.
+# * artifact_bytes: Sizes of the materialized artifacts.
+# * seeded_rows: Number of pipeline and step runs in the seeded databases.
+BENCHMARK_SCALES: Dict[str, Dict[str, List[int]]] = {
+    "small": {
+        "compiled_steps": [10, 100],
+        "run_steps": [10],
+        "artifact_bytes": [KB, MB],
+        "seeded_rows": [1_000],
+    },
+    "medium": {
+        "compiled_steps": [10, 100, 1000],
+        "run_steps": [10, 100],
+        "artifact_bytes": [KB, MB, 100 * MB],
+        "seeded_rows": [1_000, 100_000],
+    },
+    "large": {
+        "compiled_steps": [10, 100, 1000],
+        "run_steps": [10, 100, 1000],
+        "artifact_bytes": [KB, MB, 100 * MB, GB],
+        "seeded_rows": [1_000, 100_000, 1_000_000],
+    },
+}
+
+
+def pytest_addoption(parser):
+    """Adds the benchmark scale option.
+
+    Args:
+        parser: The pytest parser.
+    """
+    parser.addoption(
+        "--benchmark-scale",
+        action="store",
+        default="small",
+        choices=list(BENCHMARK_SCALES),
+        help="The size of the synthetic benchmark workloads.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrizes the benchmarks with the sizes of the selected scale.
+
+    Args:
+        metafunc: The pytest metafunc of the benchmark.
+    """
+    scale = BENCHMARK_SCALES[metafunc.config.getoption("--benchmark-scale")]
+    for name, values in scale.items():
+        if name in metafunc.fixturenames:
+            metafunc.parametrize(name, values, scope="module")
@@ -0,0 +1,61 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmarks of the pipeline compilation."""
+
+from tests.benchmarks.utils import synthetic_pipeline
+from zenml.client import Client
+from zenml.config.compiler import Compiler
+from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
+
+
+def test_pipeline_compilation(
+    benchmark, clean_client, compiled_steps, monkeypatch
+):
+    """Benchmarks compiling pipelines of different sizes."""
+    monkeypatch.setenv("ZENML_DISABLE_COMPILATION_CACHE", "true")
+    pipeline_instance = synthetic_pipeline.copy()
+    pipeline_instance.prepare(num_steps=compiled_steps)
+    stack = Client().active_stack
+
+    deployment = benchmark(
+        Compiler().compile,
+        pipeline=pipeline_instance,
+        stack=stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+
+    assert len(deployment.step_configurations) == compiled_steps
+    benchmark.extra_info["steps"] = compiled_steps
+
+
+def test_cached_pipeline_compilation(benchmark, clean_client, compiled_steps):
+    """Benchmarks compiling unchanged pipelines of different sizes."""
+    pipeline_instance = synthetic_pipeline.copy()
+    pipeline_instance.prepare(num_steps=compiled_steps)
+    stack = Client().active_stack
+    Compiler().compile(
+        pipeline=pipeline_instance,
+        stack=stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+
+    deployment = benchmark(
+        Compiler().compile,
+        pipeline=pipeline_instance,
+        stack=stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+
+    assert len(deployment.step_configurations) == compiled_steps
+    benchmark.extra_info["steps"] = compiled_steps
@@ -0,0 +1,176 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmarks of the save and load throughput of the materializers."""
+
+import os
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import pytest
+from pydantic import BaseModel
+
+from tests.benchmarks.utils import random_bytes
+from zenml.client import Client
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.built_in_materializer import (
+    BuiltInContainerMaterializer,
+    BuiltInMaterializer,
+    BytesMaterializer,
+)
+from zenml.materializers.cloudpickle_materializer import (
+    CloudpickleMaterializer,
+)
+from zenml.materializers.pydantic_materializer import PydanticMaterializer
+
+# Number of elements of the container artifacts
+CONTAINER_ELEMENTS = 100
+
+ROUNDS = 5
+
+
+class SyntheticModel(BaseModel):
+    """Pydantic model of the benchmarked pydantic artifacts."""
+
+    values: Dict[str, str]
+
+
+class SyntheticObject:
+    """Class without a dedicated materializer, which gets pickled."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initializes the object.
+
+        Args:
+            data: The data of the object.
+        """
+        self.data = data
+
+
+def _make_string(size: int) -> Tuple[str, Type[BaseMaterializer]]:
+    return random_bytes(size // 2).hex(), BuiltInMaterializer
+
+
+def _make_bytes(size: int) -> Tuple[bytes, Type[BaseMaterializer]]:
+    return random_bytes(size), BytesMaterializer
+
+
+def _make_list(size: int) -> Tuple[List[bytes], Type[BaseMaterializer]]:
+    element_size = max(size // CONTAINER_ELEMENTS, 1)
+    data = [random_bytes(element_size) for _ in range(CONTAINER_ELEMENTS)]
+    return data, BuiltInContainerMaterializer
+
+
+def _make_model(size: int) -> Tuple[SyntheticModel, Type[BaseMaterializer]]:
+    element_size = max(size // CONTAINER_ELEMENTS, 2)
+    values = {
+        str(i): random_bytes(element_size // 2).hex()
+        for i in range(CONTAINER_ELEMENTS)
+    }
+    return SyntheticModel(values=values), PydanticMaterializer
+
+
+def _make_object(
+    size: int,
+) -> Tuple[SyntheticObject, Type[BaseMaterializer]]:
+    return SyntheticObject(random_bytes(size)), CloudpickleMaterializer
+
+
+def _make_numpy_array(size: int) -> Tuple[Any, Type[BaseMaterializer]]:
+    np = pytest.importorskip("numpy")
+    from zenml.materializers.numpy_materializer import NumpyMaterializer
+
+    data = np.frombuffer(random_bytes(size), dtype=np.uint8)
+    return data, NumpyMaterializer
+
+
+def _make_dataframe(size: int) -> Tuple[Any, Type[BaseMaterializer]]:
+    pd = pytest.importorskip("pandas")
+    from zenml.materializers.pandas_materializer import PandasMaterializer
+
+    array, _ = _make_numpy_array(size)
+    return pd.DataFrame({"values": array}), PandasMaterializer
+
+
+ARTIFACTS: Dict[str, Callable[[int], Tuple[Any, Type[BaseMaterializer]]]] = {
+    "str": _make_string,
+    "bytes": _make_bytes,
+    "list": _make_list,
+    "pydantic": _make_model,
+    "cloudpickle": _make_object,
+    "numpy": _make_numpy_array,
+    "pandas": _make_dataframe,
+}
+
+
+def _record_throughput(benchmark: Any, size: int) -> None:
+    """Records the throughput of a finished benchmark.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        size: The size of the artifact in bytes.
+    """
+    benchmark.extra_info["bytes"] = size
+    benchmark.extra_info["bytes_per_second"] = size / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("artifact_name", list(ARTIFACTS))
+def test_materializer_save(
+    benchmark, clean_client, artifact_name, artifact_bytes
+):
+    """Benchmarks saving artifacts of different types and sizes."""
+    data, materializer_class = ARTIFACTS[artifact_name](artifact_bytes)
+    artifact_store_path = Client().active_stack.artifact_store.path
+
+    with TemporaryDirectory(dir=artifact_store_path) as directory:
+        uris = iter(range(ROUNDS))
+
+        def _setup() -> Tuple[Tuple[str], Dict[str, Any]]:
+            # Every round saves to a new directory
+            uri = os.path.join(directory, str(next(uris)))
+            os.makedirs(uri)
+            return (uri,), {}
+
+        benchmark.pedantic(
+            lambda uri: materializer_class(uri=uri).save(data),
+            setup=_setup,
+            rounds=ROUNDS,
+        )
+        size = fileio.size(directory) // ROUNDS
+
+    _record_throughput(benchmark, size=size)
+
+
+@pytest.mark.parametrize("artifact_name", list(ARTIFACTS))
+def test_materializer_load(
+    benchmark, clean_client, artifact_name, artifact_bytes
+):
+    """Benchmarks loading artifacts of different types and sizes."""
+    data, materializer_class = ARTIFACTS[artifact_name](artifact_bytes)
+    data_type = type(data)
+    artifact_store_path = Client().active_stack.artifact_store.path
+
+    with TemporaryDirectory(dir=artifact_store_path) as uri:
+        materializer_class(uri=uri).save(data)
+        # Don't keep the original in memory while loading large artifacts
+        del data
+        size = fileio.size(uri)
+
+        loaded = benchmark.pedantic(
+            lambda: materializer_class(uri=uri).load(data_type),
+            rounds=ROUNDS,
+        )
+
+    assert isinstance(loaded, data_type)
+    _record_throughput(benchmark, size=size)
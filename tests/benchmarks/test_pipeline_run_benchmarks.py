@@ -0,0 +1,52 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmarks of the orchestration overhead of pipeline runs."""
+
+from tests.benchmarks.utils import synthetic_pipeline
+from zenml.utils.profiling_utils import (
+    STORE_REQUESTS_COUNTER,
+    StepProfiler,
+)
+
+ROUNDS = 3
+WARMUP_ROUNDS = 1
+
+
+def test_pipeline_run(benchmark, clean_client, run_steps):
+    """Benchmarks running pipelines of trivial steps on the local stack.
+
+    The steps do no work, so the measured time is the overhead of the
+    orchestration: compiling and storing the deployment, creating the runs,
+    resolving the inputs and storing the outputs.
+    """
+    profiler = StepProfiler()
+
+    def _run() -> None:
+        with profiler:
+            synthetic_pipeline(num_steps=run_steps)
+
+    # Store requests are only counted for REST stores. Every round creates
+    # new runs, so a single round per iteration keeps the size of the
+    # database comparable between runs.
+    benchmark.pedantic(
+        _run, rounds=ROUNDS, iterations=1, warmup_rounds=WARMUP_ROUNDS
+    )
+
+    run = clean_client.get_pipeline("synthetic_pipeline").last_run
+    assert len(run.steps) == run_steps
+
+    benchmark.extra_info["steps"] = run_steps
+    benchmark.extra_info["store_requests_per_run"] = profiler.counters.get(
+        STORE_REQUESTS_COUNTER, 0
+    ) // (ROUNDS + WARMUP_ROUNDS)
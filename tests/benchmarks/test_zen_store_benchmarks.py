@@ -0,0 +1,122 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmarks of the latency of ZenML store queries on large databases."""
+
+import pytest
+
+from tests.benchmarks.utils import (
+    MAX_API_SEEDED_ROWS,
+    seed_runs,
+    synthetic_pipeline,
+)
+from zenml.client import Client
+from zenml.models import PipelineRunResponse
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+PAGE_SIZE = 50
+
+
+@pytest.fixture(scope="module")
+def seeded_run(module_clean_client, seeded_rows) -> PipelineRunResponse:
+    """Seeds the store with the given number of pipeline runs.
+
+    The store of the module is shared by all scales, so each scale only
+    seeds the runs that are missing.
+
+    Args:
+        module_clean_client: The client of the module.
+        seeded_rows: The number of runs to seed.
+
+    Returns:
+        The run which was used as template for the seeded runs.
+    """
+    if seeded_rows > MAX_API_SEEDED_ROWS and not isinstance(
+        module_clean_client.zen_store, SqlZenStore
+    ):
+        pytest.skip(
+            f"Seeding {seeded_rows} runs is only supported for SQL stores."
+        )
+
+    pipeline = synthetic_pipeline.with_options()
+    existing_runs = module_clean_client.list_pipeline_runs(size=1).total
+    if existing_runs == 0:
+        pipeline(num_steps=10)
+        existing_runs = 1
+
+    template_run = module_clean_client.list_pipeline_runs(
+        sort_by="asc:created", size=1
+    )[0]
+    if seeded_rows > existing_runs:
+        seed_runs(template_run, count=seeded_rows - existing_runs)
+
+    return template_run
+
+
+def test_list_runs(benchmark, seeded_run, seeded_rows):
+    """Benchmarks listing the latest runs."""
+    client = Client()
+    page = benchmark(
+        client.list_pipeline_runs, sort_by="desc:created", size=PAGE_SIZE
+    )
+
+    assert page.total >= seeded_rows
+    benchmark.extra_info["rows"] = seeded_rows
+
+
+def test_list_runs_last_page(benchmark, seeded_run, seeded_rows):
+    """Benchmarks listing the oldest runs, which requires a large offset."""
+    client = Client()
+    last_page = seeded_rows // PAGE_SIZE
+    page = benchmark(
+        client.list_pipeline_runs,
+        sort_by="desc:created",
+        size=PAGE_SIZE,
+        page=last_page,
+    )
+
+    assert page.items
+    benchmark.extra_info["rows"] = seeded_rows
+
+
+def test_list_runs_filtered_by_name(benchmark, seeded_run, seeded_rows):
+    """Benchmarks listing runs with a name filter."""
+    client = Client()
+    page = benchmark(
+        client.list_pipeline_runs,
+        name=f"contains:{seeded_run.name}_1",
+        size=PAGE_SIZE,
+    )
+
+    assert page.items
+    benchmark.extra_info["rows"] = seeded_rows
+
+
+def test_get_run(benchmark, seeded_run, seeded_rows):
+    """Benchmarks getting a single run by ID."""
+    client = Client()
+    run = benchmark(client.get_pipeline_run, seeded_run.id)
+
+    assert run.id == seeded_run.id
+    benchmark.extra_info["rows"] = seeded_rows
+
+
+def test_list_run_steps(benchmark, seeded_run, seeded_rows):
+    """Benchmarks listing the steps of a run."""
+    client = Client()
+    page = benchmark(
+        client.list_run_steps, pipeline_run_id=seeded_run.id, size=PAGE_SIZE
+    )
+
+    assert page.total == len(seeded_run.steps)
+    benchmark.extra_info["rows"] = seeded_rows
@@ -0,0 +1,205 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Synthetic workloads for the ZenML orchestration overhead benchmarks."""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from zenml import pipeline, step
+from zenml.client import Client
+from zenml.models import PipelineRunRequest, PipelineRunResponse
+from zenml.zen_stores.schemas import PipelineRunSchema, StepRunSchema
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+# Fixed seed so that all benchmark runs use the same synthetic data
+BENCHMARK_SEED = 42
+
+# Seeding through the REST API creates one run per request, which is too
+# slow for databases of realistic size.
+MAX_API_SEEDED_ROWS = 1_000
+
+SEED_CHUNK_SIZE = 10_000
+
+
+@step
+def source_step() -> int:
+    """Synthetic step without inputs.
+
+    Returns:
+        A constant.
+    """
+    return 1
+
+
+@step
+def combine_step(a: int, b: int) -> int:
+    """Synthetic step with two inputs.
+
+    Args:
+        a: The first input.
+        b: The second input.
+
+    Returns:
+        The sum of the inputs.
+    """
+    return a + b
+
+
+@pipeline(enable_cache=False)
+def synthetic_pipeline(num_steps: int, width: int = 10) -> None:
+    """Synthetic pipeline with a DAG of the given number of steps.
+
+    The first `width` steps have no inputs. Every following step consumes
+    the outputs of its predecessor and of the step `width` positions before
+    it, which results in a DAG with both long chains and fan-out.
+
+    Args:
+        num_steps: The number of steps of the pipeline.
+        width: The number of steps without inputs.
+    """
+    outputs = [
+        source_step(id=f"source_{i}") for i in range(min(width, num_steps))
+    ]
+    for i in range(len(outputs), num_steps):
+        outputs.append(
+            combine_step(outputs[i - 1], outputs[i - width], id=f"combine_{i}")
+        )
+
+
+def random_bytes(size: int) -> bytes:
+    """Generates reproducible random bytes.
+
+    Args:
+        size: The number of bytes.
+
+    Returns:
+        The random bytes.
+    """
+    rng = random.Random(BENCHMARK_SEED)
+    return rng.getrandbits(8 * size).to_bytes(size, "little")
+
+
+def seed_runs(template_run: PipelineRunResponse, count: int) -> None:
+    """Seeds the active ZenML store with copies of a pipeline run.
+
+    For SQL stores, the rows of the run and its step runs are copied with
+    bulk inserts. Other stores are seeded through the API, which is only
+    feasible for a small number of runs.
+
+    Args:
+        template_run: The run to copy.
+        count: The number of runs to create.
+
+    Raises:
+        ValueError: If the store can't be seeded with the given number of
+            runs.
+    """
+    zen_store = Client().zen_store
+    if not isinstance(zen_store, SqlZenStore):
+        if count > MAX_API_SEEDED_ROWS:
+            raise ValueError(
+                f"Seeding {count} runs through the API is not supported, "
+                f"the maximum is {MAX_API_SEEDED_ROWS}."
+            )
+        _seed_runs_through_api(template_run=template_run, count=count)
+        return
+
+    with Session(zen_store.engine) as session:
+        run_row = _get_row(session.get(PipelineRunSchema, template_run.id))
+        step_rows = [
+            _get_row(step_run)
+            for step_run in session.exec(
+                select(StepRunSchema).where(
+                    StepRunSchema.pipeline_run_id == template_run.id
+                )
+            ).all()
+        ]
+
+        for chunk_start in range(0, count, SEED_CHUNK_SIZE):
+            run_copies: List[Dict[str, Any]] = []
+            step_copies: List[Dict[str, Any]] = []
+            for i in range(
+                chunk_start, min(chunk_start + SEED_CHUNK_SIZE, count)
+            ):
+                created = run_row["created"] - timedelta(seconds=i + 1)
+                run_copy = dict(
+                    run_row,
+                    id=uuid4(),
+                    name=f"{run_row['name']}_{i}",
+                    orchestrator_run_id=None,
+                    created=created,
+                    updated=created,
+                )
+                run_copies.append(run_copy)
+                step_copies.extend(
+                    dict(
+                        step_row,
+                        id=uuid4(),
+                        pipeline_run_id=run_copy["id"],
+                        created=created,
+                        updated=created,
+                    )
+                    for step_row in step_rows
+                )
+
+            session.execute(insert(PipelineRunSchema), run_copies)
+            if step_copies:
+                session.execute(insert(StepRunSchema), step_copies)
+            session.commit()
+
+
+def _get_row(schema: Any) -> Dict[str, Any]:
+    """Gets the column values of a schema.
+
+    Args:
+        schema: The schema.
+
+    Returns:
+        The column values.
+    """
+    return {
+        column.name: getattr(schema, column.name)
+        for column in schema.__table__.columns
+    }
+
+
+def _seed_runs_through_api(
+    template_run: PipelineRunResponse, count: int
+) -> None:
+    """Seeds the active ZenML store with runs through the API.
+
+    Args:
+        template_run: The run to copy.
+        count: The number of runs to create.
+    """
+    client = Client()
+    for i in range(count):
+        client.zen_store.create_run(
+            PipelineRunRequest(
+                name=f"{template_run.name}_{i}",
+                status=template_run.status,
+                start_time=datetime.utcnow(),
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+                deployment=template_run.deployment_id,
+                pipeline=template_run.pipeline.id
+                if template_run.pipeline
+                else None,
+            )
+        )
@@ -107,6 +107,14 @@ def pytest_addoption(parser):
         "after tests have run. This is useful if you are running the examples "
         "integration tests using a Docker based orchestrator.",
     )
+    parser.addoption(
+        "--explain-queries",
+        action="store_true",
+        default=False,
+        help="Capture the query plans of all SQL queries executed by the "
+        "ZenML store tests and report the ones that perform full table "
+        "scans. Only supported for SQL stores backed by SQLite or MySQL.",
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
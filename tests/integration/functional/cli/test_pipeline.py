@@ -95,6 +95,42 @@ def test_pipeline_run_delete(clean_client_with_run):
     assert len(existing_runs) == 0
 
 
+def test_pipeline_run_profile(clean_client_with_run):
+    """Test that zenml pipeline runs profile does not fail."""
+    run_name = clean_client_with_run.list_runs()[0].name
+    runner = CliRunner()
+    profile_command = (
+        cli.commands["pipeline"].commands["runs"].commands["profile"]
+    )
+    result = runner.invoke(profile_command, [run_name])
+    assert result.exit_code == 0
+
+
+def test_pipeline_run_logs(clean_client_with_run):
+    """Test that zenml pipeline runs logs shows the logs of the steps."""
+    run = clean_client_with_run.list_runs()[0]
+    runner = CliRunner()
+    logs_command = cli.commands["pipeline"].commands["runs"].commands["logs"]
+    result = runner.invoke(logs_command, [run.name, "--follow"])
+    assert result.exit_code == 0
+    for step_name in run.steps:
+        assert f"Logs of step '{step_name}'" in result.output
+
+    result = runner.invoke(logs_command, [run.name, "--step", "not_a_step"])
+    assert result.exit_code == 1
+
+
+def test_pipeline_run_resume_fails_for_completed_run(clean_client_with_run):
+    """Test that resuming a run without failed steps requires a step."""
+    run_name = clean_client_with_run.list_runs()[0].name
+    runner = CliRunner()
+    resume_command = (
+        cli.commands["pipeline"].commands["runs"].commands["resume"]
+    )
+    result = runner.invoke(resume_command, [run_name])
+    assert result.exit_code == 1
+
+
 def test_pipeline_schedule_list(clean_client_with_scheduled_run):
     """Test that `zenml pipeline schedules list` does not fail."""
     runner = CliRunner()
@@ -25,6 +25,7 @@ from tests.integration.functional.zen_stores.utils import (
 )
 from zenml.constants import TEXT_FIELD_MAX_LENGTH
 from zenml.enums import ExecutionStatus
+from zenml.orchestrators.step_launcher import StepLauncher
 
 if TYPE_CHECKING:
     from zenml.client import Client
@@ -99,6 +100,35 @@ def test_step_run_has_source_code(clean_client, connected_two_step_pipeline):
     )
 
 
+def test_step_source_code_is_only_uploaded_once(
+    clean_client: "Client", connected_two_step_pipeline, mocker
+):
+    """Test that the step source code is only sent for the first step run."""
+    source_code_spy = mocker.spy(
+        StepLauncher, "_get_step_docstring_and_source_code"
+    )
+
+    pipeline_instance = connected_two_step_pipeline(
+        step_1=constant_int_output_test_step(),
+        step_2=int_plus_one_test_step(),
+    )
+    pipeline_instance.run(enable_cache=False)
+    pipeline_instance.run(enable_cache=False)
+
+    assert source_code_spy.call_count == 2
+
+    runs = clean_client.get_pipeline("connected_two_step_pipeline").runs
+    assert len(runs) == 2
+    for run in runs:
+        assert run.steps["step_1"].source_code == inspect.getsource(
+            constant_int_output_test_step.entrypoint
+        )
+        assert (
+            run.steps["step_2"].docstring
+            == int_plus_one_test_step.entrypoint.__doc__
+        )
+
+
 def test_step_run_with_too_long_source_code_is_truncated(
     clean_client, connected_two_step_pipeline, mocker
 ):
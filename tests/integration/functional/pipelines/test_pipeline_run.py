@@ -1,4 +1,8 @@
+import pytest
+
 from zenml import pipeline, step
+from zenml.enums import ExecutionStatus
+from zenml.orchestrators.step_launcher import StepLauncher
 
 
 @step(enable_cache=False)
@@ -18,3 +22,89 @@ def test_pipeline_run_returns_up_to_date_run_info():
         pipeline_run_info.steps["constant_int_output_test_step"].status
         == "completed"
     )
+
+
+EXECUTED_STEPS = []
+SHOULD_FAIL = {"value": True}
+
+
+@step(enable_cache=False)
+def resume_source_step() -> int:
+    EXECUTED_STEPS.append("source")
+    return 1
+
+
+@step(enable_cache=False)
+def resume_flaky_step(value: int) -> int:
+    EXECUTED_STEPS.append("flaky")
+    if SHOULD_FAIL["value"]:
+        raise RuntimeError("Failing on purpose.")
+    return value + 1
+
+
+@step(enable_cache=False)
+def resume_sink_step(value: int) -> int:
+    EXECUTED_STEPS.append("sink")
+    return value + 1
+
+
+@pipeline
+def resume_pipeline():
+    resume_sink_step(resume_flaky_step(resume_source_step()))
+
+
+@pytest.mark.parametrize("single_request", [True, False])
+def test_resume_pipeline_run(clean_client, mocker, single_request):
+    """Tests resuming a failed pipeline run and resuming from a step."""
+    mocker.patch.object(
+        StepLauncher,
+        "_can_begin_step_run_in_single_request",
+        return_value=single_request,
+    )
+    EXECUTED_STEPS.clear()
+    SHOULD_FAIL["value"] = True
+    with pytest.raises(RuntimeError):
+        resume_pipeline()
+
+    failed_run = clean_client.get_pipeline("resume_pipeline").last_run
+    assert failed_run.status == ExecutionStatus.FAILED
+
+    EXECUTED_STEPS.clear()
+    SHOULD_FAIL["value"] = False
+    resumed_run = clean_client.resume_pipeline_run(failed_run.id)
+
+    assert EXECUTED_STEPS == ["flaky", "sink"]
+    assert resumed_run.id != failed_run.id
+    assert resumed_run.status == ExecutionStatus.COMPLETED
+    assert len(resumed_run.steps) == 3
+
+    reused_step = resumed_run.steps["resume_source_step"]
+    original_step = failed_run.steps["resume_source_step"]
+    assert reused_step.status == ExecutionStatus.CACHED
+    assert reused_step.original_step_run_id == original_step.id
+    assert reused_step.outputs["output"].id == original_step.output.id
+    assert (
+        resumed_run.steps["resume_flaky_step"].inputs["value"].id
+        == original_step.output.id
+    )
+    assert resumed_run.steps["resume_flaky_step"].parent_step_ids == [
+        reused_step.id
+    ]
+    assert resumed_run.steps["resume_sink_step"].output.load() == 3
+
+    with pytest.raises(ValueError):
+        clean_client.resume_pipeline_run(resumed_run.id)
+
+    EXECUTED_STEPS.clear()
+    rerun = clean_client.resume_pipeline_run(
+        resumed_run.id, from_step="resume_sink_step"
+    )
+    assert EXECUTED_STEPS == ["sink"]
+    assert rerun.status == ExecutionStatus.COMPLETED
+    assert (
+        rerun.steps["resume_flaky_step"].original_step_run_id
+        == resumed_run.steps["resume_flaky_step"].id
+    )
+    assert rerun.steps["resume_sink_step"].parent_step_ids == [
+        rerun.steps["resume_flaky_step"].id
+    ]
@@ -7,7 +7,11 @@ from zenml import pipeline, step
 from zenml.artifacts.utils import _load_file_from_artifact_store
 from zenml.client import Client
 from zenml.logger import get_logger
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging.step_logging import (
+    StepLogsStorage,
+    fetch_logs,
+    tail_logs,
+)
 
 logger = get_logger(__name__)
 
@@ -220,3 +224,108 @@ def test_that_fetch_logs_works_with_legacy(clean_client: Client):
     assert data_.count("1") == 3
     assert data_.count("2") == 3
     assert data_.count("3") == 3
+
+
+def test_that_tail_logs_reads_incrementally(clean_client: Client):
+    """Tail logs split over multiple files in small chunks."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_dir = Path(os.path.join(artifact_store.path, "fake_logs"))
+    artifact_store.makedirs(logs_dir)
+    logs_dir = str(logs_dir.absolute())
+    data = ["111ä", "€222", "333"]
+    for i, d in enumerate(data):
+        with artifact_store.open(
+            os.path.join(logs_dir, f"fake_logs_{i}.txt"), "wb"
+        ) as f:
+            f.write(d.encode())
+
+    # Chunks of 3 bytes split the multi-byte characters
+    chunks = list(tail_logs(artifact_store, logs_dir, chunk_size=3))
+    assert len(chunks) > len(data)
+    assert "".join(chunks) == "".join(data)
+
+    offset = len("".join(data[:2]).encode())
+    chunks = list(tail_logs(artifact_store, logs_dir, offset=offset))
+    assert "".join(chunks) == data[2]
+
+    def _write_more_logs_once():
+        if artifact_store.exists(os.path.join(logs_dir, "fake_logs_3.txt")):
+            return False
+        with artifact_store.open(
+            os.path.join(logs_dir, "fake_logs_3.txt"), "w"
+        ) as f:
+            f.write("444")
+        return True
+
+    chunks = list(
+        tail_logs(
+            artifact_store,
+            logs_dir,
+            offset=offset,
+            follow=_write_more_logs_once,
+            poll_interval=0,
+        )
+    )
+    assert "".join(chunks) == "333444"
+
+
+def test_that_logs_are_saved_without_further_writes(clean_client: Client):
+    """Check that the flush thread saves buffered logs of idle steps."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_file = os.path.join(artifact_store.path, "fake_logs.log")
+
+    storage = StepLogsStorage(logs_uri=logs_file, time_interval=0.1)
+    storage.start_flush_thread()
+    try:
+        storage.write("message")
+        deadline = time.time() + 10
+        while not artifact_store.exists(logs_file) and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        storage.stop_flush_thread()
+
+    assert "message" in "".join(tail_logs(artifact_store, logs_file))
+
+
+@patch(
+    "zenml.artifact_stores.base_artifact_store.BaseArtifactStoreConfig.IS_IMMUTABLE_FILESYSTEM",
+    True,
+)
+def test_that_tail_logs_reads_merged_files_once(clean_client: Client):
+    """Tail logs while their files get merged."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_dir = Path(os.path.join(artifact_store.path, "fake_logs"))
+    artifact_store.makedirs(logs_dir)
+    logs_dir = str(logs_dir.absolute())
+
+    storage = StepLogsStorage(logs_uri=logs_dir)
+    storage._artifact_store = artifact_store
+    storage._write_messages(["first"])
+    time.sleep(0.01)
+    storage._write_messages(["second"])
+    logs = "".join(tail_logs(artifact_store, logs_dir))
+    offset = len(logs.split("\n")[0].encode()) + 1
+
+    # Tail the logs after the merged file was written, but before the merged
+    # files get removed
+    tailed_logs = []
+    remove = artifact_store.remove
+
+    def _remove(path):
+        if not tailed_logs:
+            tailed_logs.append("".join(tail_logs(artifact_store, logs_dir)))
+            tailed_logs.append(
+                "".join(tail_logs(artifact_store, logs_dir, offset=offset))
+            )
+        remove(path)
+
+    with patch.object(artifact_store, "remove", _remove):
+        storage.merge_log_files()
+
+    assert len(artifact_store.listdir(logs_dir)) == 1
+    all_logs, new_logs = tailed_logs
+    assert all_logs.count("first") == 1
+    assert all_logs.count("second") == 1
+    assert "first" not in new_logs
+    assert new_logs.count("second") == 1
+    assert all_logs == "".join(tail_logs(artifact_store, logs_dir))
@@ -14,9 +14,11 @@
 import os
 import random
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack as does_not_raise
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Optional, Tuple
 from uuid import uuid4
 
 import pytest
@@ -28,6 +30,7 @@ from tests.integration.functional.conftest import (
     int_plus_one_test_step,
 )
 from tests.integration.functional.utils import sample_name
+from tests.integration.functional.zen_stores.utils import WorkspaceContext
 from zenml import (
     ExternalArtifact,
     log_artifact_metadata,
@@ -39,6 +42,7 @@ from zenml.client import Client
 from zenml.config.source import Source
 from zenml.constants import PAGE_SIZE_DEFAULT
 from zenml.enums import (
+    ExecutionStatus,
     MetadataResourceTypes,
     ModelStages,
     SecretScope,
@@ -60,9 +64,16 @@ from zenml.models import (
     ModelVersionResponse,
     PipelineBuildRequest,
     PipelineDeploymentRequest,
+    PipelineDeploymentResponse,
     PipelineRequest,
+    PipelineRunRequest,
+    PipelineRunResponse,
     StackResponse,
 )
+from zenml.new.pipelines.run_utils import (
+    create_placeholder_run,
+    get_deployment_of_placeholder_run,
+)
 from zenml.utils import io_utils
 from zenml.utils.string_utils import random_str
 
@@ -781,6 +792,81 @@ def test_create_secret_existing_name_different_scope():
         assert s1.name == s2.name
 
 
+def test_get_secrets_by_name(mocker):
+    """Test fetching multiple secrets by name and caching them."""
+    client = Client()
+    with random_secret_context() as name:
+        workspace_secret = client.create_secret(
+            name=name,
+            values={"key": "value"},
+        )
+        user_secret = client.create_secret(
+            name=f"{name}_user",
+            scope=SecretScope.USER,
+            values={"key": "user_value"},
+        )
+
+        secrets = client.get_secrets_by_name(
+            [name, f"{name}_user", f"{name}_missing"]
+        )
+        assert set(secrets) == {name, f"{name}_user"}
+        assert secrets[name].id == workspace_secret.id
+        assert secrets[name].secret_values == {"key": "value"}
+        assert secrets[f"{name}_user"].id == user_secret.id
+
+        # Secrets are served from the cache until they are updated
+        get_secrets_batch = mocker.spy(
+            type(client.zen_store), "get_secrets_batch"
+        )
+        assert client.get_secret_by_name_and_scope(name).secret_values == {
+            "key": "value"
+        }
+        client.get_secrets_by_name([name])
+        get_secrets_batch.assert_not_called()
+
+        client.update_secret(name, add_or_update_values={"key": "new"})
+        secrets = client.get_secrets_by_name([name])
+        assert secrets[name].secret_values == {"key": "new"}
+        get_secrets_batch.assert_called_once()
+
+        # The user scoped secret takes precedence once it exists
+        client.create_secret(
+            name=name,
+            scope=SecretScope.USER,
+            values={"key": "user_value"},
+        )
+        secrets = client.get_secrets_by_name([name])
+        assert secrets[name].scope == SecretScope.USER
+
+
+def test_get_secrets_by_name_only_lists_requested_secrets(mocker):
+    """Test that fetching secrets by name doesn't list unrelated secrets."""
+    client = Client()
+    with random_secret_context() as name:
+        client.create_secret(name=name, values={"key": "value"})
+        client.create_secret(name=f"{name}_other", values={"key": "value"})
+
+        list_secrets = mocker.spy(client, "list_secrets")
+        secrets = client.get_secrets_by_name([name])
+
+        assert set(secrets) == {name}
+        for call in list_secrets.call_args_list:
+            assert call.kwargs["name"] == f"equals:{name}"
+
+
+def test_secret_cache_is_scoped_to_the_active_workspace():
+    """Test that cached secrets are not shared between workspaces."""
+    client = Client()
+    with random_secret_context() as name:
+        client.create_secret(name=name, values={"key": "value"})
+        assert set(client.get_secrets_by_name([name])) == {name}
+
+        with WorkspaceContext(activate=True):
+            assert client.get_secrets_by_name([name]) == {}
+            with pytest.raises(KeyError):
+                client.get_secret_by_name_and_scope(name)
+
+
 # ---------------
 # Pipeline Builds
 # ---------------
@@ -924,6 +1010,99 @@ def test_deleting_deployments(clean_client):
         clean_client.get_deployment(str(response.id))
 
 
+def test_identical_deployments_are_reused(clean_client):
+    """Tests that creating an identical deployment reuses the existing one."""
+    request = PipelineDeploymentRequest(
+        user=clean_client.active_user.id,
+        workspace=clean_client.active_workspace.id,
+        stack=clean_client.active_stack.id,
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline_name"},
+        client_version="0.12.3",
+        server_version="0.12.3",
+    )
+    response = clean_client.zen_store.create_deployment(request)
+    assert clean_client.zen_store.create_deployment(request).id == response.id
+
+    other_request = request.model_copy(update={"run_name_template": "other"})
+    other_response = clean_client.zen_store.create_deployment(other_request)
+    assert other_response.id != response.id
+    assert len(clean_client.list_deployments()) == 2
+
+    # Deployments with a placeholder run don't get reused
+    clean_client.zen_store.create_run(
+        PipelineRunRequest(
+            name="placeholder_run",
+            status=ExecutionStatus.INITIALIZING,
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            deployment=response.id,
+        )
+    )
+    assert clean_client.zen_store.create_deployment(request).id != response.id
+
+
+def test_concurrently_reused_deployments_get_separate_placeholder_runs(
+    clean_client,
+):
+    """Tests that placeholder runs of concurrent submissions which reuse the
+    same deployment are replaced by the right pipeline runs."""
+    request = PipelineDeploymentRequest(
+        user=clean_client.active_user.id,
+        workspace=clean_client.active_workspace.id,
+        stack=clean_client.active_stack.id,
+        run_name_template="run-{date}-{time}",
+        pipeline_configuration={"name": "pipeline_name"},
+        client_version="0.12.3",
+        server_version="0.12.3",
+    )
+    barrier = threading.Barrier(2)
+
+    def _submit() -> Tuple[PipelineDeploymentResponse, PipelineRunResponse]:
+        deployment = clean_client.zen_store.create_deployment(request)
+        # Both submissions receive their deployment before any placeholder
+        # run exists
+        barrier.wait()
+        placeholder_run = create_placeholder_run(deployment=deployment)
+        assert placeholder_run
+        return (
+            get_deployment_of_placeholder_run(
+                placeholder_run=placeholder_run, deployment=deployment
+            ),
+            placeholder_run,
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(_submit) for _ in range(2)]
+        submissions = [future.result() for future in futures]
+
+    (first_deployment, first_run), (second_deployment, second_run) = (
+        submissions
+    )
+    assert first_run.deployment_id == first_deployment.id
+    assert second_run.deployment_id == second_deployment.id
+    assert first_deployment.id != second_deployment.id
+
+    # The orchestrator runs of both submissions replace their own placeholder
+    # run, independent of the order in which they start
+    for orchestrator_run_id, deployment, placeholder_run in [
+        ("second", second_deployment, second_run),
+        ("first", first_deployment, first_run),
+    ]:
+        run, created = clean_client.zen_store.get_or_create_run(
+            PipelineRunRequest(
+                name=placeholder_run.name,
+                orchestrator_run_id=orchestrator_run_id,
+                status=ExecutionStatus.RUNNING,
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+                deployment=deployment.id,
+            )
+        )
+        assert created
+        assert run.id == placeholder_run.id
+
+
 def test_get_run(clean_client: Client, connected_two_step_pipeline):
     """Test that `get_run()` returns the correct run."""
     pipeline_instance = connected_two_step_pipeline(
@@ -0,0 +1,58 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import warnings
+from typing import Generator, Optional
+
+import pytest
+
+from tests.integration.functional.zen_stores.utils import QueryPlanCollector
+from zenml.client import Client
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+_query_plan_collector: Optional[QueryPlanCollector] = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def explain_queries(
+    request: pytest.FixtureRequest,
+) -> Generator[None, None, None]:
+    """Captures the query plans of the store tests if requested."""
+    global _query_plan_collector
+
+    if not request.config.getoption("explain_queries", False):
+        yield
+        return
+
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore):
+        warnings.warn(
+            "Query plans can only be captured when the tests use a SQL "
+            "store directly."
+        )
+        yield
+        return
+
+    with QueryPlanCollector(store.engine) as collector:
+        _query_plan_collector = collector
+        yield
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    """Prints the full table scans found while running the store tests."""
+    if _query_plan_collector is None:
+        return
+
+    terminalreporter.section("full table scans")
+    terminalreporter.write_line(_query_plan_collector.report())
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 
 import time
+import uuid
 from contextlib import ExitStack as does_not_raise
 from datetime import timedelta
 
@@ -78,6 +79,26 @@ def test_list_secret_excludes_values():
         assert len(all_secrets[0].values) == 0
 
 
+def test_get_secrets_batch_returns_values():
+    """Tests that `get_secrets_batch` returns the values of all secrets."""
+    client = Client()
+    store = client.zen_store
+
+    with SecretContext(values=dict(aria="space cat")) as secret_1:
+        with SecretContext(values=dict(axl="space dog")) as secret_2:
+            secrets = store.get_secrets_batch(
+                secret_ids=[secret_2.id, uuid.uuid4(), secret_1.id]
+            )
+            assert [secret.id for secret in secrets] == [
+                secret_2.id,
+                secret_1.id,
+            ]
+            assert secrets[0].secret_values == dict(axl="space dog")
+            assert secrets[1].secret_values == dict(aria="space cat")
+
+    assert store.get_secrets_batch(secret_ids=[]) == []
+
+
 def test_secret_empty_values():
     """Tests that secrets can hold empty values."""
     client = Client()
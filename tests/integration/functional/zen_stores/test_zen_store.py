@@ -35,6 +35,7 @@ from tests.integration.functional.zen_stores.utils import (
     LoginContext,
     ModelContext,
     PipelineRunContext,
+    QueryCounter,
     SecretContext,
     ServiceAccountContext,
     ServiceConnectorContext,
@@ -46,6 +47,7 @@ from tests.integration.functional.zen_stores.utils import (
 from tests.unit.pipelines.test_build_utils import (
     StubLocalRepositoryContext,
 )
+from zenml import pipeline, step
 from zenml.artifacts.utils import (
     _load_artifact_store,
 )
@@ -2845,6 +2847,90 @@ def test_list_runs_is_ordered():
         )
 
 
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_list_runs_query_count_does_not_scale_with_runs(hydrate):
+    """Tests that listing runs doesn't issue additional queries per run."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    with PipelineRunContext(3) as runs:
+        with QueryCounter(store.engine) as single_run_counter:
+            page = store.list_runs(
+                PipelineRunFilter(name=runs[0].name), hydrate=hydrate
+            )
+            assert page.total == 1
+
+        run_name_prefix = runs[0].name.rsplit("_", 1)[0]
+        with QueryCounter(store.engine) as multiple_runs_counter:
+            page = store.list_runs(
+                PipelineRunFilter(name=f"startswith:{run_name_prefix}"),
+                hydrate=hydrate,
+            )
+            assert page.total == 3
+
+        assert multiple_runs_counter.count == single_run_counter.count
+
+
+@step
+def query_count_source_step() -> int:
+    return 1
+
+
+@step
+def query_count_plus_one_step(value: int) -> int:
+    return value + 1
+
+
+@pipeline(enable_cache=False)
+def query_count_pipeline(num_steps: int):
+    value = query_count_source_step()
+    for _ in range(num_steps - 1):
+        value = query_count_plus_one_step(value)
+
+
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_run_query_count_does_not_scale_with_steps(hydrate):
+    """Tests that fetching runs doesn't issue additional queries per step."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    run_name_prefix = sample_name("query_count_run_")
+    runs = []
+    list_query_counts = []
+    get_query_counts = []
+    try:
+        # Both runs contain steps with and without inputs, so the same
+        # relationships get loaded for them
+        for num_steps in [2, 5]:
+            run = query_count_pipeline.with_options(
+                run_name=f"{run_name_prefix}_{num_steps}",
+                unlisted=True,
+            )(num_steps=num_steps)
+            runs.append(run)
+            assert len(run.steps) == num_steps
+
+            with QueryCounter(store.engine) as list_counter:
+                page = store.list_runs(
+                    PipelineRunFilter(name=run.name), hydrate=hydrate
+                )
+                assert page.total == 1
+            list_query_counts.append(list_counter.count)
+
+            with QueryCounter(store.engine) as get_counter:
+                store.get_run(run.id, hydrate=hydrate)
+            get_query_counts.append(get_counter.count)
+    finally:
+        for run in runs:
+            client.delete_pipeline_run(run.id)
+
+    assert list_query_counts[0] == list_query_counts[1]
+    assert get_query_counts[0] == get_query_counts[1]
+
+
 def test_count_runs():
     """Tests that the count runs command returns the correct amount."""
     client = Client()
@@ -4062,6 +4148,72 @@ def test_connector_validation():
             pass
 
 
+def test_connector_resources_discovery_timeout():
+    """Tests that slow connectors don't block the resource discovery."""
+    client = Client()
+    store = client.zen_store
+
+    if store.type != StoreType.SQL:
+        pytest.skip("Only applicable to SQL store")
+
+    connector_type = sample_name("cat'o'matic")
+    get_resources = SqlZenStore._get_service_connector_resources
+
+    with ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="aria",
+    ) as slow_connector, ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="blupus",
+    ) as fast_connector:
+
+        def _get_resources(self, connector, *args, **kwargs):
+            if connector.id == slow_connector.id:
+                time.sleep(3)
+            return get_resources(self, connector, *args, **kwargs)
+
+        with patch.object(
+            SqlZenStore, "_get_service_connector_resources", _get_resources
+        ), patch(
+            "zenml.zen_stores.sql_zen_store."
+            "SERVICE_CONNECTOR_RESOURCES_TIMEOUT",
+            0.5,
+        ):
+            streamed = list(
+                store.iter_service_connector_resources(
+                    workspace_name_or_id=client.active_workspace.id,
+                    connector_type=connector_type,
+                )
+            )
+            resources = store.list_service_connector_resources(
+                workspace_name_or_id=client.active_workspace.id,
+                connector_type=connector_type,
+            )
+
+        # The fast connector is returned first when streaming, but the
+        # listed resources keep the order of the connectors
+        assert [r.id for r in streamed] == [
+            fast_connector.id,
+            slow_connector.id,
+        ]
+        assert {r.id for r in resources} == {
+            fast_connector.id,
+            slow_connector.id,
+        }
+        for connector_resources in streamed + resources:
+            if connector_resources.id == slow_connector.id:
+                assert "Timed out" in connector_resources.error
+            else:
+                assert connector_resources.error is None
+                assert connector_resources.resources[0].resource_ids == [
+                    "blupus"
+                ]
+
+
 #################
 # Models
 #################
@@ -4769,6 +4921,58 @@ class TestModelVersionArtifactLinks:
 
             assert link1.id == link2.id
 
+    def test_link_create_batch(self):
+        """Assert that multiple links can be created at once and that existing
+        links are reused."""
+        with ModelContext(True, create_artifacts=3) as (
+            model_version,
+            artifacts,
+        ):
+            zs = Client().zen_store
+            requests = [
+                ModelVersionArtifactRequest(
+                    user=model_version.user.id,
+                    workspace=model_version.workspace.id,
+                    model=model_version.model.id,
+                    model_version=model_version.id,
+                    artifact_version=artifact.id,
+                )
+                for artifact in artifacts
+            ]
+            existing_link = zs.create_model_version_artifact_link(requests[1])
+
+            links = zs.create_model_version_artifact_links(requests)
+            assert [link.artifact_version.id for link in links] == [
+                artifact.id for artifact in artifacts
+            ]
+            assert links[1].id == existing_link.id
+
+            assert [
+                link.id
+                for link in zs.create_model_version_artifact_links(requests)
+            ] == [link.id for link in links]
+            assert zs.create_model_version_artifact_links([]) == []
+
+    def test_link_create_batch_outside_of_workspace_fails(self):
+        """Assert that the batch endpoint checks the workspace of links."""
+        zs = Client().zen_store
+        if not isinstance(zs, RestZenStore):
+            pytest.skip("Workspace checks only happen in the server.")
+
+        with ModelContext(True, create_artifacts=1) as (
+            model_version,
+            artifacts,
+        ):
+            request = ModelVersionArtifactRequest(
+                user=model_version.user.id,
+                workspace=uuid4(),
+                model=model_version.model.id,
+                model_version=model_version.id,
+                artifact_version=artifacts[0].id,
+            )
+            with pytest.raises(IllegalOperationError):
+                zs.create_model_version_artifact_links([request])
+
     def test_link_create_single_version_of_same_output_name_from_different_steps(
         self,
     ):
@@ -5473,6 +5677,79 @@ class TestRunMetadata:
 
         client.zen_store.delete_stack_component(sc.id)
 
+    def test_create_run_metadata_batch(self):
+        """Tests creating run metadata for multiple resources at once."""
+        client = Client()
+        sc = client.zen_store.create_stack_component(
+            ComponentRequest(
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+                name=sample_name("foo"),
+                type=StackComponentType.ORCHESTRATOR,
+                flavor="local",
+                configuration={},
+            )
+        )
+        with ModelContext(create_version=True) as model_version:
+            rms = client.zen_store.create_run_metadata_batch(
+                [
+                    RunMetadataRequest(
+                        user=client.active_user.id,
+                        workspace=client.active_workspace.id,
+                        resource_id=model_version.id,
+                        resource_type=MetadataResourceTypes.MODEL_VERSION,
+                        values={"foo": "bar", "count": 1},
+                        types={
+                            "foo": MetadataTypeEnum.STRING,
+                            "count": MetadataTypeEnum.INT,
+                        },
+                        stack_component_id=None,
+                    ),
+                    RunMetadataRequest(
+                        user=client.active_user.id,
+                        workspace=client.active_workspace.id,
+                        resource_id=model_version.id,
+                        resource_type=MetadataResourceTypes.MODEL_VERSION,
+                        values={"baz": 2.0},
+                        types={"baz": MetadataTypeEnum.FLOAT},
+                        stack_component_id=sc.id,
+                    ),
+                ]
+            )
+            assert {rm.key: rm.value for rm in rms} == {
+                "foo": "bar",
+                "count": 1,
+                "baz": 2.0,
+            }
+            for rm in rms:
+                assert client.zen_store.get_run_metadata(rm.id).key == rm.key
+
+            assert client.zen_store.create_run_metadata_batch([]) == []
+
+        client.zen_store.delete_stack_component(sc.id)
+
+    def test_create_run_metadata_batch_outside_of_workspace_fails(self):
+        """Tests that the batch endpoint checks the workspace of metadata."""
+        client = Client()
+        if not isinstance(client.zen_store, RestZenStore):
+            pytest.skip("Workspace checks only happen in the server.")
+
+        with ModelContext(create_version=True) as model_version:
+            with pytest.raises(IllegalOperationError):
+                client.zen_store.create_run_metadata_batch(
+                    [
+                        RunMetadataRequest(
+                            user=client.active_user.id,
+                            workspace=uuid4(),
+                            resource_id=model_version.id,
+                            resource_type=MetadataResourceTypes.MODEL_VERSION,
+                            values={"foo": "bar"},
+                            types={"foo": MetadataTypeEnum.STRING},
+                            stack_component_id=None,
+                        )
+                    ]
+                )
+
 
 @pytest.mark.parametrize(
     "step_status, expected_run_status",
@@ -5493,3 +5770,56 @@ def test_updating_the_pipeline_run_status(step_status, expected_run_status):
         )
         run_status = Client().get_pipeline_run(run_context.runs[-1].id).status
         assert run_status == expected_run_status
+
+
+def test_connector_resources_discovery_timeout_covers_queued_connectors():
+    """Tests that the discovery timeout also bounds queued connectors."""
+    client = Client()
+    store = client.zen_store
+
+    if store.type != StoreType.SQL:
+        pytest.skip("Only applicable to SQL store")
+
+    connector_type = sample_name("cat'o'matic")
+
+    def _get_resources(self, connector, *args, **kwargs):
+        time.sleep(3)
+
+    with ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="aria",
+    ) as first_connector, ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="blupus",
+    ) as second_connector:
+        with patch.object(
+            SqlZenStore, "_get_service_connector_resources", _get_resources
+        ), patch(
+            "zenml.zen_stores.sql_zen_store."
+            "SERVICE_CONNECTOR_RESOURCES_TIMEOUT",
+            0.5,
+        ), patch(
+            "zenml.zen_stores.sql_zen_store."
+            "SERVICE_CONNECTOR_RESOURCES_WORKERS",
+            1,
+        ):
+            start_time = time.monotonic()
+            resources = store.list_service_connector_resources(
+                workspace_name_or_id=client.active_workspace.id,
+                connector_type=connector_type,
+            )
+            duration = time.monotonic() - start_time
+
+        # The second connector is queued behind the first one, but the
+        # discovery still stops after the timeout
+        assert duration < 2
+        assert {r.id for r in resources} == {
+            first_connector.id,
+            second_connector.id,
+        }
+        for connector_resources in resources:
+            assert "Timed out" in connector_resources.error
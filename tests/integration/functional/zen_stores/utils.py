@@ -11,6 +11,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import logging
+import re
 import uuid
 from copy import deepcopy
 from datetime import datetime
@@ -20,6 +21,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -27,6 +29,8 @@ from typing import (
 )
 
 from pydantic import BaseModel, Field, SecretStr
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from typing_extensions import Annotated
 
 from tests.integration.functional.utils import sample_name
@@ -202,6 +206,118 @@ class PipelineRunContext:
                 pass
 
 
+class QueryCounter:
+    """Context manager that counts the SQL queries executed by an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.count = 0
+        self.statements: List[str] = []
+
+    def _on_execute(self, conn, cursor, statement, *args, **kwargs) -> None:
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class QueryPlanCollector:
+    """Captures the query plans of the SQL queries executed by an engine.
+
+    Every distinct SELECT, UPDATE or DELETE statement is explained on the
+    connection it was executed on, and statements whose plan contains a full
+    table scan are collected per table. Supports SQLite and MySQL.
+    """
+
+    _SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?!.*\bUSING\b)")
+    _IN_CLAUSE = re.compile(r"IN \((?:\?|%s)(?:, (?:\?|%s))*\)")
+    _EXPLAINED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.full_scans: Dict[str, Set[str]] = {}
+        self._explained: Set[str] = set()
+
+    def _get_full_scans(
+        self, cursor: Any, statement: str, parameters: Any
+    ) -> List[str]:
+        """Returns the tables that a statement scans completely."""
+        dialect = self.engine.dialect.name
+        if dialect not in ("sqlite", "mysql"):
+            return []
+
+        tables = []
+        explain_cursor = cursor.connection.cursor()
+        try:
+            if dialect == "sqlite":
+                explain_cursor.execute(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+                for row in explain_cursor.fetchall():
+                    if match := self._SQLITE_FULL_SCAN.match(row[-1]):
+                        tables.append(match.group(1))
+            else:
+                explain_cursor.execute(f"EXPLAIN {statement}", parameters)
+                columns = [column[0] for column in explain_cursor.description]
+                for row in explain_cursor.fetchall():
+                    plan = dict(zip(columns, row))
+                    if plan.get("type") == "ALL" and plan.get("table"):
+                        tables.append(plan["table"])
+        finally:
+            explain_cursor.close()
+
+        return tables
+
+    def _on_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if executemany or not statement.lstrip().upper().startswith(
+            self._EXPLAINED_STATEMENTS
+        ):
+            return
+
+        # Statements that only differ in the number of IN parameters share
+        # the same query plan
+        normalized_statement = self._IN_CLAUSE.sub("IN (...)", statement)
+        if normalized_statement in self._explained:
+            return
+
+        self._explained.add(normalized_statement)
+        try:
+            tables = self._get_full_scans(cursor, statement, parameters)
+        except Exception as e:
+            logging.debug(f"Failed to explain statement {statement}: {e}")
+            return
+
+        for table in tables:
+            self.full_scans.setdefault(table, set()).add(normalized_statement)
+
+    def report(self) -> str:
+        """Summarizes the full table scans per table."""
+        lines = [
+            f"Explained {len(self._explained)} distinct statements, "
+            f"{sum(len(s) for s in self.full_scans.values())} of which "
+            "contain full table scans."
+        ]
+        for table, statements in sorted(self.full_scans.items()):
+            lines.append(f"\n{table}: {len(statements)} statement(s)")
+            for statement in sorted(statements):
+                lines.append("    " + " ".join(statement.split()))
+        return "\n".join(lines)
+
+    def __enter__(self) -> "QueryPlanCollector":
+        event.listen(self.engine, "after_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        event.remove(self.engine, "after_cursor_execute", self._on_execute)
+
+
 class UserContext:
     def __init__(
         self,
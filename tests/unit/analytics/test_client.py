@@ -0,0 +1,114 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from uuid import uuid4
+
+from zenml.analytics import source_context
+from zenml.analytics.client import Client
+from zenml.analytics.enums import AnalyticsEvent
+from zenml.enums import SourceContextTypes
+
+
+def test_client_uploads_messages_in_batches(mocker):
+    """Tests that tracked events are uploaded in the background in batches."""
+    mock_post = mocker.patch("zenml.analytics.request.post")
+    client = Client(upload_interval=0.2)
+
+    user_id = uuid4()
+    for _ in range(3):
+        success, _ = client.track(
+            user_id=user_id, event=AnalyticsEvent.RUN_PIPELINE, properties={}
+        )
+        assert success
+
+    client.shutdown()
+
+    mock_post.assert_called_once()
+    assert len(mock_post.call_args.kwargs["batch"]) == 3
+    assert mock_post.call_args.kwargs["source"] == SourceContextTypes.PYTHON
+
+
+def test_client_uploads_messages_per_source_context(mocker):
+    """Tests that the source context of each message is preserved."""
+    mock_post = mocker.patch("zenml.analytics.request.post")
+    client = Client(upload_interval=0.2)
+
+    client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    token = source_context.set(SourceContextTypes.CLI)
+    try:
+        client.track(
+            user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+        )
+    finally:
+        source_context.reset(token)
+
+    client.shutdown()
+
+    sources = {call.kwargs["source"] for call in mock_post.call_args_list}
+    assert sources == {SourceContextTypes.PYTHON, SourceContextTypes.CLI}
+
+
+def test_client_drops_messages_if_queue_is_full(mocker):
+    """Tests that messages are dropped instead of blocking the caller."""
+    mocker.patch.object(Client, "_ensure_consumer")
+    client = Client(max_queue_size=1)
+
+    success, _ = client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert success
+
+    success, _ = client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert not success
+
+
+def test_failed_uploads_do_not_block_the_queue(mocker):
+    """Tests that upload errors are swallowed by the consumer."""
+    mocker.patch("zenml.analytics.request.post", side_effect=RuntimeError)
+    client = Client(upload_interval=0.1)
+
+    client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    client.flush(timeout=5)
+
+    assert client.queue.unfinished_tasks == 0
+    client.shutdown()
+
+
+def test_shutdown_does_not_wait_for_unreachable_server(mocker):
+    """Tests that shutting down only waits shortly for pending uploads."""
+    upload_started = threading.Event()
+
+    def _slow_post(**kwargs):
+        upload_started.set()
+        time.sleep(5)
+
+    mocker.patch("zenml.analytics.request.post", side_effect=_slow_post)
+    client = Client(upload_interval=0.1, shutdown_timeout=0.2)
+
+    client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert upload_started.wait(timeout=5)
+
+    start_time = time.monotonic()
+    client.shutdown()
+    assert time.monotonic() - start_time < 2
@@ -593,3 +593,79 @@ def test_stack_component_shortcut_keys(
             stack=local_stack,
             run_configuration=PipelineRunConfiguration(),
         )
+
+
+def test_compilation_cache(local_stack, mocker):
+    """Tests that compiling an unchanged pipeline uses the cache."""
+
+    @pipeline
+    def p(step_1, step_2):
+        step_2(step_1())
+
+    pipeline_instance = p(step_1=s1(), step_2=s2())
+    with pipeline_instance:
+        pipeline_instance.entrypoint()
+
+    compile_step_spy = mocker.spy(Compiler, "_compile_step_invocation")
+
+    deployment = Compiler().compile(
+        pipeline=pipeline_instance,
+        stack=local_stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+    assert compile_step_spy.call_count == 2
+
+    cached_deployment = Compiler().compile(
+        pipeline=pipeline_instance,
+        stack=local_stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+    assert compile_step_spy.call_count == 2
+    assert cached_deployment == deployment
+    assert cached_deployment is not deployment
+
+    Compiler().compile(
+        pipeline=pipeline_instance,
+        stack=local_stack,
+        run_configuration=PipelineRunConfiguration(
+            steps={"step_1": {"enable_cache": False}}
+        ),
+    )
+    assert compile_step_spy.call_count == 4
+
+    # Changing the code of the pipeline function invalidates the cache
+    mocker.patch.object(
+        type(pipeline_instance),
+        "source_code",
+        new_callable=mocker.PropertyMock,
+        return_value="def p(step_1, step_2): ...",
+    )
+    Compiler().compile(
+        pipeline=pipeline_instance,
+        stack=local_stack,
+        run_configuration=PipelineRunConfiguration(),
+    )
+    assert compile_step_spy.call_count == 6
+
+
+def test_compilation_cache_can_be_disabled(local_stack, mocker, monkeypatch):
+    """Tests that the compilation cache can be disabled."""
+    monkeypatch.setenv("ZENML_DISABLE_COMPILATION_CACHE", "true")
+
+    @pipeline
+    def p(step_1):
+        step_1()
+
+    pipeline_instance = p(step_1=s1())
+    with pipeline_instance:
+        pipeline_instance.entrypoint()
+
+    compile_step_spy = mocker.spy(Compiler, "_compile_step_invocation")
+    for _ in range(2):
+        Compiler().compile(
+            pipeline=pipeline_instance,
+            stack=local_stack,
+            run_configuration=PipelineRunConfiguration(),
+        )
+
+    assert compile_step_spy.call_count == 2
@@ -0,0 +1,45 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+
+from zenml.config.pipeline_spec import PipelineSpec
+from zenml.config.step_configurations import StepSpec
+
+
+def test_pipeline_spec_json_ignores_reused_upstream_steps():
+    """Tests that reused upstream steps don't change the JSON that is used to
+    compute the pipeline version hash."""
+    step_spec = StepSpec(
+        source="zenml.integrations.airflow.AirflowIntegration",
+        upstream_steps=["step_1"],
+        pipeline_parameter_name="step_2",
+    )
+    spec = PipelineSpec(steps=[step_spec])
+    resumed_spec = PipelineSpec(
+        steps=[
+            step_spec.model_copy(update={"reused_upstream_steps": ["step_0"]})
+        ]
+    )
+
+    assert (
+        spec.json_with_string_sources == resumed_spec.json_with_string_sources
+    )
+    step_dict = json.loads(spec.json_with_string_sources)["steps"][0]
+    assert set(step_dict) == {
+        "source",
+        "upstream_steps",
+        "inputs",
+        "pipeline_parameter_name",
+    }
@@ -0,0 +1,190 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from typing import Optional
+from unittest.mock import MagicMock, PropertyMock
+from uuid import uuid4
+
+import pytest
+
+from zenml.config.server_config import ServerConfiguration
+from zenml.event_hub.event_hub import InternalEventHub
+from zenml.event_sources.base_event import BaseEvent
+from zenml.event_sources.base_event_source import (
+    BaseEventSourceFlavor,
+    EventFilterConfig,
+)
+
+
+class StubEvent(BaseEvent):
+    """Stub event."""
+
+    branch: str
+
+
+class StubEventFilterConfig(EventFilterConfig):
+    """Stub event filter."""
+
+    branch: Optional[str] = None
+
+    def event_matches_filter(self, event: BaseEvent) -> bool:
+        assert isinstance(event, StubEvent)
+        return self.branch is None or self.branch == event.branch
+
+
+class StubEventSourceFlavor(BaseEventSourceFlavor):
+    """Stub event source flavor."""
+
+    EVENT_FILTER_CONFIG_CLASS = StubEventFilterConfig
+
+
+def _create_trigger(event_source, branch: Optional[str]) -> MagicMock:
+    """Creates a mock trigger for an event source."""
+    return MagicMock(
+        id=uuid4(),
+        is_active=True,
+        event_filter={"branch": branch} if branch else None,
+        event_source=event_source,
+    )
+
+
+@pytest.fixture
+def event_source() -> MagicMock:
+    """Fixture for a mock event source."""
+    return MagicMock(id=uuid4(), flavor="stub", plugin_subtype="webhook")
+
+
+@pytest.fixture
+def event_hub(mocker) -> InternalEventHub:
+    """Fixture for an event hub that uses a mock store."""
+    mocker.patch(
+        "zenml.event_hub.event_hub.server_config",
+        return_value=ServerConfiguration(),
+    )
+    mocker.patch(
+        "zenml.event_hub.event_hub.plugin_flavor_registry",
+        return_value=MagicMock(
+            get_flavor_class=MagicMock(return_value=StubEventSourceFlavor)
+        ),
+    )
+    mocker.patch.object(
+        InternalEventHub,
+        "zen_store",
+        new_callable=PropertyMock,
+        return_value=MagicMock(),
+    )
+    return InternalEventHub()
+
+
+def test_trigger_index_is_reused_for_subsequent_events(
+    mocker, event_hub, event_source
+):
+    """Tests that the triggers of an event source are only listed once."""
+    main_trigger = _create_trigger(event_source, branch="main")
+    dev_trigger = _create_trigger(event_source, branch="dev")
+    triggers = {t.id: t for t in [main_trigger, dev_trigger]}
+    mock_depaginate = mocker.patch(
+        "zenml.event_hub.event_hub.depaginate",
+        return_value=list(triggers.values()),
+    )
+    event_hub.zen_store.get_trigger.side_effect = lambda trigger_id, hydrate: (
+        triggers[trigger_id]
+    )
+
+    for _ in range(3):
+        matching = event_hub.get_matching_active_triggers_for_event(
+            event=StubEvent(branch="main"), event_source=event_source
+        )
+        assert matching == [main_trigger]
+
+    assert mock_depaginate.call_count == 1
+    # Only the matching trigger is fetched from the store
+    assert event_hub.zen_store.get_trigger.call_count == 3
+
+
+def test_deactivating_trigger_invalidates_trigger_index(
+    mocker, event_hub, event_source
+):
+    """Tests that deactivating a trigger invalidates the cached triggers."""
+    trigger = _create_trigger(event_source, branch=None)
+    mock_depaginate = mocker.patch(
+        "zenml.event_hub.event_hub.depaginate", return_value=[trigger]
+    )
+    event_hub.zen_store.get_trigger.return_value = trigger
+
+    event = StubEvent(branch="main")
+    assert event_hub.get_matching_active_triggers_for_event(
+        event=event, event_source=event_source
+    ) == [trigger]
+
+    mock_depaginate.return_value = []
+    event_hub.deactivate_trigger(trigger)
+
+    assert (
+        event_hub.get_matching_active_triggers_for_event(
+            event=event, event_source=event_source
+        )
+        == []
+    )
+    assert mock_depaginate.call_count == 2
+
+
+def test_trigger_index_entry_is_not_stored_if_invalidated_while_compiling(
+    mocker, event_hub, event_source
+):
+    """Tests that an invalidation during compilation isn't overwritten."""
+    trigger = _create_trigger(event_source, branch=None)
+
+    def _list_triggers_and_invalidate(*args, **kwargs):
+        # Simulates a trigger being deactivated while the entry is compiled
+        event_hub.deactivate_trigger(trigger)
+        return [trigger]
+
+    mock_depaginate = mocker.patch(
+        "zenml.event_hub.event_hub.depaginate",
+        side_effect=_list_triggers_and_invalidate,
+    )
+    event_hub.zen_store.get_trigger.return_value = trigger
+
+    event = StubEvent(branch="main")
+    for _ in range(2):
+        event_hub.get_matching_active_triggers_for_event(
+            event=event, event_source=event_source
+        )
+
+    assert mock_depaginate.call_count == 2
+
+
+def test_errors_of_dispatched_actions_are_logged(
+    mocker, event_hub, event_source
+):
+    """Tests that errors raised while executing an action in a worker thread
+    are logged."""
+    mock_logger = mocker.patch("zenml.event_hub.event_hub.logger")
+    mocker.patch.object(
+        InternalEventHub,
+        "trigger_action",
+        side_effect=RuntimeError("Failed to load the action"),
+    )
+    trigger = _create_trigger(event_source, branch=None)
+
+    event_hub._dispatch_action(
+        event=StubEvent(branch="main"),
+        event_source=event_source,
+        trigger=trigger,
+        action_callback=MagicMock(),
+    )
+    event_hub._executor.shutdown(wait=True)
+
+    mock_logger.error.assert_called_once()
+    assert str(trigger.id) in mock_logger.error.call_args.args[0]
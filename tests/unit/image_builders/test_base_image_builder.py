@@ -31,3 +31,22 @@ def test_upload_build_context() -> None:
         parent_path_directory_name="pytest-contexts",
     )
     assert fileio.exists(filepath)
+
+
+def test_upload_build_context_skips_existing_context(mocker) -> None:
+    """Test that a build context with the same content is not uploaded
+    twice."""
+    filepath = BaseImageBuilder._upload_build_context(
+        build_context=_get_build_context(),
+        parent_path_directory_name="pytest-contexts",
+    )
+
+    mock_write_archive = mocker.patch.object(BuildContext, "write_archive")
+    assert (
+        BaseImageBuilder._upload_build_context(
+            build_context=_get_build_context(),
+            parent_path_directory_name="pytest-contexts",
+        )
+        == filepath
+    )
+    mock_write_archive.assert_not_called()
@@ -82,3 +82,27 @@ def test_build_context_includes_and_excludes(tmp_path):
         ".zen": str(root / ".zen"),
         os.path.join(".zen", "config.yaml"): str(zen_repo),
     }
+
+
+def test_build_context_checksum(tmp_path):
+    """Tests that the build context checksum only depends on the content of
+    the build context."""
+    root = tmp_path / "root"
+    root.mkdir()
+    file = root / "file"
+    file.write_text("file content")
+
+    checksum = BuildContext(root=str(root)).compute_checksum()
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+
+    # Touching a file without modifying it doesn't change the checksum
+    os.utime(file, ns=(0, 0))
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+
+    file.write_text("new file content")
+    new_checksum = BuildContext(root=str(root)).compute_checksum()
+    assert new_checksum != checksum
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("extra file content", destination="extra")
+    assert build_context.compute_checksum() != new_checksum
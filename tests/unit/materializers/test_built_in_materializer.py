@@ -230,3 +230,54 @@ def test_container_materializer_for_custom_types(
         assert result[0].myname == "aria"
         assert result[1].myname == "axl"
         assert result == example
+
+
+def test_container_materializer_packs_elements(clean_client: "Client"):
+    """Test that elements with packable materializers share a data file."""
+    example = [b"0", 1, None, CustomType(), b"1" * 1000]
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        # Only the element with a custom materializer gets a subdirectory
+        assert sorted(os.listdir(artifact_uri)) == [
+            "3",
+            "data.bin",
+            "metadata.json",
+        ]
+        assert materializer.load(list) == example
+
+
+def test_container_materializer_loads_directory_format(
+    clean_client: "Client",
+):
+    """Test that containers saved with one directory per element load."""
+    from zenml.materializers.built_in_materializer import BytesMaterializer
+    from zenml.utils import source_utils, yaml_utils
+
+    example = [b"0", b"1"]
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        metadata = []
+        for i, element in enumerate(example):
+            element_path = os.path.join(artifact_uri, str(i))
+            os.mkdir(element_path)
+            BytesMaterializer(uri=element_path).save(element)
+            metadata.append(
+                {
+                    "path": element_path,
+                    "type": source_utils.resolve(bytes).import_path,
+                    "materializer": source_utils.resolve(
+                        BytesMaterializer
+                    ).import_path,
+                }
+            )
+        yaml_utils.write_json(
+            os.path.join(artifact_uri, "metadata.json"), metadata
+        )
+
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        assert materializer.load(tuple) == tuple(example)
@@ -16,12 +16,20 @@ from contextlib import ExitStack as does_not_raise
 from uuid import uuid4
 
 import pytest
+import requests
+from sqlmodel import Session, select
 
-from zenml.enums import StackComponentType
+from zenml import pipeline, step
+from zenml.enums import ExecutionStatus, StackComponentType, StoreType
+from zenml.exceptions import InputResolutionError
+from zenml.logging import step_logging
+from zenml.orchestrators import cache_utils, input_utils
 from zenml.orchestrators.step_launcher import (
+    StepLauncher,
     _get_step_operator,
 )
 from zenml.stack import Stack
+from zenml.zen_stores.schemas import StepRunSchema
 
 
 def test_step_operator_validation(local_stack, sample_step_operator):
@@ -49,3 +57,253 @@ def test_step_operator_validation(local_stack, sample_step_operator):
             stack=stack_with_step_operator,
             step_operator_name=sample_step_operator.name,
         )
+
+
+@step
+def producer() -> int:
+    return 1
+
+
+@step
+def consumer(value: int) -> int:
+    return value
+
+
+@pipeline
+def producer_consumer_pipeline():
+    consumer(producer())
+
+
+def test_step_launcher_begins_step_runs_in_single_request(
+    clean_client, mocker
+):
+    """Tests that the launcher resolves inputs and the cache on the server
+    and computes the same cache key as when preparing steps on the client."""
+    begin_spy = mocker.spy(type(clean_client.zen_store), "begin_run_step")
+    resolve_inputs_spy = mocker.spy(input_utils, "resolve_step_inputs")
+
+    producer_consumer_pipeline()
+    producer_consumer_pipeline()
+
+    assert begin_spy.call_count == 4
+    resolve_inputs_spy.assert_not_called()
+
+    first_run, second_run = clean_client.list_pipeline_runs(
+        sort_by="asc:created"
+    ).items
+    consumer_run = first_run.steps["consumer"]
+    assert consumer_run.status == ExecutionStatus.COMPLETED
+    assert (
+        consumer_run.inputs["value"].id
+        == first_run.steps["producer"].outputs["output"].id
+    )
+    assert consumer_run.parent_step_ids == [first_run.steps["producer"].id]
+
+    cache_key = cache_utils.generate_cache_key(
+        step=clean_client.get_deployment(
+            first_run.deployment_id
+        ).step_configurations["consumer"],
+        input_artifact_ids={"value": consumer_run.inputs["value"].id},
+        artifact_store=clean_client.active_stack.artifact_store,
+        workspace_id=clean_client.active_workspace.id,
+    )
+    assert consumer_run.cache_key == cache_key
+
+    cached_consumer_run = second_run.steps["consumer"]
+    assert cached_consumer_run.status == ExecutionStatus.CACHED
+    assert cached_consumer_run.original_step_run_id == consumer_run.id
+    assert (
+        cached_consumer_run.outputs["output"].id
+        == consumer_run.outputs["output"].id
+    )
+
+
+@pytest.mark.parametrize("single_request", [True, False])
+def test_cached_steps_skip_logs_storage(clean_client, mocker, single_request):
+    """Tests that cached steps don't prepare or register logs."""
+    mocker.patch.object(
+        StepLauncher,
+        "_can_begin_step_run_in_single_request",
+        return_value=single_request,
+    )
+    prepare_logs_spy = mocker.spy(step_logging, "prepare_logs_storage")
+
+    producer_consumer_pipeline()
+    assert prepare_logs_spy.call_count == 2
+
+    run = producer_consumer_pipeline()
+    assert prepare_logs_spy.call_count == 2
+    for step_run in run.steps.values():
+        assert step_run.status == ExecutionStatus.CACHED
+        assert step_run.logs is None
+
+
+def test_failed_step_preparation_is_stored_in_logs(clean_client, mocker):
+    """Tests that a failure while preparing a step is stored in its logs."""
+    mocker.patch.object(
+        StepLauncher,
+        "_can_begin_step_run_in_single_request",
+        return_value=False,
+    )
+    mocker.patch.object(
+        StepLauncher,
+        "_prepare",
+        side_effect=RuntimeError("Preparation failed"),
+    )
+
+    with pytest.raises(RuntimeError):
+        producer_consumer_pipeline()
+
+    run = clean_client.get_pipeline("producer_consumer_pipeline").last_run
+    step_run = run.steps["producer"]
+    assert step_run.status == ExecutionStatus.FAILED
+    assert step_run.logs is not None
+
+    logs = step_logging.fetch_logs(
+        zen_store=clean_client.zen_store,
+        artifact_store_id=step_run.logs.artifact_store_id,
+        logs_uri=step_run.logs.uri,
+    )
+    assert "Failed preparing run step producer." in logs
+    assert "Preparation failed" in logs
+
+
+def test_step_launcher_remembers_unsupported_step_run_begin(
+    clean_client, mocker
+):
+    """Tests that the launcher falls back to separate requests once the store
+    doesn't support beginning step runs and doesn't try again."""
+    begin_mock = mocker.patch.object(
+        type(clean_client.zen_store),
+        "begin_run_step",
+        side_effect=NotImplementedError,
+    )
+    create_step_run_spy = mocker.spy(
+        type(clean_client.zen_store), "create_run_step"
+    )
+
+    run = producer_consumer_pipeline()
+
+    assert begin_mock.call_count == 1
+    assert create_step_run_spy.call_count == 2
+    assert run.status == ExecutionStatus.COMPLETED
+
+
+def test_step_launcher_does_not_retry_failed_step_run_begin(
+    clean_client, mocker
+):
+    """Tests that the launcher doesn't create the step run again if the
+    response to beginning it might have been lost."""
+    mocker.patch.object(
+        type(clean_client.zen_store),
+        "begin_run_step",
+        side_effect=requests.ConnectionError("Connection lost"),
+    )
+    create_step_run_spy = mocker.spy(
+        type(clean_client.zen_store), "create_run_step"
+    )
+
+    with pytest.raises(requests.ConnectionError, match="Connection lost"):
+        producer_consumer_pipeline()
+
+    create_step_run_spy.assert_not_called()
+
+
+def test_step_launcher_records_rejected_step_run_begin(clean_client, mocker):
+    """Tests that the launcher records a failed step run if the store rejects
+    beginning a step of an existing pipeline run."""
+    store_class = type(clean_client.zen_store)
+    begin_run_step = store_class.begin_run_step
+
+    def _begin_run_step(store, request):
+        if request.step_run.name == "consumer":
+            raise InputResolutionError("Missing input")
+        return begin_run_step(store, request)
+
+    mocker.patch.object(
+        store_class,
+        "begin_run_step",
+        autospec=True,
+        side_effect=_begin_run_step,
+    )
+    mocker.patch.object(
+        input_utils,
+        "resolve_step_inputs",
+        side_effect=InputResolutionError("Missing input"),
+    )
+
+    with pytest.raises(InputResolutionError):
+        producer_consumer_pipeline()
+
+    run = clean_client.get_pipeline("producer_consumer_pipeline").last_run
+    assert run.status == ExecutionStatus.FAILED
+    assert run.steps["producer"].status == ExecutionStatus.COMPLETED
+    assert run.steps["consumer"].status == ExecutionStatus.FAILED
+
+
+@pytest.mark.parametrize("allow_first_run", [True, False])
+def test_step_run_begin_only_reuses_allowed_cached_step_runs(
+    clean_client, mocker, allow_first_run
+):
+    """Tests that beginning a step run only reuses cached step runs of
+    pipeline runs that the user is allowed to access."""
+    first_run = producer_consumer_pipeline()
+
+    # Transfer the step runs to another user, so they're not owned by the
+    # user running the pipeline anymore
+    other_user = clean_client.create_user(name="other_user")
+    with Session(clean_client.zen_store.engine) as session:
+        for step_run in session.exec(select(StepRunSchema)).all():
+            step_run.user_id = other_user.id
+            session.add(step_run)
+        session.commit()
+
+    allowed_pipeline_run_ids = {first_run.id} if allow_first_run else set()
+    begin_run_step = type(clean_client.zen_store).begin_run_step
+    mocker.patch.object(
+        type(clean_client.zen_store),
+        "begin_run_step",
+        autospec=True,
+        side_effect=lambda store, request: begin_run_step(
+            store,
+            request,
+            cache_allowed_pipeline_run_ids=allowed_pipeline_run_ids,
+        ),
+    )
+
+    second_run = producer_consumer_pipeline()
+    expected_status = (
+        ExecutionStatus.CACHED
+        if allow_first_run
+        else ExecutionStatus.COMPLETED
+    )
+    for step_run in second_run.steps.values():
+        assert step_run.status == expected_status
+
+
+def test_step_source_is_sent_to_servers_without_source_deduplication(
+    clean_client, mocker
+):
+    """Tests that the step source is sent with every step run to servers
+    that don't store it once per code hash."""
+    store_class = type(clean_client.zen_store)
+    mocker.patch.object(
+        store_class,
+        "type",
+        new_callable=mocker.PropertyMock,
+        return_value=StoreType.REST,
+    )
+    mocker.patch.object(
+        store_class, "begin_run_step", side_effect=NotImplementedError
+    )
+    create_step_run_spy = mocker.spy(store_class, "create_run_step")
+
+    producer_consumer_pipeline.with_options(enable_cache=False)()
+    producer_consumer_pipeline.with_options(enable_cache=False)()
+    # Cached step runs need the source as well
+    run = producer_consumer_pipeline()
+    assert run.steps["consumer"].status == ExecutionStatus.CACHED
+
+    assert create_step_run_spy.call_count == 6
+    for call in create_step_run_spy.call_args_list:
+        assert call.args[1].source_code is not None
@@ -12,11 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import pstats
 from uuid import uuid4
 
 import pytest
 
-from zenml import save_artifact
+from zenml import log_step_metadata, pipeline, save_artifact, step
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
@@ -24,7 +25,6 @@ from zenml.config.step_run_info import StepRunInfo
 from zenml.models import PipelineRunResponse, StepRunResponse
 from zenml.orchestrators.step_launcher import StepRunner
 from zenml.stack import Stack
-from zenml.steps import step
 
 
 @step
@@ -37,6 +37,12 @@ def failing_step() -> None:
     raise RuntimeError()
 
 
+@step
+def failing_step_with_metadata() -> None:
+    log_step_metadata(metadata={"key": "value"})
+    raise ValueError()
+
+
 def test_running_a_successful_step(
     mocker,
     local_stack,
@@ -150,6 +156,62 @@ def test_running_a_failing_step(
     mock_publish_successful_step_run.assert_not_called()
 
 
+def test_failing_to_publish_run_metadata_does_not_replace_step_exception(
+    mocker,
+    local_stack,
+    sample_pipeline_run: PipelineRunResponse,
+    sample_step_run: StepRunResponse,
+):
+    """Tests that failing to publish the buffered run metadata keeps the
+    exception of the step and still cleans up."""
+    mocker.patch.object(Stack, "prepare_step_run")
+    mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
+    mock_create_run_metadata_batch = mocker.patch(
+        "zenml.client.Client.create_run_metadata_batch",
+        side_effect=RuntimeError("Server unavailable"),
+    )
+    mock_publish_step_run_metadata = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_step_run_metadata"
+    )
+
+    step = Step.model_validate(
+        {
+            "spec": {
+                "source": "tests.unit.orchestrators.test_step_runner.failing_step_with_metadata",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    step_run_info = StepRunInfo(
+        step_run_id=uuid4(),
+        run_id=uuid4(),
+        run_name="run_name",
+        pipeline_step_name="step_name",
+        config=step.config,
+        pipeline=PipelineConfiguration(name="pipeline_name"),
+        force_write_logs=lambda: None,
+    )
+
+    runner = StepRunner(step=step, stack=local_stack)
+    with pytest.raises(ValueError):
+        runner.run(
+            pipeline_run=sample_pipeline_run,
+            step_run=sample_step_run,
+            step_run_info=step_run_info,
+            input_artifacts={},
+            output_artifact_uris={},
+        )
+
+    mock_create_run_metadata_batch.assert_called_once()
+    mock_publish_step_run_metadata.assert_called_once()
+    mock_cleanup_step_run.assert_called_with(
+        info=step_run_info, step_failed=True
+    )
+
+
 def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
     """Tests that having an input of type `UnmaterializedArtifact` does not
     materialize the artifact but instead returns the response model."""
@@ -174,3 +236,38 @@ def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact.model_dump() == artifact_response.model_dump()
+
+
+@step
+def profiled_producer() -> int:
+    return 1
+
+
+@step
+def profiled_consumer(value: int) -> int:
+    return value
+
+
+@pipeline
+def profiled_pipeline():
+    profiled_consumer(profiled_producer())
+
+
+def test_step_profiling(clean_client):
+    """Tests that profiled steps publish their timings as run metadata."""
+    run = profiled_pipeline.with_options(
+        settings={"profiling": {"enabled": True, "capture_cprofile": True}},
+        enable_cache=False,
+    )()
+    step_run = run.steps["profiled_consumer"]
+
+    profile = step_run.run_metadata["profiling"].value
+    assert profile["total_seconds"] > 0
+    assert {"input_loading", "step_function", "output_storing"} <= set(
+        profile["phases"]
+    )
+    assert profile["counters"]["bytes_read"] > 0
+    assert profile["counters"]["bytes_written"] > 0
+
+    stats_uri = step_run.run_metadata["profiling_cprofile_stats"].value
+    assert pstats.Stats(stats_uri).total_calls > 0
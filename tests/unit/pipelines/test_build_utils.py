@@ -12,6 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import sys
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from datetime import datetime
 from typing import Optional
@@ -302,6 +304,156 @@ def test_building_with_different_keys_and_identical_settings(mocker):
     mock_build_docker_image.assert_called_once()
 
 
+def test_building_distinct_images_in_parallel(mocker):
+    """Tests that distinct images are built in parallel and images with the
+    same parent image are only started after the first one of them."""
+    build_configs = [
+        BuildConfiguration(
+            key=f"key{i}",
+            settings=DockerSettings(
+                parent_image=parent_image, requirements=[f"requirement{i}"]
+            ),
+        )
+        for i, parent_image in enumerate(
+            ["parent_1", "parent_1", "parent_2", "parent_2"]
+        )
+    ]
+    mocker.patch.object(Stack, "get_docker_builds", return_value=build_configs)
+
+    events = []
+    lock = threading.Lock()
+
+    def _build_docker_image(docker_settings, tag, **kwargs):
+        with lock:
+            events.append(("start", docker_settings.parent_image, tag))
+        time.sleep(0.1)
+        with lock:
+            events.append(("end", docker_settings.parent_image, tag))
+        return f"{tag}_image", "", ""
+
+    mock_build_docker_image = mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        side_effect=_build_docker_image,
+    )
+
+    deployment = PipelineDeploymentBase(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
+        client_version="0.12.3",
+        server_version="0.12.3",
+    )
+
+    build = build_utils.create_pipeline_build(deployment=deployment)
+    assert mock_build_docker_image.call_count == 4
+    assert {key: item.image for key, item in build.images.items()} == {
+        f"key{i}": f"pipeline-key{i}_image" for i in range(4)
+    }
+
+    # The first builds of both parent images ran at the same time
+    assert [event[0] for event in events[:2]] == ["start", "start"]
+    for parent_image in ["parent_1", "parent_2"]:
+        parent_events = [e for e in events if e[1] == parent_image]
+        assert [event[0] for event in parent_events] == [
+            "start",
+            "end",
+            "start",
+            "end",
+        ]
+
+
+def test_building_reuses_existing_images(
+    mocker, remote_container_registry, sample_deployment_response_model
+):
+    """Tests that images of previous builds with the same settings checksum
+    are reused and only the missing images are built."""
+    unchanged_config = BuildConfiguration(
+        key="key1", settings=DockerSettings()
+    )
+    changed_config = BuildConfiguration(
+        key="key2", settings=DockerSettings(requirements=["requirement"])
+    )
+    mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[unchanged_config, changed_config],
+    )
+    mocker.patch.object(
+        Stack,
+        "container_registry",
+        new_callable=mocker.PropertyMock,
+        return_value=remote_container_registry,
+    )
+
+    existing_build = PipelineBuildResponse(
+        id=uuid4(),
+        body=PipelineBuildResponseBody(
+            created=datetime.now(),
+            updated=datetime.now(),
+            user=sample_deployment_response_model.user,
+        ),
+        metadata=PipelineBuildResponseMetadata(
+            workspace=sample_deployment_response_model.workspace,
+            images={
+                "key1": {
+                    "image": "existing_image",
+                    "contains_code": False,
+                    "requires_code_download": True,
+                    "settings_checksum": unchanged_config.compute_settings_checksum(
+                        stack=Client().active_stack
+                    ),
+                },
+                "key2": {
+                    "image": "outdated_image",
+                    "settings_checksum": "outdated_checksum",
+                },
+            },
+            is_local=False,
+            contains_code=False,
+        ),
+    )
+    mock_list_builds = mocker.patch(
+        "zenml.client.Client.list_builds",
+        return_value=Page(
+            index=1,
+            max_size=20,
+            total_pages=1,
+            total=1,
+            items=[existing_build],
+        ),
+    )
+    mock_build_docker_image = mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        return_value=("new_image", "", ""),
+    )
+
+    deployment = PipelineDeploymentBase(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
+        client_version="0.12.3",
+        server_version="0.12.3",
+    )
+
+    build = build_utils.create_pipeline_build(deployment=deployment)
+    mock_list_builds.assert_not_called()
+    assert mock_build_docker_image.call_count == 2
+
+    mock_build_docker_image.reset_mock()
+    build = build_utils.create_pipeline_build(
+        deployment=deployment, allow_image_reuse=True
+    )
+    mock_build_docker_image.assert_called_once()
+    assert (
+        mock_build_docker_image.call_args.kwargs["docker_settings"]
+        == changed_config.settings
+    )
+    assert build.images["key1"].image == "existing_image"
+    assert build.images["key2"].image == "new_image"
+
+
 def test_custom_build_verification(
     mocker,
     sample_deployment_response_model,
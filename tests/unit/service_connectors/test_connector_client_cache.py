@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from zenml.service_connectors.connector_client_cache import (
+    ConnectorClientCache,
+)
+
+
+class _ConnectorClient(BaseModel):
+    expires_at: Optional[datetime] = None
+    expires_skew_tolerance: Optional[int] = None
+
+
+def _expiring_in(seconds: int) -> _ConnectorClient:
+    return _ConnectorClient(
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=seconds),
+        expires_skew_tolerance=60,
+    )
+
+
+def test_connector_clients_are_reused_until_they_expire():
+    """Tests that clients are reused until their credentials expire."""
+    cache = ConnectorClientCache[_ConnectorClient]()
+    connector_id = uuid4()
+    updated = datetime.utcnow()
+
+    client = cache.get_or_create(
+        connector_id, updated, "s3-bucket", "bucket", lambda: _expiring_in(600)
+    )
+    assert (
+        cache.get_or_create(
+            connector_id,
+            updated,
+            "s3-bucket",
+            "bucket",
+            lambda: _expiring_in(600),
+        )
+        is client
+    )
+
+    # A different resource or an updated connector requires a new client
+    assert (
+        cache.get_or_create(
+            connector_id,
+            updated,
+            "s3-bucket",
+            "other-bucket",
+            lambda: _expiring_in(600),
+        )
+        is not client
+    )
+    assert (
+        cache.get_or_create(
+            connector_id,
+            datetime.utcnow(),
+            "s3-bucket",
+            "bucket",
+            lambda: _expiring_in(600),
+        )
+        is not client
+    )
+
+    # Clients expiring within the skew tolerance are not cached
+    expiring_client = cache.get_or_create(
+        connector_id,
+        updated,
+        "docker-registry",
+        None,
+        lambda: _expiring_in(30),
+    )
+    assert (
+        cache.get_or_create(
+            connector_id,
+            updated,
+            "docker-registry",
+            None,
+            lambda: _expiring_in(600),
+        )
+        is not expiring_client
+    )
+
+
+def test_concurrent_requests_create_a_single_connector_client():
+    """Tests that concurrent requests only create a client once."""
+    cache = ConnectorClientCache[_ConnectorClient]()
+    connector_id = uuid4()
+    calls = []
+
+    def _create() -> _ConnectorClient:
+        calls.append(1)
+        time.sleep(0.2)
+        return _ConnectorClient()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_create(
+                    connector_id, None, "kubernetes-cluster", "c", _create
+                )
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
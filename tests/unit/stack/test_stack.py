@@ -640,3 +640,36 @@ def test_docker_builds_collection(
     assert first_orchestrator_build in stack_builds
     assert second_orchestrator_build in stack_builds
     assert artifact_store_build in stack_builds
+
+
+def test_stack_instances_are_cached_until_a_component_is_updated(
+    clean_client,
+):
+    """Tests that stack instances are cached and invalidated on updates."""
+    orchestrator = clean_client.create_stack_component(
+        name="cached_orchestrator",
+        flavor="local",
+        component_type=StackComponentType.ORCHESTRATOR,
+        configuration={},
+    )
+    stack_model = clean_client.create_stack(
+        name="cached_stack",
+        components={
+            StackComponentType.ORCHESTRATOR: orchestrator.id,
+            StackComponentType.ARTIFACT_STORE: "default",
+        },
+    )
+    stack = Stack.from_model(stack_model)
+    assert Stack.from_model(stack_model) is stack
+
+    clean_client.update_stack_component(
+        name_id_or_prefix=stack.orchestrator.id,
+        component_type=StackComponentType.ORCHESTRATOR,
+        labels={"updated": "true"},
+    )
+
+    updated_stack = Stack.from_model(stack_model)
+    assert updated_stack is not stack
+    assert updated_stack.orchestrator.labels == {"updated": "true"}
+    # Components that were not updated are still served from the cache
+    assert updated_stack.artifact_store is stack.artifact_store
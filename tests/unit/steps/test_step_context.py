@@ -148,3 +148,42 @@ def test_step_context_returns_instance_of_custom_materializer_class(
         custom_materializer_class=BuiltInMaterializer
     )
     assert isinstance(materializer, BuiltInMaterializer)
+
+
+def test_step_context_buffers_run_metadata(
+    step_context_with_no_output, mocker
+):
+    """Tests that run metadata is buffered until the step context flushes it."""
+    from zenml.client import Client
+    from zenml.enums import MetadataResourceTypes
+
+    create_run_metadata = mocker.patch.object(Client, "create_run_metadata")
+    create_batch = mocker.patch.object(Client, "create_run_metadata_batch")
+
+    resource_id = step_context_with_no_output.step_run.id
+    step_context_with_no_output.add_run_metadata(
+        {"a": 1}, resource_id, MetadataResourceTypes.STEP_RUN
+    )
+    step_context_with_no_output.add_run_metadata(
+        {"b": 2}, resource_id, MetadataResourceTypes.STEP_RUN
+    )
+    create_batch.assert_not_called()
+
+    step_context_with_no_output._flush_run_metadata(close=True)
+    create_batch.assert_called_once_with(
+        [
+            (
+                {"a": 1, "b": 2},
+                resource_id,
+                MetadataResourceTypes.STEP_RUN,
+                None,
+            )
+        ]
+    )
+
+    # Metadata added after the flush is published right away
+    step_context_with_no_output.add_run_metadata(
+        {"c": 3}, resource_id, MetadataResourceTypes.STEP_RUN
+    )
+    create_run_metadata.assert_called_once()
+    assert create_batch.call_count == 1
@@ -0,0 +1,66 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.utils.cache_utils import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    """Tests that the least recently used entry is evicted when full."""
+    cache = LRUCache[str, int](maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+    assert cache.stats.size == 2
+
+
+def test_lru_cache_expires_entries(mocker):
+    """Tests that entries older than the TTL are treated as missing."""
+    mock_time = mocker.patch(
+        "zenml.utils.cache_utils.time.monotonic", return_value=0.0
+    )
+    cache = LRUCache[str, int](maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    mock_time.return_value = 5.0
+    assert cache.get("a") == 1
+
+    mock_time.return_value = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_invalidation():
+    """Tests invalidating cache entries."""
+    cache = LRUCache[str, int](maxsize=10)
+    for i, key in enumerate("abcd"):
+        cache.set(key, i)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    cache.invalidate_if(lambda _, value: value % 2 == 1)
+    assert cache.get("b") is None
+    assert cache.get("c") == 2
+    assert cache.get("d") is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats.hits == 0
@@ -0,0 +1,56 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import io
+
+from zenml.utils import profiling_utils
+
+
+def test_profile_phase_is_noop_without_active_profiler():
+    """Tests that phases and counters are ignored if nothing is profiled."""
+    assert profiling_utils.get_active_profiler() is None
+    with profiling_utils.profile_phase("phase"):
+        profiling_utils.count("counter")
+
+
+def test_step_profiler_records_phases_and_counters():
+    """Tests that the active profiler accumulates phases and counters."""
+    profiler = profiling_utils.StepProfiler()
+    with profiler:
+        assert profiling_utils.get_active_profiler() is profiler
+        for _ in range(2):
+            with profiling_utils.profile_phase("phase"):
+                profiling_utils.count("counter", 3)
+
+    assert profiling_utils.get_active_profiler() is None
+    metadata = profiler.get_run_metadata()
+    assert set(metadata["phases"]) == {"phase"}
+    assert metadata["phases"]["phase"] <= metadata["total_seconds"]
+    assert metadata["counters"] == {"counter": 6}
+    assert profiler.get_cprofile_stats() is None
+
+
+def test_step_profiler_counts_file_bytes():
+    """Tests that wrapped files count the bytes read and written."""
+    profiler = profiling_utils.StepProfiler()
+
+    with profiler.wrap_file(io.BytesIO()) as file:
+        file.write(b"abc")
+        file.seek(0)
+        assert file.read() == b"abc"
+
+    assert profiler.counters == {
+        profiling_utils.FILES_OPENED_COUNTER: 1,
+        profiling_utils.BYTES_WRITTEN_COUNTER: 3,
+        profiling_utils.BYTES_READ_COUNTER: 3,
+    }
@@ -350,3 +350,45 @@ def test_package_utility_functions():
         source_utils._get_package_version(package_name="non_existent_package")
         is None
     )
+
+
+def test_source_resolving_and_loading_is_cached(mocker, tmp_path):
+    """Tests that resolved sources and loaded modules are cached."""
+    from pytest import ExitCode
+
+    source_utils.clear_source_cache()
+    get_source_type = mocker.spy(source_utils, "get_source_type")
+
+    source = source_utils.resolve(ExitCode)
+    assert source.type == SourceType.DISTRIBUTION_PACKAGE
+    assert source_utils.resolve(ExitCode) is source
+    assert get_source_type.call_count == 1
+
+    # User sources depend on the source root and are not cached
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+    source_utils.resolve(empty_function)
+    source_utils.resolve(empty_function)
+    assert get_source_type.call_count == 3
+
+    # Loaded modules are reused until they're removed from `sys.modules`
+    mocker.patch.object(
+        source_utils, "get_source_root", return_value=str(tmp_path)
+    )
+    mocker.patch.object(sys, "path", [])
+    (tmp_path / "cached_test_module.py").write_text("test = 1")
+    user_source = Source(
+        module="cached_test_module", attribute="test", type=SourceType.USER
+    )
+    load_module = mocker.spy(source_utils, "_load_module")
+
+    assert source_utils.load(user_source) == 1
+    assert source_utils.load(user_source) == 1
+    assert load_module.call_count == 1
+
+    sys.modules.pop("cached_test_module")
+    assert source_utils.load(user_source) == 1
+    assert load_module.call_count == 2
@@ -0,0 +1,64 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.zen_server.rate_limit import (
+    DAY,
+    MINUTE,
+    InMemoryRateLimitStore,
+    SlidingWindowCounter,
+)
+
+
+def test_sliding_window_counter_weights_previous_window():
+    """Tests that the previous window count decays over the current one."""
+    counter = SlidingWindowCounter(window=MINUTE)
+
+    for _ in range(10):
+        counter.hit(0.0)
+
+    # Halfway through the next window, half of the previous hits count
+    assert counter.hit(90.0) == 1 + 10 * 0.5
+
+    # After two full windows, older hits are forgotten
+    assert counter.hit(300.0) == 1
+
+
+def test_in_memory_store_tracks_minute_and_day_counts():
+    """Tests that the store counts requests per key and resets them."""
+    store = InMemoryRateLimitStore()
+
+    for i in range(5):
+        assert store.hit("key", timestamp=float(i)) == (i + 1, i + 1)
+    assert store.hit("other", timestamp=5.0) == (1, 1)
+
+    minute_count, day_count = store.hit("key", timestamp=DAY - 1.0)
+    assert minute_count == 1
+    assert day_count == 6
+
+    store.reset("key")
+    assert store.hit("key", timestamp=DAY - 1.0) == (1, 1)
+
+
+def test_in_memory_store_memory_is_bounded():
+    """Tests that idle and least recently used keys are evicted."""
+    store = InMemoryRateLimitStore(max_keys=3)
+
+    for i in range(10):
+        store.hit(f"key_{i}", timestamp=float(i))
+    assert len(store._counters) == 3
+    assert "key_9" in store._counters
+
+    store.hit("key_9", timestamp=2 * DAY)
+    store.hit("new", timestamp=2 * DAY + MINUTE)
+    assert list(store._counters) == ["key_9", "new"]